@@ -0,0 +1,218 @@
+"""Benchmarks every election method over a grid of electorate sizes and ballot shapes.
+
+Every election method of `sct.election` taking ranked ballots is timed, so methods added later
+are benchmarked without changing this script. For every method, number of voters, number of
+candidates, weighted or unweighted and complete or truncated ballots, the script records the best
+time of `calculate_results` over a few runs and its peak memory (measured with tracemalloc, which
+sees NumPy allocations), and writes everything to a JSON file to compare releases with. Every run
+counts a fresh copy of the profile, so the times include the tallies (compression, pairwise
+matrix) that a profile caches and shares between elections:
+
+    python dev/benchmark.py --grid quick --output benchmarks.json
+    python dev/benchmark.py --grid full --rules Plurality Borda --output full.json
+    python dev/benchmark.py --compare benchmarks.json --threshold 1.25
+
+With `--compare`, the script exits with status 1 when a cell got slower than `threshold` times
+its baseline.
+"""
+import argparse
+import datetime
+import gc
+import inspect
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import sct
+from sct import election
+from sct.profile import Profile, _rank_dtype
+
+GRIDS = {
+    'quick': {'voters': [100, 10_000, 1_000_000], 'candidates': [3, 10, 50]},
+    'full': {'voters': [100, 10_000, 1_000_000, 100_000_000], 'candidates': [3, 10, 100, 1_000, 5_000]},
+}
+
+# The number of positions ranked by truncated ballots, at most
+TRUNCATED_WIDTH = 10
+
+def election_methods():
+    """Returns every election method of the package taking ranked ballots, by name."""
+    return {name:cls for name, cls in inspect.getmembers(election, inspect.isclass)
+            if issubclass(cls, election.Election) and cls is not election.Election and cls._profile_type is Profile}
+
+def random_ballots(rng, num_voters, num_candidates, width, truncated):
+    """Draws a profile of rankings uniformly at random, truncated to between 1 and `width`
+    candidates if requested, without materializing full permutations when few are ranked."""
+    if 2 * width >= num_candidates:
+        ranks = rng.permuted(np.broadcast_to(np.arange(num_candidates, dtype=_rank_dtype(num_candidates)),
+                                             (num_voters, num_candidates)), axis=1)[:, :width]
+    else:
+        # Draw the ranked candidates one position at a time, redrawing any repeat
+        ranks = np.empty((num_voters, width), dtype=_rank_dtype(num_candidates))
+        for position in range(width):
+            column = rng.integers(num_candidates, size=num_voters)
+            while True:
+                repeated = (ranks[:, :position] == column[:, None]).any(axis=1)
+                if not repeated.any():
+                    break
+                column[repeated] = rng.integers(num_candidates, size=int(repeated.sum()))
+            ranks[:, position] = column
+        ranks = np.ascontiguousarray(ranks)
+
+    if truncated:
+        lengths = rng.integers(1, width + 1, size=num_voters)
+        ranks[np.arange(width) >= lengths[:, None]] = -1
+
+    return ranks
+
+def fresh(profile):
+    """Returns a copy of a profile sharing its arrays but none of its cached tallies."""
+    return Profile._derived(profile.candidates, profile.ranks, profile.exact_weights)
+
+def run_cell(method, candidates, profile, repeat):
+    """Returns the best time of `calculate_results` over `repeat` runs on a fresh election over a
+    fresh copy of the profile, and the peak memory of one more run."""
+    best = float('inf')
+    for _ in range(repeat):
+        instance = method(candidates, fresh(profile))
+        gc.collect()
+        start = time.perf_counter()
+        instance.calculate_results()
+        best = min(best, time.perf_counter() - start)
+
+    instance = method(candidates, fresh(profile))
+    gc.collect()
+    tracemalloc.start()
+    instance.calculate_results()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best, peak
+
+def run(args):
+    rng = np.random.default_rng(args.seed)
+    methods = election_methods()
+    if args.rules:
+        methods = {name:methods[name] for name in args.rules}
+
+    voters = args.voters or GRIDS[args.grid]['voters']
+    candidate_counts = args.candidates or GRIDS[args.grid]['candidates']
+    results, too_slow = [], {name:[] for name in methods}
+
+    for num_candidates in candidate_counts:
+        candidates = sct.Candidates([f'c{i:05d}' for i in range(num_candidates)])
+        for num_voters in voters:
+            for truncated in (False, True):
+                width = min(num_candidates, TRUNCATED_WIDTH) if truncated else num_candidates
+                if num_voters * width > args.max_elements:
+                    continue
+                ranks = random_ballots(rng, num_voters, num_candidates, width, truncated)
+
+                for weighted in (False, True):
+                    weights = rng.integers(1, 11, size=num_voters) if weighted else None
+                    profile = Profile(candidates, ranks, weights)
+
+                    for name, method in methods.items():
+                        # Larger cells than one that already ran out of time are skipped
+                        if any(num_voters >= v and num_candidates >= m for v, m in too_slow[name]):
+                            continue
+
+                        seconds, peak = run_cell(method, candidates, profile, 1 if num_voters * width > 10 ** 7 else args.repeat)
+                        if seconds > args.max_seconds:
+                            too_slow[name].append((num_voters, num_candidates))
+
+                        results.append({'rule': name, 'voters': num_voters, 'candidates': num_candidates,
+                                        'weighted': weighted, 'complete': not truncated, 'seconds': seconds,
+                                        'ballots_per_second': num_voters / seconds if seconds else None,
+                                        'peak_memory_bytes': peak})
+                        print(f'{name:<24} {num_voters:>11,} voters {num_candidates:>6,} candidates '
+                              f'{"weighted  " if weighted else "unweighted"} {"truncated" if truncated else "complete "} '
+                              f'{seconds * 1000:12.2f} ms {peak / 2 ** 20:10.1f} MiB', flush=True)
+
+    version, commit = _version()
+
+    return {
+        'metadata': {
+            'sct_version': version,
+            'commit': commit,
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+            'cpus': os.cpu_count(),
+            'date': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'grid': args.grid,
+            'seed': args.seed,
+        },
+        'results': results,
+    }
+
+def _version():
+    """Returns the version and commit of the package being benchmarked, when they are known."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    version = commit = None
+
+    with open(os.path.join(root, 'pyproject.toml')) as file:
+        for line in file:
+            if line.startswith('version'):
+                version = line.split('=', 1)[1].split('#')[0].strip().strip('"')
+                break
+
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=root, capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        pass
+
+    return version, commit
+
+def compare(report, baseline, threshold):
+    """Prints the cells slower than `threshold` times their baseline and returns how many."""
+    key = lambda cell: (cell['rule'], cell['voters'], cell['candidates'], cell['weighted'], cell['complete'])
+    previous = {key(cell):cell for cell in baseline['results']}
+
+    regressions = 0
+    for cell in report['results']:
+        if key(cell) not in previous:
+            continue
+        ratio = cell['seconds'] / max(previous[key(cell)]['seconds'], 1e-9)
+        if ratio > threshold:
+            regressions += 1
+            print(f'REGRESSION {key(cell)}: {ratio:.2f}x slower')
+
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--grid', choices=sorted(GRIDS), default='quick', help='preset grid of sizes')
+    parser.add_argument('--voters', type=int, nargs='+', help='numbers of voters, overriding the grid')
+    parser.add_argument('--candidates', type=int, nargs='+', help='numbers of candidates, overriding the grid')
+    parser.add_argument('--rules', nargs='+', help='election methods to time (class names), by default all')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per cell, the best one being kept')
+    parser.add_argument('--max-elements', type=float, default=4e8, help='largest voters × positions rank matrix')
+    parser.add_argument('--max-seconds', type=float, default=10.0,
+                        help='skip larger cells of a method once a cell takes longer than this')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the random ballots')
+    parser.add_argument('--output', help='path of the JSON report')
+    parser.add_argument('--compare', help='path of a baseline JSON report to compare with')
+    parser.add_argument('--threshold', type=float, default=1.25, help='slowdown ratio counted as a regression')
+    args = parser.parse_args()
+
+    report = run(args)
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            sys.exit(1 if compare(report, json.load(file), args.threshold) else 0)
+
+if __name__ == '__main__':
+    main()
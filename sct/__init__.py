@@ -6,8 +6,18 @@ Modules
 -------
 agent : Defines the `Agent` class, representing a voter with preferences in an election.
 candidates : Defines the `Candidates` class, a collection of candidates with functionalities to manage them.
-election : Contains classes for different voting methods, such as `Plurality` and `Borda`, 
-           each inheriting from the `Election` base class.
+profile : Defines the `Profile` class, storing every ballot of an election as an integer rank matrix.
+ballots : Defines `ApprovalProfile` and `ScoreProfile`, storing approval and graded ballots as packed arrays.
+kemeny : Exact and heuristic solvers for Kemeny consensus rankings over a pairwise majority matrix.
+readers : Streams ballots from CSV and PrefLib files as chunks of `Profile`.
+archive : Defines `ProfileArchive`, an append-only on-disk profile format read through memory mapping.
+tiebreak : Strategies breaking ties between candidates with equal scores, shared by every election method.
+election : Contains classes for different voting methods, such as `PositionalScoring`, `Plurality`,
+           `Borda`, `Copeland`, `Minimax`, `Schulze`, `RankedPairs`, `Kemeny`, `InstantRunoff`,
+           `SingleTransferableVote`, `Approval`, `Range` and `MajorityJudgment`, each inheriting
+           from the `Election` base class.
+simulation : Generates batches of random elections under classic cultures and runs election methods over them.
+experiments : Estimates Condorcet and rule-agreement probabilities with confidence intervals over simulation grids.
 
 Classes
 -------
@@ -15,20 +25,96 @@ Agent
     Represents a voter with a specified number of votes and a preference list.
 Candidates
     Manages a list of candidates, with methods to add or remove candidates.
+Profile
+    Stores all ballots as a contiguous matrix of candidate indices plus a weight per ballot.
+ApprovalProfile
+    Stores approval ballots as bitsets packed into 64-bit words, one row per ballot.
+ScoreProfile
+    Stores graded ballots as a matrix of small integer grades, one row per ballot.
+ProfileArchive
+    Stores ballots on disk in append-only blocks, mapped into memory when counting.
+TieBreaker
+    The base class for tie-breaking strategies, giving every candidate a sort key.
+LexicographicTieBreaker, PriorRoundTieBreaker, RandomTieBreaker, LotteryTieBreaker
+    Break ties by a fixed order, by earlier rounds of the count, at random, or by a lottery drawn once.
 Election
     The base class for an election with candidates and agents, to be subclassed for specific voting methods.
+PositionalScoring
+    A subclass of `Election` awarding points to candidates by position, given any score vector.
 Plurality
-    A subclass of `Election` implementing a plurality voting system where the candidate with the most votes wins.
+    A subclass of `PositionalScoring` implementing a plurality voting system where the candidate with the most votes wins.
 Borda
-    A subclass of `Election` implementing a Borda count voting system, where points are assigned based on rank.
+    A subclass of `PositionalScoring` implementing a Borda count voting system, where points are assigned based on rank.
+Copeland
+    A subclass of `Election` ranking candidates by the number of pairwise majority comparisons they win.
+Minimax
+    A subclass of `Election` electing the candidate whose worst pairwise defeat is the mildest.
+Schulze
+    A subclass of `Election` ranking candidates by the strongest paths of pairwise victories between them.
+RankedPairs
+    A subclass of `Election` locking in pairwise victories from strongest to weakest unless they create a cycle.
+Kemeny
+    A subclass of `Election` electing the ranking with the fewest pairwise disagreements with the votes.
+InstantRunoff
+    A subclass of `Election` eliminating the weakest candidate round after round until one holds a majority.
+SingleTransferableVote
+    A subclass of `InstantRunoff` filling several seats by transferring surpluses and eliminated votes.
+Approval
+    A subclass of `Election` electing the candidate approved by the most votes.
+Range
+    A subclass of `Election` electing the candidate with the highest total or average grade.
+MajorityJudgment
+    A subclass of `Election` ranking candidates by their median grade, ties broken by the majority gauge.
+Estimate
+    The estimate of a probability from simulated elections, with a Wilson score confidence interval.
 
 Usage
 -----
 The package can be used to set up an election, add agents and candidates, and run different voting methods 
 to see outcomes based on plurality or Borda count rules. It allows for customization of election rules, 
-such as allowing ties or setting different weight increments in the Borda method.
+such as allowing ties or setting different weight increments in the Borda method. Simulation studies
+generate many elections at once with the `simulation` module and compare the winners of several methods.
+
+Submodules are imported on first use, so `import sct`, `Agent` and `Candidates` do not load NumPy.
+Every election method tallies with NumPy, which loads with the first election class accessed.
 """
 
-from .agent import *
-from .candidates import *
-from .election import *
\ No newline at end of file
+import importlib
+
+# Where every public name of the package is defined, imported on first access (PEP 562)
+_exports = {
+    'agent': ['Agent'],
+    'candidates': ['Candidates'],
+    'profile': ['Profile'],
+    'ballots': ['ApprovalProfile', 'ScoreProfile'],
+    'kemeny': ['kemeny_agreement', 'kemeny_distance', 'kemeny_exact', 'kemeny_borda', 'kemeny_kwiksort',
+               'kemeny_local_search'],
+    'readers': ['read_csv', 'read_preflib'],
+    'archive': ['ProfileArchive'],
+    'tiebreak': ['TieBreaker', 'LexicographicTieBreaker', 'PriorRoundTieBreaker', 'RandomTieBreaker',
+                 'LotteryTieBreaker'],
+    'election': ['Election', 'score_vector', 'PositionalScoring', 'Plurality', 'Borda', 'Copeland', 'Minimax',
+                 'Schulze', 'RankedPairs', 'Kemeny', 'InstantRunoff', 'SingleTransferableVote', 'Approval',
+                 'Range', 'MajorityJudgment'],
+    'simulation': ['impartial_culture', 'urn', 'impartial_anonymous_culture', 'mallows', 'plackett_luce',
+                   'spatial', 'simulate'],
+    'experiments': ['Estimate', 'estimate_probabilities'],
+}
+_modules = {name:module for module, names in _exports.items() for name in names}
+
+__all__ = list(_modules)
+
+def __getattr__(name):
+    if name in _modules:
+        value = getattr(importlib.import_module(f'.{_modules[name]}', __name__), name)
+    elif name in _exports:
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    globals()[name] = value # Later accesses skip __getattr__
+
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_exports))
@@ -1,4 +1,5 @@
-import numpy as np
+from array import array
+import sys
 from sct.candidates import Candidates
 
 class Agent:
@@ -13,8 +14,9 @@ class Agent:
     ----------
     name : str, optional
         The name of the agent, which can be used to identify them uniquely. Defaults to None if not specified.
-    num_votes : int, optional
-        The number of votes the agent possesses, with a default of 1.
+    num_votes : int or float, optional
+        The number of votes the agent possesses, with a default of 1. Election methods multiply
+        the agent's contribution by this weight.
     choices : list of str, optional
         A list of preferred candidates in the agent's order of choice, represented as strings.
         Each choice is converted to lowercase to ensure standardization.
@@ -23,20 +25,55 @@ class Agent:
     ----------
     name : str
         The name of the agent.
-    num_votes : int
+    num_votes : int or float
         The number of votes assigned to the agent.
     choices : list of str
-        An ordered list of the agent's preferred candidates, stored in lowercase.
+        An ordered list of the agent's preferred candidates, stored in lowercase. Assigning a new
+        list is the same as calling `set_preferences`.
 
     Methods
     -------
     set_preferences(choices)
         Defines or updates the agent's candidate preferences based on the provided list.
+
+    Notes
+    -----
+    Agents are kept small, as an election may hold millions of them: they have no `__dict__`, and
+    their choices are stored as a compact array of ids into a table of candidate names shared by
+    every agent, each name being stored once however many agents rank it. Reading `choices`
+    builds a new list from the ids, so modifying that list does not change the agent. The table
+    grows with the number of distinct names ever ranked, not with the number of agents, and
+    building a profile only looks up the names its agents rank.
     """
+    __slots__ = ('name', 'num_votes', '_choices')
+
+    # Every candidate name ever ranked, lowercased and interned, and the id of each
+    _names = []
+    _ids = {}
+
     def __init__(self, name=None, num_votes=1, choices=None):
-        self.name = name
+        self.name = sys.intern(name) if isinstance(name, str) else name
         self.num_votes = num_votes
-        self.choices = [choice.lower() for choice in choices]
+        self.set_preferences(choices or [])
+
+    @classmethod
+    def _intern(cls, name):
+        """Returns the id of a lowercased candidate name, adding it to the shared table if needed."""
+        id = cls._ids.get(name)
+        if id is None:
+            id = cls._ids[name] = len(cls._names)
+            cls._names.append(sys.intern(name))
+
+        return id
+
+    @property
+    def choices(self):
+        names = Agent._names
+        return [names[id] for id in self._choices]
+
+    @choices.setter
+    def choices(self, choices):
+        self.set_preferences(choices)
 
     def set_preferences(self, choices: list):
         """ Defines or updates the preference order for the agent based on a list of candidate choices.
@@ -52,8 +89,12 @@ class Agent:
         list of str
             The updated list of candidate preferences in lowercase.
         """
-        self.choices = [choice.lower() for choice in choices]
+        ids = [Agent._intern(choice.lower()) for choice in choices]
+        # Two bytes per choice, unless more than 65,536 distinct names were ever ranked
+        self._choices = array('H' if len(Agent._names) <= 1 << 16 else 'I', ids)
 
         return self.choices
-    
-    # add choice_matrix
+
+    def __reduce__(self):
+        # Ids only mean something in this process: pickle the names instead
+        return Agent, (self.name, self.num_votes, self.choices)
@@ -0,0 +1,289 @@
+import json
+import os
+import numpy as np
+from sct.candidates import Candidates
+from sct.profile import Profile, _rank_dtype
+
+# File layout: the magic number, the length of the JSON header, the header padded to a multiple
+# of 64 bytes, then blocks of ballots. Every block is its magic number and number of ballots,
+# the (ballots × width) rank matrix padded to a multiple of 8 bytes, then the weight column.
+_MAGIC = b'SCTPROF\x01'
+_BLOCK_MAGIC = b'SCTBLK\x00\x00'
+_BLOCK_HEADER = 16
+_WEIGHT_DTYPES = (np.dtype('<i8'), np.dtype('<f8'))
+
+def _padded(size, alignment):
+    """Rounds a number of bytes up to a multiple of `alignment`."""
+    return -(-size // alignment) * alignment
+
+class ProfileArchive:
+    """Represents a profile stored on disk in a binary format read through memory mapping, for
+    electorates too large to hold in memory.
+
+    The archive starts with a header naming the candidates, followed by blocks of ballots, each a
+    fixed-width rank matrix and a weight column stored exactly as a `Profile` holds them in memory.
+    Ballots are only ever appended, one block per call to `append`, so ingest jobs can write to
+    an archive while counting processes read it. Reading maps the file instead of loading it: the
+    profiles yielded by `chunks` are views of the file, read from disk as they are tallied and
+    shared through the page cache by every process reading the archive.
+
+    Parameters
+    ----------
+    path : str or path-like
+        The path of an archive created by `ProfileArchive.create`.
+    candidates : Candidates, optional
+        The candidates of the election counting the archive, which must have the same names as
+        the candidates of the archive. Profiles read from the archive refer to this instance, so
+        they can be tallied by elections over it. Defaults to new candidates built from the header.
+
+    Attributes
+    ----------
+    path : str or path-like
+        The path of the archive.
+    candidates : Candidates
+        The candidates the ballots refer to.
+    width : int
+        The number of positions stored for every ballot.
+    weight_dtype : numpy.dtype
+        The type of the weight column, 64-bit integers or floats.
+
+    Methods
+    -------
+    create(path, candidates, width=None, weight_dtype=numpy.int64)
+        Creates an empty archive.
+    append(ballots)
+        Appends ballots to the archive as a new block.
+    chunks(chunk_size=None)
+        Yields the ballots of the archive as profiles mapped from the file.
+    read()
+        Returns every ballot of the archive as a single profile.
+
+    Examples
+    --------
+    Recounting an archive larger than memory, one mapped chunk at a time:
+
+    >>> archive = ProfileArchive('ballots.sct', candidates)
+    >>> Borda(candidates, []).tally_stream(archive.chunks(chunk_size=1_000_000))
+    """
+    def __init__(self, path, candidates: Candidates = None):
+        with open(path, 'rb') as file:
+            if file.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f'{os.fspath(path)!r} is not a profile archive')
+            length = int(np.frombuffer(file.read(4), dtype='<u4')[0])
+            header = json.loads(file.read(length))
+
+        if candidates is None:
+            candidates = Candidates(header['candidates'])
+        elif candidates.names != header['candidates']:
+            raise ValueError('The candidates must be those of the archive')
+
+        self.path = path
+        self.candidates = candidates
+        self.width = header['width']
+        self.weight_dtype = np.dtype(header['weight_dtype'])
+        self._rank_dtype = np.dtype(header['rank_dtype'])
+        self._data_start = _padded(len(_MAGIC) + 4 + length, 64)
+
+    @classmethod
+    def create(cls, path, candidates: Candidates, width=None, weight_dtype=np.int64):
+        """Creates an empty archive, replacing any file at `path`.
+
+        Parameters
+        ----------
+        path : str or path-like
+            The path of the archive.
+        candidates : Candidates
+            The candidates the ballots refer to.
+        width : int, optional
+            The number of positions stored for every ballot, at least the length of the longest
+            ballot ever appended. Defaults to the number of candidates.
+        weight_dtype : numpy.dtype, optional
+            The type of the weight column, `numpy.int64` (the default) or `numpy.float64` for
+            fractional weights.
+
+        Returns
+        -------
+        ProfileArchive
+            The archive, open for appending and reading.
+
+        Raises
+        ------
+        ValueError
+            If the width or the type of the weights is not supported.
+        """
+        num_candidates = len(candidates.names)
+        width = num_candidates if width is None else width
+        weight_dtype = np.dtype(weight_dtype).newbyteorder('<')
+
+        if not 0 <= width <= num_candidates:
+            raise ValueError('The width must be between 0 and the number of candidates')
+        if weight_dtype not in _WEIGHT_DTYPES:
+            raise ValueError('The weights must be stored as 64-bit integers or floats')
+
+        header = json.dumps({'candidates': candidates.names, 'width': width,
+                             'rank_dtype': _rank_dtype(num_candidates).newbyteorder('<').str,
+                             'weight_dtype': weight_dtype.str}).encode()
+        start = len(_MAGIC) + 4 + len(header)
+
+        with open(path, 'wb') as file:
+            file.write(_MAGIC + np.uint32(len(header)).astype('<u4').tobytes() + header
+                       + bytes(_padded(start, 64) - start))
+
+        return cls(path, candidates)
+
+    def append(self, ballots):
+        """Appends ballots to the archive as a new block.
+
+        The block is written with a single call to the operating system at the end of the file,
+        so that processes reading the archive never see a partial block, and several processes may
+        append to the same archive.
+
+        Parameters
+        ----------
+        ballots : list of Agent or Profile
+            The ballots to append.
+
+        Raises
+        ------
+        ValueError
+            If the ballots refer to other candidates, rank more candidates than the width of the
+            archive, or have fractional weights while the archive stores integer weights.
+        """
+        if isinstance(ballots, Profile):
+            if ballots.candidates.names != self.candidates.names:
+                raise ValueError('The ballots must refer to the candidates of the archive')
+            profile = ballots
+        else:
+            profile = Profile.from_agents(self.candidates, ballots)
+
+        if not len(profile):
+            return
+        if profile.ranks.shape[1] > self.width and (profile.ranks[:, self.width:] >= 0).any():
+            raise ValueError(f'The ballots rank more than the {self.width} candidates stored per ballot')
+        if profile.weights.dtype.kind == 'f' and self.weight_dtype.kind != 'f':
+            raise ValueError('The archive stores integer weights; create it with float64 weights')
+
+        ranks = np.full((len(profile), self.width), -1, dtype=self._rank_dtype)
+        stored = min(self.width, profile.ranks.shape[1])
+        ranks[:, :stored] = profile.ranks[:, :stored]
+        ranks = ranks.tobytes()
+
+        block = b''.join([_BLOCK_MAGIC, np.uint64(len(profile)).astype('<u8').tobytes(), ranks,
+                          bytes(_padded(len(ranks), 8) - len(ranks)),
+                          profile.weights.astype(self.weight_dtype).tobytes()])
+
+        # An unbuffered file opened for appending writes every call at the end of the file
+        with open(self.path, 'ab', buffering=0) as file:
+            view = memoryview(block)
+            while view:
+                view = view[file.write(view):]
+
+    def _map(self):
+        """Maps the whole file as it is now, or returns None while it holds no block."""
+        if os.path.getsize(self.path) <= self._data_start:
+            return None
+
+        return np.memmap(self.path, dtype=np.uint8, mode='r')
+
+    def _block_at(self, data, position):
+        """Reads the block starting at `position` of the mapped file, returning its rank matrix,
+        its weights and the position of the next block, or None if the block is not complete."""
+        if position + _BLOCK_HEADER > len(data):
+            return None
+        if bytes(data[position:position + 8]) != _BLOCK_MAGIC:
+            raise ValueError(f'The archive is corrupted at byte {position}')
+        size = int(data[position + 8:position + 16].view('<u8')[0])
+
+        rank_size = self.width * self._rank_dtype.itemsize
+        ranks_start = position + _BLOCK_HEADER
+        weights_start = ranks_start + _padded(size * rank_size, 8)
+        end = weights_start + size * self.weight_dtype.itemsize
+        if end > len(data):
+            return None # A block still being written
+
+        ranks = data[ranks_start:ranks_start + size * rank_size].view(self._rank_dtype)
+        return ranks.reshape(size, self.width), data[weights_start:end].view(self.weight_dtype), end
+
+    def _blocks(self, follow=False):
+        """Yields the rank matrix and weights of every complete block of the file.
+
+        The file is mapped once. With `follow`, it is mapped again whenever the end of the mapping
+        is reached and the file has grown, so that blocks appended meanwhile are read as well.
+        """
+        data, position = self._map(), self._data_start
+
+        while data is not None:
+            block = self._block_at(data, position)
+            if block is None:
+                grown = self._map() if follow else None
+                if grown is None or len(grown) == len(data):
+                    return
+                data = grown # Views of the previous mapping stay valid
+                continue
+
+            ranks, weights, position = block
+            yield ranks, weights
+
+    def chunks(self, chunk_size=None):
+        """Yields the ballots of the archive as profiles mapped from the file, without copying
+        them into memory.
+
+        Blocks appended while the archive is being read are included if they are complete when
+        reached: the file is mapped again whenever the end of its mapping is reached and the file
+        has grown.
+
+        Parameters
+        ----------
+        chunk_size : int, optional
+            The largest number of ballots per profile. Defaults to one profile per block.
+
+        Yields
+        ------
+        Profile
+            The ballots of the archive, in the order they were appended, over `candidates`.
+
+        Raises
+        ------
+        ValueError
+            If a block refers to candidates that are not in the archive, as a corrupted file or
+            one written by another program may.
+        """
+        num_candidates = len(self.candidates.names)
+
+        for ranks, weights in self._blocks(follow=True):
+            # Tallies index arrays by rank, so every block is bounds-checked once when mapped; the
+            # full checks of the ballots ran when they were appended
+            if ranks.size and (ranks.min() < -1 or ranks.max() >= num_candidates):
+                raise ValueError('The archive is corrupted: a block refers to candidates that are not in the archive')
+
+            step = chunk_size or max(len(ranks), 1)
+            for start in range(0, len(ranks), step):
+                yield Profile._derived(self.candidates, ranks[start:start + step], weights[start:start + step])
+
+    def read(self):
+        """Returns every ballot of the archive as a single profile.
+
+        The profile is mapped from the file when the archive holds a single block, and otherwise
+        copied into memory.
+
+        Returns
+        -------
+        Profile
+            The ballots of the archive.
+        """
+        profiles = list(self.chunks())
+        if len(profiles) == 1:
+            return profiles[0]
+        if not profiles:
+            return Profile(self.candidates, np.empty((0, self.width), dtype=self._rank_dtype),
+                           np.empty(0, dtype=self.weight_dtype))
+
+        return Profile.concatenate(profiles)
+
+    @property
+    def num_ballots(self):
+        """int : The number of ballots stored in the complete blocks of the archive."""
+        return sum(len(ranks) for ranks, _ in self._blocks())
+
+    def __len__(self):
+        return self.num_ballots
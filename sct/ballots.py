@@ -0,0 +1,474 @@
+import numpy as np
+from sct.candidates import Candidates
+from sct.profile import _bincount
+
+def _unit_or_weights(weights, size):
+    """Returns the weights as an array, one vote per ballot when none are given, along with the
+    weights as given when they are fractions (or other exact numbers), or None.
+
+    Unit weights are a read-only broadcast view, taking no memory whatever the number of ballots.
+    As in `Profile`, exact numbers are tallied as floats and kept as given for exact arithmetic.
+    """
+    if weights is None:
+        return np.broadcast_to(np.int64(1), (size,)), None
+
+    weights = np.asarray(weights)
+    if weights.shape != (size,):
+        raise ValueError('Please provide exactly one weight per ballot')
+    if weights.dtype == object:
+        return weights.astype(np.float64), weights
+
+    return weights, None
+
+class ApprovalProfile:
+    """Represents approval ballots, each approving any subset of the candidates, packed as bitsets.
+
+    Ballot `b` approves candidate `c` when bit `c % 64` of word `c // 64` of row `b` is set, so a
+    ballot over up to 64 candidates takes a single 8-byte word. Tallies unpack the bits a chunk of
+    ballots at a time, keeping memory bounded whatever the number of ballots.
+
+    Parameters
+    ----------
+    candidates : Candidates
+        An instance of the `Candidates` class containing the list of candidates.
+    bits : array_like of numpy.uint64
+        A (ballots × words) matrix of packed approvals.
+    weights : array_like, optional
+        The weight (number of votes) of each ballot. Defaults to one vote per ballot.
+
+    Attributes
+    ----------
+    candidates : Candidates
+        The collection of candidates the ballots refer to.
+    bits : numpy.ndarray
+        The (ballots × words) matrix of packed approvals.
+    weights : numpy.ndarray
+        The weight of each ballot. Weights given as fractions (such as `fractions.Fraction` or
+        sympy `Rational`) are held here as floats.
+    exact_weights : numpy.ndarray
+        The weight of each ballot as given, for exact arithmetic.
+
+    Methods
+    -------
+    from_matrix(candidates, approvals, weights=None)
+        Packs a boolean (ballots × candidates) approval matrix.
+    from_sets(candidates, approvals, weights=None)
+        Packs ballots given as collections of approved candidate names.
+    from_agents(candidates, agents)
+        Packs agents, each approving the candidates listed in their choices.
+    remap(mapping)
+        Translates the approvals after candidates were added or removed.
+    approval_counts()
+        Counts the candidates approved by each ballot.
+    approval_scores(normalize=False)
+        Counts the votes approving each candidate.
+    """
+    def __init__(self, candidates: Candidates, bits, weights=None):
+        bits = np.ascontiguousarray(bits, dtype=np.uint64)
+        words = (len(candidates.names) + 63) // 64
+
+        if bits.ndim != 2 or bits.shape[1] != words:
+            raise ValueError(f'The approval bitsets must have {words} word(s) per ballot')
+
+        self.candidates = candidates
+        self.bits = bits
+        self.weights, self._exact_weights = _unit_or_weights(weights, len(bits))
+        self._version = candidates.version
+
+    @classmethod
+    def from_matrix(cls, candidates: Candidates, approvals, weights=None):
+        """Packs a boolean approval matrix into bitsets.
+
+        Parameters
+        ----------
+        candidates : Candidates
+            An instance of the `Candidates` class containing the list of candidates.
+        approvals : array_like of bool
+            A (ballots × candidates) matrix, True where the ballot approves the candidate.
+        weights : array_like, optional
+            The weight of each ballot. Defaults to one vote per ballot.
+
+        Returns
+        -------
+        ApprovalProfile
+            The packed ballots.
+        """
+        approvals = np.asarray(approvals, dtype=bool).reshape(-1, len(candidates.names))
+        words = (len(candidates.names) + 63) // 64
+
+        packed = np.zeros((len(approvals), words * 8), dtype=np.uint8)
+        packed[:, :(approvals.shape[1] + 7) // 8] = np.packbits(approvals, axis=1, bitorder='little')
+
+        return cls(candidates, packed.view('<u8'), weights)
+
+    @classmethod
+    def from_sets(cls, candidates: Candidates, approvals: list, weights=None):
+        """Packs ballots given as collections of approved candidate names.
+
+        Parameters
+        ----------
+        candidates : Candidates
+            An instance of the `Candidates` class containing the list of candidates.
+        approvals : list of collections of str
+            The names of the candidates approved by each ballot.
+        weights : array_like, optional
+            The weight of each ballot. Defaults to one vote per ballot.
+
+        Returns
+        -------
+        ApprovalProfile
+            The packed ballots.
+
+        Raises
+        ------
+        ValueError
+            If a ballot approves a candidate that is not in the election.
+        """
+        matrix = np.zeros((len(approvals), len(candidates.names)), dtype=bool)
+
+        for ballot, names in enumerate(approvals):
+            matrix[ballot, candidates.indices(names)] = True
+
+        return cls.from_matrix(candidates, matrix, weights)
+
+    @classmethod
+    def from_agents(cls, candidates: Candidates, agents: list):
+        """Packs agents as approval ballots, each agent approving the candidates in its choices.
+
+        Parameters
+        ----------
+        candidates : Candidates
+            An instance of the `Candidates` class containing the list of candidates.
+        agents : list of Agent
+            A list of `Agent` instances representing the voters in the election.
+
+        Returns
+        -------
+        ApprovalProfile
+            The packed ballots, weighted by the agents' `num_votes`.
+        """
+        weights = np.array([agent.num_votes for agent in agents]) if agents else None
+
+        return cls.from_sets(candidates, [agent.choices for agent in agents], weights)
+
+    @classmethod
+    def concatenate(cls, profiles: list):
+        """Stacks several approval profiles over the same candidates into one."""
+        return cls(profiles[0].candidates, np.concatenate([profile.bits for profile in profiles]),
+                   np.concatenate([profile.exact_weights for profile in profiles]))
+
+    @property
+    def num_ballots(self):
+        """int : The number of ballots in the profile."""
+        return len(self.bits)
+
+    @property
+    def exact_weights(self):
+        """numpy.ndarray : The weight of each ballot as given, fractions included."""
+        return self.weights if self._exact_weights is None else self._exact_weights
+
+    def __len__(self):
+        return self.num_ballots
+
+    def __getitem__(self, ballots):
+        """Returns the profile holding only the selected ballots (a slice, mask or index array)."""
+        return ApprovalProfile(self.candidates, self.bits[ballots], self.exact_weights[ballots])
+
+    def reweight(self, weights):
+        """Returns a profile with the same ballots and new weights."""
+        return ApprovalProfile(self.candidates, self.bits, weights)
+
+    def remap(self, mapping, candidates=None):
+        """Translates the approvals to new candidate indices, after a candidate was added to or
+        removed from the candidates of the profile.
+
+        Parameters
+        ----------
+        mapping : array_like of int
+            The new index of every candidate, indexed by its old index, with -1 for removed
+            candidates, as returned by `Candidates.add_candidate` or `Candidates.remove_candidate`.
+        candidates : Candidates, optional
+            The candidates after the change, by default the candidates of the profile, changed in
+            place.
+
+        Returns
+        -------
+        ApprovalProfile
+            The profile with the same ballots and weights over the new candidate indices.
+        """
+        candidates = self.candidates if candidates is None else candidates
+        mapping = np.asarray(mapping, dtype=np.int64)
+        kept = np.flatnonzero(mapping >= 0)
+
+        packed = np.ascontiguousarray(self.bits).astype('<u8', copy=False).view(np.uint8)
+        approvals = np.unpackbits(packed, axis=1, bitorder='little', count=len(mapping)).view(bool)
+        matrix = np.zeros((self.num_ballots, len(candidates.names)), dtype=bool)
+        matrix[:, mapping[kept]] = approvals[:, kept]
+
+        profile = ApprovalProfile.from_matrix(candidates, matrix, self.exact_weights)
+        profile._version = self._version + 1
+
+        return profile
+
+    def compress(self):
+        """Collapses identical ballots into unique bitsets weighted by their total weight.
+
+        Returns
+        -------
+        ApprovalProfile
+            A profile with one row per distinct ballot, giving the same tallies.
+        """
+        if self.bits.shape[1] == 1:
+            unique, inverse = np.unique(self.bits[:, 0], return_inverse=True)
+            unique = unique[:, None]
+        else:
+            unique, inverse = np.unique(self.bits, axis=0, return_inverse=True)
+
+        totals = _bincount(inverse.ravel(), None if (self.weights == 1).all() else self.weights, len(unique))
+        keep = totals != 0
+
+        return ApprovalProfile(self.candidates, unique[keep], totals[keep])
+
+    def approvals(self, start=0, stop=None):
+        """Unpacks the approvals of a range of ballots into a boolean matrix.
+
+        Parameters
+        ----------
+        start, stop : int, optional
+            The range of ballots to unpack, by default every ballot.
+
+        Returns
+        -------
+        numpy.ndarray
+            A (ballots × candidates) boolean matrix.
+        """
+        packed = np.ascontiguousarray(self.bits[start:stop]).astype('<u8', copy=False).view(np.uint8)
+        unpacked = np.unpackbits(packed, axis=1, bitorder='little', count=len(self.candidates.names))
+
+        return unpacked.view(bool)
+
+    def approval_counts(self):
+        """Counts the candidates approved by each ballot (the popcount of its bitset).
+
+        Returns
+        -------
+        numpy.ndarray
+            The number of candidates approved by each ballot.
+        """
+        if hasattr(np, 'bitwise_count'):
+            return np.bitwise_count(self.bits).sum(axis=1, dtype=np.int64)
+
+        return self.approvals().sum(axis=1, dtype=np.int64)
+
+    def approval_scores(self, normalize=False, chunk_size=1 << 16):
+        """Counts the votes approving each candidate, in one pass over the packed ballots.
+
+        Parameters
+        ----------
+        normalize : bool, optional
+            Whether each ballot splits its weight equally between the candidates it approves
+            (satisfaction approval voting), by default False.
+        chunk_size : int, optional
+            The number of ballots unpacked at once.
+
+        Returns
+        -------
+        numpy.ndarray
+            The approval score of each candidate, indexed like `Candidates.names`.
+        """
+        weights = self.weights
+        if normalize:
+            counts = self.approval_counts()
+            weights = np.divide(weights, counts, out=np.zeros(len(weights)), where=counts > 0)
+
+        dtype = np.int64 if weights.dtype.kind in 'iub' else np.float64
+        scores = np.zeros(len(self.candidates.names), dtype=dtype)
+
+        for start in range(0, self.num_ballots, chunk_size):
+            scores += weights[start:start + chunk_size] @ self.approvals(start, start + chunk_size).astype(dtype)
+
+        return scores
+
+class ScoreProfile:
+    """Represents range (score) ballots, each giving every candidate a grade from 0 to `max_score`,
+    stored as a (ballots × candidates) matrix of small integers.
+
+    Parameters
+    ----------
+    candidates : Candidates
+        An instance of the `Candidates` class containing the list of candidates.
+    scores : array_like of int
+        A (ballots × candidates) matrix of grades between 0 and `max_score`.
+    weights : array_like, optional
+        The weight (number of votes) of each ballot. Defaults to one vote per ballot.
+    max_score : int, optional
+        The highest grade. Defaults to the highest grade given.
+
+    Attributes
+    ----------
+    candidates : Candidates
+        The collection of candidates the ballots refer to.
+    scores : numpy.ndarray
+        The (ballots × candidates) matrix of grades, in the smallest unsigned integer type.
+    weights : numpy.ndarray
+        The weight of each ballot. Weights given as fractions (such as `fractions.Fraction` or
+        sympy `Rational`) are held here as floats.
+    exact_weights : numpy.ndarray
+        The weight of each ballot as given, for exact arithmetic.
+    max_score : int
+        The highest grade.
+
+    Methods
+    -------
+    remap(mapping)
+        Translates the grades after candidates were added or removed.
+    score_sums()
+        Sums the weighted grades of each candidate.
+    grade_counts(num_grades=None)
+        Counts the votes giving each grade to each candidate.
+    """
+    def __init__(self, candidates: Candidates, scores, weights=None, max_score=None):
+        scores = np.asarray(scores)
+        if scores.ndim != 2 or scores.shape[1] != len(candidates.names):
+            raise ValueError('Please provide one grade per candidate on every ballot')
+        if scores.size and scores.min() < 0:
+            raise ValueError('Grades cannot be negative')
+
+        if max_score is None:
+            max_score = int(scores.max()) if scores.size else 0
+        elif scores.size and scores.max() > max_score:
+            raise ValueError(f'Grades cannot exceed max_score ({max_score})')
+
+        self.candidates = candidates
+        self.max_score = max_score
+        self.scores = np.ascontiguousarray(scores, dtype=np.min_scalar_type(max_score))
+        self.weights, self._exact_weights = _unit_or_weights(weights, len(scores))
+        self._version = candidates.version
+
+    @classmethod
+    def from_agents(cls, candidates: Candidates, agents: list):
+        """Builds an empty profile; agents only express rankings, not grades.
+
+        Raises
+        ------
+        TypeError
+            If any agent is given.
+        """
+        if agents:
+            raise TypeError('Agents only hold rankings; give range ballots as a ScoreProfile')
+
+        return cls(candidates, np.zeros((0, len(candidates.names)), dtype=np.uint8))
+
+    @classmethod
+    def concatenate(cls, profiles: list):
+        """Stacks several score profiles over the same candidates into one."""
+        return cls(profiles[0].candidates, np.concatenate([profile.scores for profile in profiles]),
+                   np.concatenate([profile.exact_weights for profile in profiles]),
+                   max(profile.max_score for profile in profiles))
+
+    @property
+    def num_ballots(self):
+        """int : The number of ballots in the profile."""
+        return len(self.scores)
+
+    @property
+    def exact_weights(self):
+        """numpy.ndarray : The weight of each ballot as given, fractions included."""
+        return self.weights if self._exact_weights is None else self._exact_weights
+
+    def __len__(self):
+        return self.num_ballots
+
+    def __getitem__(self, ballots):
+        """Returns the profile holding only the selected ballots (a slice, mask or index array)."""
+        return ScoreProfile(self.candidates, self.scores[ballots], self.exact_weights[ballots], self.max_score)
+
+    def reweight(self, weights):
+        """Returns a profile with the same ballots and new weights."""
+        return ScoreProfile(self.candidates, self.scores, weights, self.max_score)
+
+    def remap(self, mapping, candidates=None):
+        """Translates the grades to new candidate indices, after a candidate was added to or
+        removed from the candidates of the profile. Added candidates are graded 0.
+
+        Parameters
+        ----------
+        mapping : array_like of int
+            The new index of every candidate, indexed by its old index, with -1 for removed
+            candidates, as returned by `Candidates.add_candidate` or `Candidates.remove_candidate`.
+        candidates : Candidates, optional
+            The candidates after the change, by default the candidates of the profile, changed in
+            place.
+
+        Returns
+        -------
+        ScoreProfile
+            The profile with the same ballots and weights over the new candidate indices.
+        """
+        candidates = self.candidates if candidates is None else candidates
+        mapping = np.asarray(mapping, dtype=np.int64)
+        kept = np.flatnonzero(mapping >= 0)
+
+        scores = np.zeros((self.num_ballots, len(candidates.names)), dtype=self.scores.dtype)
+        scores[:, mapping[kept]] = self.scores[:, kept]
+
+        profile = ScoreProfile(candidates, scores, self.exact_weights, self.max_score)
+        profile._version = self._version + 1
+
+        return profile
+
+    def compress(self):
+        """Collapses identical ballots into unique rows weighted by their total weight.
+
+        Returns
+        -------
+        ScoreProfile
+            A profile with one row per distinct ballot, giving the same tallies.
+        """
+        unique, inverse = np.unique(self.scores, axis=0, return_inverse=True)
+        totals = _bincount(inverse.ravel(), None if (self.weights == 1).all() else self.weights, len(unique))
+        keep = totals != 0
+
+        return ScoreProfile(self.candidates, unique[keep], totals[keep], self.max_score)
+
+    def score_sums(self, chunk_size=1 << 16):
+        """Sums the grades given to each candidate, multiplied by the weight of each ballot.
+
+        Returns
+        -------
+        numpy.ndarray
+            The total grade of each candidate, indexed like `Candidates.names`.
+        """
+        dtype = np.int64 if self.weights.dtype.kind in 'iub' else np.float64
+        sums = np.zeros(len(self.candidates.names), dtype=dtype)
+
+        for start in range(0, self.num_ballots, chunk_size):
+            sums += self.weights[start:start + chunk_size] @ self.scores[start:start + chunk_size].astype(dtype)
+
+        return sums
+
+    def grade_counts(self, num_grades=None):
+        """Counts the votes giving each grade to each candidate, with one bincount over the matrix.
+
+        Parameters
+        ----------
+        num_grades : int, optional
+            The number of grades to count, by default `max_score + 1`. Tallies of profiles with
+            different `max_score` add up when they count the same number of grades.
+
+        Returns
+        -------
+        numpy.ndarray
+            A (candidates × grades) matrix where entry `[c, g]` is the number of votes giving
+            grade `g` to candidate `c`.
+        """
+        num_candidates = len(self.candidates.names)
+        grades = self.max_score + 1 if num_grades is None else num_grades
+        if grades <= self.max_score:
+            raise ValueError(f'The ballots use grades up to {self.max_score}')
+
+        keys = np.arange(num_candidates) * grades + self.scores
+        weights = None if (self.weights == 1).all() else np.repeat(self.weights, num_candidates)
+        counts = _bincount(keys.ravel(), weights, num_candidates * grades)
+
+        return counts.reshape(num_candidates, grades)
@@ -1,56 +1,159 @@
+from bisect import bisect_left
+
 class Candidates:
-    """Represents a collection of candidates in a voting system, allowing for management of 
+    """Represents a collection of candidates in a voting system, allowing for management of
     candidate names including adding, removing, and organizing candidates.
 
+    Every candidate is identified by its index in `names`, the integer stored in rank matrices.
+    Names are resolved to indices once, through a hashed name→index map, when ballots are read;
+    tallies only ever handle indices.
+
     Parameters
     ----------
     names : list of str
-        A list of candidate names to initialize the collection. Names are standardized to lowercase 
+        A list of candidate names to initialize the collection. Names are standardized to lowercase
         and sorted alphabetically.
 
     Attributes
     ----------
     names : list of str
         An alphabetically sorted list of candidate names in lowercase for consistent reference.
+    index : dict
+        Maps every name in `names` to its index.
+    version : int
+        The number of times candidates were added or removed. Ballots converted to indices under
+        an older version must be remapped before use.
 
     Methods
     -------
     add_candidate(name)
-        Adds a new candidate to the collection, ensuring that the name is unique, standardized 
+        Adds a new candidate to the collection, ensuring that the name is unique, standardized
         to lowercase, and the list remains sorted.
     remove_candidate(name)
         Removes a candidate from the collection by name, if the name exists.
+    indices(names)
+        Converts candidate names to their indices.
+    copy()
+        Returns an independent copy of the collection.
     """
     def __init__(self, names: list):
-        # TODO: do error handling ofr iif candidates are not strings
-        self.names = [name.lower() for name in sorted(names)]
+        if not all(isinstance(name, str) for name in names):
+            raise TypeError('Candidate names must be strings')
+
+        self.names = sorted(name.lower() for name in names)
+        if len(set(self.names)) != len(self.names):
+            raise ValueError('Candidate names must be unique (ignoring case)')
+
+        self.index = {name:i for i, name in enumerate(self.names)}
+        self.version = 0
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return isinstance(name, str) and name.lower() in self.index
+
+    def indices(self, names):
+        """Converts candidate names to their indices.
+
+        Parameters
+        ----------
+        names : iterable of str
+            The names to convert, in any case.
+
+        Returns
+        -------
+        list of int
+            The index of every name.
+
+        Raises
+        ------
+        ValueError
+            If a name is not a candidate.
+        """
+        try:
+            return [self.index[name.lower()] for name in names]
+        except KeyError as error:
+            raise ValueError(f'{error.args[0]!r} is not a candidate in this election') from None
+
+    def copy(self):
+        """Returns an independent copy of the collection, with the same names, indices and version.
+
+        Returns
+        -------
+        Candidates
+            A collection that can be changed without affecting this one.
+        """
+        candidates = Candidates.__new__(Candidates)
+        candidates.names = list(self.names)
+        candidates.index = dict(self.index)
+        candidates.version = self.version
+
+        return candidates
+
+    def _reindex(self, mapping):
+        """Rebuilds the name→index map and records the change of indices."""
+        self.index = {name:i for i, name in enumerate(self.names)}
+        self.version += 1
+
+        return mapping
 
     def add_candidate(self, name):
         """Adds a new candidate to the collection.
 
+        The name is inserted at its sorted position, so the candidates after it move up by one.
+
         Parameters
         ----------
         name : str
             The name of the candidate to add.
 
+        Returns
+        -------
+        list of int
+            The new index of every previous candidate, indexed by its old index, to remap existing
+            rank matrices with (see `Profile.remap`).
+
         Raises
         ------
         ValueError
             If the candidate already exists in the collection.
         """
-        pass
+        name = name.lower()
+        if name in self.index:
+            raise ValueError(f'{name!r} is already a candidate')
+
+        position = bisect_left(self.names, name)
+        self.names.insert(position, name)
+
+        return self._reindex([i + (i >= position) for i in range(len(self.names) - 1)])
 
     def remove_candidate(self, name):
         """Removes a candidate from the collection.
 
+        The candidates after it move down by one.
+
         Parameters
         ----------
         name : str
             The name of the candidate to remove.
 
+        Returns
+        -------
+        list of int
+            The new index of every previous candidate, indexed by its old index, with -1 for the
+            removed candidate, to remap existing rank matrices with (see `Profile.remap`).
+
         Raises
         ------
         ValueError
             If the candidate is not in the collection.
         """
-        pass
\ No newline at end of file
+        name = name.lower()
+        if name not in self.index:
+            raise ValueError(f'{name!r} is not a candidate')
+
+        position = self.index[name]
+        del self.names[position]
+
+        return self._reindex([-1 if i == position else i - (i > position) for i in range(len(self.names) + 1)])
@@ -1,178 +1,2330 @@
+import copy
+from fractions import Fraction
+import math
+import time
+from functools import reduce
+from itertools import repeat
+import operator
+import numpy as np
 from sct.agent import Agent
+from sct.ballots import ApprovalProfile, ScoreProfile
 from sct.candidates import Candidates
+from sct.kemeny import (MAX_EXACT_CANDIDATES, kemeny_borda, kemeny_distance, kemeny_exact, kemeny_kwiksort,
+                        kemeny_local_search)
+from sct.tiebreak import LexicographicTieBreaker, TieBreaker
+from sct.profile import (Profile, _as_fraction, _batch_length_counts, _batch_pairwise, _batch_position_counts,
+                         _exact_numbers, _exact_tally)
+
+def _tally_shard(tally, shard):
+    """Compresses and tallies one shard of ballots in a worker process."""
+    return tally(shard.compress())
 
 class Election:
     """Base class for conducting an election among candidates with a list of agents (voters).
 
-    The `Election` class provides a framework for different voting systems, using a list of 
-    agents and a set of candidates. Specific voting methods inherit from this class to implement 
-    their unique calculation and display methods.
+    The `Election` class provides a framework for different voting systems, using a list of 
+    agents and a set of candidates. Specific voting methods inherit from this class to implement 
+    their unique calculation and display methods.
+
+    Parameters
+    ----------
+    candidates : Candidates
+        An instance of the `Candidates` class containing the list of candidates.
+    agents : list of Agent or Profile
+        A list of `Agent` instances representing the voters in the election, or a `Profile`
+        holding every ballot as a rank matrix.
+    workers : int, optional
+        The number of processes tallying the ballots in parallel, by default 1.
+    num_winners : int, optional
+        The number of candidates `winners` returns, by default 1.
+    allow_ties : bool, optional
+        Whether `winners` also returns the candidates tied with the last winner, by default True.
+    tiebreak : TieBreaker or list of str, optional
+        How candidates with equal scores are ordered, by default in the order of `Candidates.names`.
+
+    Attributes
+    ----------
+    candidates : Candidates
+        The collection of candidates participating in the election.
+    agents : list of Agent or Profile
+        The agents (voters) participating in the election.
+    workers : int
+        The number of processes tallying the ballots in parallel.
+    profile : Profile
+        The ballots of the election as a rank matrix, built from `agents` when needed.
+    compressed_profile : Profile
+        The profile with identical ballots collapsed into weighted unique rankings.
+    pairwise : numpy.ndarray
+        The pairwise majority matrix of the election, computed once and shared by every
+        Condorcet method.
+    arithmetic : {'float', 'fixed', 'exact'}
+        How the weights of the ballots (the agents' `num_votes`) are added up, by default 'float':
+
+        - 'float': in 64-bit floats, with array operations over every ballot. When weights are
+          fractional and the last winning place is tied with the next one or won by a margin
+          within rounding error, `winners` certifies the winners with exact arithmetic.
+        - 'fixed': weights are rounded to `decimals` decimal places and tallied as integers, as
+          election rules counting fractional votes to a fixed number of decimals require.
+        - 'exact': weights are tallied exactly, whatever they are: integers, floats (the decimal
+          they print as, so 0.1 counts as 1/10), `fractions.Fraction` or sympy `Rational`.
+
+        With 'fixed' and 'exact', tallies still run as integer array operations over the ballots,
+        and only the totals are computed with fractions: scores are fractions, or integers when
+        they are whole. Set it on an election after construction.
+    decimals : int
+        The number of decimal places of 'fixed' arithmetic, by default 6.
+    num_winners : int
+        The number of candidates `winners` returns, the highest scores first, by default 1.
+    allow_ties : bool
+        Whether `winners` also returns the candidates tied with the last winner, by default True.
+        When False, ties are broken by `tiebreak`.
+    tiebreak : TieBreaker or list of str
+        How candidates with equal scores are ordered in the results and chosen between by
+        `winners`: a strategy from `sct.tiebreak`, or the candidates in order of priority.
+        Defaults to the order of `Candidates.names`.
+
+    Methods
+    -------
+    calculate_results()
+        Calculates and returns every candidate with their score, to be implemented by subclasses.
+    winners()
+        Returns only the candidates with the highest score.
+    condorcet_winner()
+        Returns the candidate beating every other candidate in pairwise comparisons, if any.
+    condorcet_loser()
+        Returns the candidate beaten by every other candidate in pairwise comparisons, if any.
+    tally_stream(chunks)
+        Tallies ballots streamed in chunks, without keeping them in memory.
+    add_ballots(ballots)
+        Adds ballots to the election, updating the maintained tallies incrementally.
+    remove_ballots(ballots)
+        Removes ballots from the election, updating the maintained tallies incrementally.
+    add_candidate(name)
+        Adds a candidate to the election, remapping the ballots already cast.
+    remove_candidate(name)
+        Removes a candidate from the election and from every ballot.
+    invalidate()
+        Clears every cached tally and result.
+    """
+    # The type of profile holding the ballots of the election method
+    _profile_type = Profile
+    # Whether the tally of a union of ballots is the sum of their tallies
+    _additive = True
+    # The smallest number of ballots worth sending to a worker process
+    _min_shard_size = 1 << 16
+    # Whether `_tally_batch` tallies a batch of simulated elections at once
+    _batched = False
+    # How ballot weights are added up, and the decimal places of fixed-point arithmetic
+    arithmetic = 'float'
+    decimals = 6
+    _arithmetics = ('float', 'fixed', 'exact')
+    # How many candidates win, and how ties between them are handled
+    num_winners = 1
+    allow_ties = True
+    tiebreak = None
+
+    def __init__(self, candidates: Candidates, agents, workers=1, num_winners=1, allow_ties=True, tiebreak=None):
+        self.candidates = candidates
+        self.agents = agents
+        self.workers = workers
+        self.num_winners = num_winners
+        self.allow_ties = allow_ties
+        self.tiebreak = tiebreak
+
+    def __setattr__(self, name, value):
+        # Any change to the ballots, the candidates or a rule parameter invalidates the cached tally
+        if not name.startswith('_'):
+            self.__dict__['_cache'] = {}
+        # Ballots added or removed since construction belong to the previous agents
+        if name in ('agents', 'candidates'):
+            self.__dict__['_batches'] = []
+        super().__setattr__(name, value)
+
+    def invalidate(self):
+        """Clears every cached tally and result.
+
+        Reassigning `agents`, `candidates` or a rule parameter invalidates the cache automatically,
+        as does appending or removing agents. Call this method after modifying agents in place.
+        """
+        self._cache = {}
+
+    def _cached(self, key, compute):
+        """Returns the cached value stored under `key`, computing and storing it first if needed.
+
+        Parameters
+        ----------
+        key : str
+            The name of the cached value.
+        compute : callable
+            A function without arguments computing the value.
+
+        Returns
+        -------
+        object
+            The cached value.
+        """
+        cache = self._valid_cache()
+
+        if key not in cache:
+            cache[key] = compute()
+
+        return cache[key]
+
+    def _valid_cache(self):
+        """Returns the cache, emptied first if the list of agents grew or shrank in place or the
+        candidates changed."""
+        token = (len(self.agents), self.candidates.version)
+        if self._cache.get('_token') != token:
+            self._cache = {'_token': token}
+
+        return self._cache
+
+    @property
+    def profile(self):
+        """Profile : The ballots of the election as a rank matrix.
+
+        When the election was given a list of agents, the profile is built once and reused.
+        """
+        def compute():
+            profile = self._as_profile(self.agents)
+            if self._batches:
+                profile = self._profile_type.concatenate([profile] + self._batches)
+            return profile
+
+        if isinstance(self.agents, self._profile_type) and not self._batches:
+            return self._as_profile(self.agents)
+
+        return self._cached('profile', compute)
+
+    @property
+    def compressed_profile(self):
+        """Profile : The ballots of the election with identical rankings collapsed together.
+
+        Election methods tally over this profile, whose size is bounded by the number of distinct
+        rankings rather than the number of voters.
+        """
+        return self._cached('compressed_profile', lambda: self.profile.compress())
+
+    @property
+    def pairwise(self):
+        """numpy.ndarray : The pairwise majority matrix, where entry `[i, j]` is the number of votes
+        ranking candidate `i` above candidate `j`.
+
+        The matrix is computed once, in a single pass over the compressed profile, and reused by
+        every method relying on pairwise comparisons. It is cached on the profile of the election,
+        so elections given the same `Profile` (Copeland, Minimax, Schulze...) share it.
+        """
+        def compute():
+            key = ('pairwise', self.arithmetic, self.decimals)
+            return self.profile._shared(key, lambda: self._total(Profile.pairwise_matrix))
+
+        return self._cached('pairwise', compute)
+
+    @property
+    def margins(self):
+        """numpy.ndarray : The pairwise margin matrix, where entry `[i, j]` is the number of votes
+        preferring `i` to `j` minus the number of votes preferring `j` to `i`."""
+        return self.pairwise - self.pairwise.T
+
+    def _as_profile(self, ballots):
+        """Converts ballots given as a list of agents or a profile into a profile over the
+        candidates of the election.
+
+        Parameters
+        ----------
+        ballots : list of Agent or Profile
+            The ballots to convert.
+
+        Returns
+        -------
+        Profile
+            The ballots as a profile.
+
+        Raises
+        ------
+        ValueError
+            If a profile refers to different candidates than the election, or to an older
+            version of its candidates.
+        """
+        if isinstance(ballots, self._profile_type):
+            if ballots.candidates.names != self.candidates.names:
+                raise ValueError('The ballots must refer to the candidates of the election')
+            if ballots._version != self.candidates.version:
+                raise ValueError('The ballots predate a change of candidates; remap them first')
+            return ballots
+
+        return self._profile_type.from_agents(self.candidates, ballots)
+
+    def add_candidate(self, name):
+        """Adds a candidate to the election.
+
+        Rank matrices already built are translated to the new candidate indices, without reading
+        the ballots again. When the election was given a list of agents, its ballots are kept as
+        a profile from then on. The election changes a copy of its `candidates`, so other elections
+        given the same candidates are not affected.
+
+        Parameters
+        ----------
+        name : str
+            The name of the candidate to add.
+
+        Raises
+        ------
+        ValueError
+            If the candidate already exists in the election.
+        """
+        self._change_candidates(Candidates.add_candidate, name)
+
+    def remove_candidate(self, name):
+        """Removes a candidate from the election and from every ballot, the candidates ranked
+        below it moving up one position.
+
+        When the election was given a list of agents, its ballots are kept as a profile from then
+        on, so agents still ranking the removed candidate remain valid. The election changes a copy
+        of its `candidates`, so other elections given the same candidates are not affected.
+
+        Parameters
+        ----------
+        name : str
+            The name of the candidate to remove.
+
+        Raises
+        ------
+        ValueError
+            If the candidate is not in the election.
+        """
+        self._change_candidates(Candidates.remove_candidate, name)
+
+    def _change_candidates(self, change, name):
+        """Applies a change to a copy of the candidates and remaps the ballots of the election to it,
+        leaving the candidates and ballots it may share with other elections untouched."""
+        profile, candidates = self.profile, self.candidates.copy()
+        mapping = change(candidates, name)
+
+        # Bypass __setattr__, so as to assign the ballots and empty the batches they include at once
+        self.__dict__.update(candidates=candidates, agents=profile.remap(mapping, candidates), _batches=[], _cache={})
+
+    def add_ballots(self, ballots):
+        """Adds ballots to the election.
+
+        Every tally already computed (the scores of the method and the pairwise matrix) is updated
+        with the tally of the new ballots alone, in time proportional to the size of the batch
+        rather than the size of the electorate. The results are identical to a full recount.
+
+        Parameters
+        ----------
+        ballots : list of Agent or Profile
+            The ballots to add.
+        """
+        self._update(self._as_profile(ballots))
+
+    def remove_ballots(self, ballots):
+        """Removes ballots from the election.
+
+        The ballots are cancelled out by adding them with negated weights, so the maintained
+        tallies are updated in time proportional to the size of the batch. The ballots are
+        expected to have been cast in the election.
+
+        Parameters
+        ----------
+        ballots : list of Agent or Profile
+            The ballots to remove.
+        """
+        batch = self._as_profile(ballots)
+        self._update(batch.reweight(-getattr(batch, 'exact_weights', batch.weights)))
+
+    def tally_stream(self, chunks):
+        """Tallies ballots streamed as an iterable of profiles, such as the chunks yielded by
+        `read_csv` or `read_preflib`, and returns the results they produce.
+
+        Each chunk is compressed and tallied on its own and only the running tally is kept, so
+        memory stays bounded by the size of a chunk whatever the number of ballots. The ballots of
+        the election itself are not used nor modified.
+
+        Parameters
+        ----------
+        chunks : iterable of Profile
+            The ballots to tally, one profile at a time.
+
+        Returns
+        -------
+        dict
+            A sorted dictionary containing the candidates and their respective score.
+
+        Raises
+        ------
+        ValueError
+            If the election method cannot be tallied chunk by chunk.
+        """
+        if not self._additive:
+            raise ValueError(f'{type(self).__name__} cannot be tallied chunk by chunk')
+
+        state = None
+        for chunk in chunks:
+            tally = self._count(self._as_profile(chunk), self._tally)
+            state = tally if state is None else state + tally
+
+        if state is None:
+            state = self._tally(self._as_profile([]))
+
+        return self._results_dict(self._finalize(state))
+
+    def _update(self, batch):
+        """Records a batch of ballots and folds its tally into the maintained tallies.
+
+        Parameters
+        ----------
+        batch : Profile
+            The ballots to record, with negative weights for removed ballots.
+        """
+        cache = self._valid_cache()
+        if self.arithmetic == 'float':
+            batch = batch.compress() # Compressing adds fractional weights up as floats
+
+        if 'state' in cache:
+            if self._additive:
+                cache['state'] = cache['state'] + self._count(batch, self._tally)
+            else:
+                del cache['state']
+        tallies = {'pairwise': Profile.pairwise_matrix, 'position_counts': Profile.position_counts,
+                   'length_counts': Profile.length_counts}
+        for key, tally in tallies.items():
+            if key in cache:
+                cache[key] = cache[key] + self._count(batch, tally)
+
+        # Everything else derived from the ballots is recomputed on demand
+        for key in list(cache):
+            if key not in ('_token', 'state', *tallies):
+                del cache[key]
+
+        self._batches.append(batch)
+
+        # Keep the number of pending batches bounded for long-running counts
+        if len(self._batches) >= 64:
+            batches = self._profile_type.concatenate(self._batches)
+            self._batches = [batches.compress() if self.arithmetic == 'float' else batches]
+
+    def _tally(self, profile):
+        """Tallies a profile into the state from which the election method derives its scores.
+
+        Parameters
+        ----------
+        profile : Profile
+            The ballots to tally.
+
+        Returns
+        -------
+        numpy.ndarray
+            The tally of the ballots, to be implemented by subclasses.
+        """
+        raise NotImplementedError
+
+    def _finalize(self, state):
+        """Derives the score of every candidate from a tally.
+
+        Parameters
+        ----------
+        state : numpy.ndarray
+            The tally returned by `_tally`.
+
+        Returns
+        -------
+        numpy.ndarray
+            The score of each candidate, indexed like `Candidates.names`.
+        """
+        return state
+
+    def _state(self):
+        """Returns the cached tally of the whole election."""
+        def compute():
+            if self._additive:
+                return self._total(self._detached()._tally)
+            return self._tally(self.compressed_profile if self.arithmetic == 'float' else self.profile)
+
+        return self._cached('state', compute)
+
+    def _count(self, profile, tally):
+        """Tallies a profile with the arithmetic of the election.
+
+        Parameters
+        ----------
+        profile : Profile
+            The ballots to tally.
+        tally : callable
+            A tally that is a weighted sum over the ballots of a profile.
+
+        Returns
+        -------
+        numpy.ndarray
+            The tally, as an object array of exact numbers with 'fixed' or 'exact' arithmetic.
+
+        Raises
+        ------
+        ValueError
+            If the arithmetic is unknown.
+        """
+        if self.arithmetic == 'float':
+            return tally(profile.compress())
+        if self.arithmetic not in self._arithmetics:
+            raise ValueError("arithmetic must be one of 'float', 'fixed' or 'exact'")
+
+        return _exact_tally(profile, tally, self.arithmetic, self.decimals)
+
+    def _total(self, tally):
+        """Tallies the profile of the election with its arithmetic, in parallel with 'float'
+        arithmetic."""
+        if self.arithmetic == 'float':
+            return self._sharded(tally)
+
+        return self._count(self.profile, tally)
+
+    def _detached(self):
+        """Returns a copy of the election without its ballots nor its cache, cheap to send to
+        worker processes."""
+        election = copy.copy(self)
+        election.__dict__.update(agents=[], _cache={}, _batches=[])
+
+        return election
+
+    def _sharded(self, tally):
+        """Tallies the profile of the election, split into shards tallied in parallel by a pool of
+        `workers` processes when the profile is large enough.
+
+        Shard tallies are merged by summing them, which is valid for every tally that is a sum
+        over ballots (scores, position counts, pairwise matrices).
+
+        Parameters
+        ----------
+        tally : callable
+            A picklable function tallying a compressed profile.
+
+        Returns
+        -------
+        numpy.ndarray
+            The tally of the whole profile.
+        """
+        profile = self.profile
+        num_shards = min(self.workers, len(profile) // self._min_shard_size)
+
+        if num_shards < 2:
+            return tally(self.compressed_profile)
+
+        bounds = np.linspace(0, len(profile), num_shards + 1).astype(np.int64)
+        shards = [profile[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+
+        # Imported here: process pools are slow to import and most elections never need one
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=num_shards) as pool:
+            tallies = list(pool.map(_tally_shard, repeat(tally), shards))
+
+        return reduce(operator.add, tallies)
+
+    def _tally_batch(self, ranks):
+        """Tallies a batch of elections at once, for election methods that set `_batched`.
+
+        Parameters
+        ----------
+        ranks : numpy.ndarray
+            An (elections × ballots × positions) tensor of candidate indices, padded with `-1`.
+
+        Returns
+        -------
+        numpy.ndarray
+            The tallies of the elections, stacked along the first axis.
+        """
+        raise NotImplementedError
+
+    def _finalize_batch(self, states):
+        """Derives the scores of every election of a batch from their stacked tallies.
+
+        Parameters
+        ----------
+        states : numpy.ndarray
+            The tallies returned by `_tally_batch`.
+
+        Returns
+        -------
+        numpy.ndarray
+            An (elections × candidates) matrix of scores.
+        """
+        return self._finalize(states)
+
+    def _batch_winners(self, ranks):
+        """Finds the winners of a batch of elections over the candidates of this election, with
+        the parameters of this election.
+
+        Election methods setting `_batched` tally the whole batch with array operations; the
+        others are run one election at a time.
+
+        Parameters
+        ----------
+        ranks : numpy.ndarray
+            An (elections × ballots × positions) tensor of candidate indices, padded with `-1`.
+
+        Returns
+        -------
+        numpy.ndarray
+            An (elections × candidates) boolean matrix, True for the winners of each election.
+
+        Raises
+        ------
+        ValueError
+            If the election method does not take ranked ballots.
+        """
+        if self._profile_type is not Profile:
+            raise ValueError(f'{type(self).__name__} does not take ranked ballots')
+
+        if self._batched:
+            return self._elected(self._finalize_batch(self._tally_batch(ranks)))
+
+        winners = np.zeros((len(ranks), len(self.candidates.names)), dtype=bool)
+        election = self._detached()
+        for i, ballots in enumerate(ranks):
+            election.agents = Profile(self.candidates, ballots)
+            winners[i, self.candidates.indices(election.winners())] = True
+
+        return winners
+
+    def _scores(self):
+        """Returns the cached score of every candidate, indexed like `Candidates.names`."""
+        return self._cached('scores', lambda: _exact_numbers(self._finalize(self._state())))
+
+    def calculate_results(self):
+        """Calculates the results of the election.
+
+        The results are cached, so repeated calls do not tally the ballots again.
+
+        Returns
+        -------
+        dict
+            A sorted dictionary containing the candidates and their respective score.
+        """
+        return dict(self._cached('results', lambda: self._results_dict(self._scores())))
+
+    def winners(self):
+        """Returns only the winners of the election.
+
+        Returns
+        -------
+        dict
+            A sorted dictionary containing the winners and their respective score.
+        """
+        def compute():
+            results = self.calculate_results()
+            scores = results
+
+            # Let exact arithmetic decide a last seat that floating-point rounding may have decided
+            if self._near_tie(results):
+                election = copy.copy(self)
+                election.__dict__.update(arithmetic='exact', _cache={})
+                scores = election.calculate_results()
+
+            names = list(scores)
+            num_winners = min(self.num_winners, len(names))
+            elected = names[:num_winners]
+            if self.allow_ties and num_winners:
+                elected = [name for name in names if scores[name] >= scores[names[num_winners - 1]]]
+
+            return {name:results[name] for name in elected}
+
+        return dict(self._cached('winners', compute))
+
+    def _tiebreaker(self):
+        """Returns the tie-breaker of the election."""
+        if isinstance(self.tiebreak, TieBreaker):
+            return self.tiebreak
+
+        return LexicographicTieBreaker(self.tiebreak)
+
+    def _ranking(self, scores, history=None):
+        """Orders candidates from the highest to the lowest score, ties broken by the tie-breaker.
+
+        Parameters
+        ----------
+        scores : numpy.ndarray
+            The score of each candidate, or an (elections × candidates) matrix of scores.
+        history : list of numpy.ndarray, optional
+            The scores of the earlier rounds of the count, oldest first.
+
+        Returns
+        -------
+        numpy.ndarray
+            The candidate indices in order, along the last axis.
+        """
+        if scores.dtype == object:
+            # Exact numbers are replaced by their rank, which lexsort can handle
+            scores = np.unique(scores, return_inverse=True)[1].reshape(scores.shape)
+
+        keys = self._tiebreaker().keys(self.candidates, scores.shape[:-1], history)
+
+        return np.lexsort((keys, -scores), axis=-1)
+
+    def _elected(self, scores):
+        """Selects the winners of every election of a batch from their scores, following
+        `num_winners`, `allow_ties` and `tiebreak`."""
+        if self.tiebreak is None and self.allow_ties and self.num_winners == 1:
+            return scores == scores.max(axis=-1, keepdims=True)
+
+        order = self._ranking(scores)
+        num_winners = max(1, min(self.num_winners, scores.shape[-1]))
+        elected = np.zeros(scores.shape, dtype=bool)
+        np.put_along_axis(elected, order[..., :num_winners], True, axis=-1)
+        if self.allow_ties:
+            elected |= scores >= np.take_along_axis(scores, order[..., num_winners - 1:num_winners], axis=-1)
+
+        return elected
+
+    def _near_tie(self, results):
+        """Returns whether the last winning place of float results (place `num_winners`) is tied
+        with the next one or won by a margin within rounding error while the ballots have
+        fractional weights."""
+        scores = sorted(results.values(), reverse=True)
+        seats = max(1, self.num_winners)
+        if self.arithmetic != 'float' or not self._additive or len(scores) <= seats:
+            return False
+        last, first_loser = scores[seats - 1], scores[seats]
+        if last - first_loser > 1e-9 * max(1.0, abs(last)):
+            return False
+
+        weights = getattr(self.profile, 'exact_weights', self.profile.weights)
+        return weights.dtype == object or (weights.dtype.kind == 'f' and bool((weights != np.rint(weights)).any()))
+
+    def condorcet_winner(self):
+        """Returns the Condorcet winner: the candidate preferred to every other candidate by a
+        majority of votes.
+
+        Returns
+        -------
+        str or None
+            The name of the Condorcet winner, or None if there is none.
+        """
+        beats = self.margins > 0
+        candidate = np.flatnonzero(beats.sum(axis=1) == len(self.candidates.names) - 1)
+
+        return self.candidates.names[candidate[0]] if len(candidate) else None
+
+    def condorcet_loser(self):
+        """Returns the Condorcet loser: the candidate to whom every other candidate is preferred by
+        a majority of votes.
+
+        Returns
+        -------
+        str or None
+            The name of the Condorcet loser, or None if there is none.
+        """
+        beaten = self.margins < 0
+        candidate = np.flatnonzero(beaten.sum(axis=1) == len(self.candidates.names) - 1)
+
+        return self.candidates.names[candidate[0]] if len(candidate) else None
+
+    def _results_dict(self, scores):
+        """Converts a score vector indexed like `Candidates.names` into a dictionary of
+        candidates sorted by decreasing score.
+
+        Parameters
+        ----------
+        scores : numpy.ndarray
+            The score of each candidate.
+
+        Returns
+        -------
+        dict
+            A sorted dictionary containing the candidates and their respective score.
+        """
+        names, values = self.candidates.names, scores.tolist()
+
+        return {names[c]:values[c] for c in self._ranking(scores).tolist()}
+
+def score_vector(rule, num_candidates, k=None):
+    """Builds the score vector of a positional scoring rule.
+
+    Parameters
+    ----------
+    rule : str or array_like
+        The name of the rule ('plurality', 'borda', 'dowdall', 'veto' or 'k-approval'), or the
+        points awarded to each position, from first to last.
+    num_candidates : int
+        The number of candidates in the election.
+    k : int, optional
+        The number of approved positions, required by 'k-approval'.
+
+    Returns
+    -------
+    numpy.ndarray
+        The points awarded to each of the `num_candidates` positions.
+
+    Raises
+    ------
+    ValueError
+        If the rule is unknown or the score vector is longer than the number of candidates.
+    """
+    if not isinstance(rule, str):
+        vector = np.asarray(rule)
+        if vector.ndim != 1 or len(vector) > num_candidates:
+            raise ValueError('A score vector needs at most one score per candidate')
+        return np.concatenate([vector, np.zeros(num_candidates - len(vector), dtype=vector.dtype)])
+
+    positions = np.arange(num_candidates)
+
+    if rule == 'plurality':
+        return (positions == 0).astype(np.int64)
+    if rule == 'borda':
+        return num_candidates - 1 - positions
+    if rule == 'dowdall':
+        return 1 / (positions + 1)
+    if rule == 'veto':
+        return (positions < num_candidates - 1).astype(np.int64)
+    if rule == 'k-approval':
+        if k is None:
+            raise ValueError("The 'k-approval' rule requires k")
+        return (positions < k).astype(np.int64)
+
+    raise ValueError(f'Unknown positional scoring rule {rule!r}')
+
+class PositionalScoring(Election):
+    """Represents a positional scoring rule, where every ballot awards a fixed number of points to
+    the candidate it ranks at each position.
+
+    The tally is the matrix counting the votes ranking each candidate at each position, computed
+    in one pass over the ballots. The score of every candidate is then a single matrix-vector
+    product with the score vector, so any number of score vectors can be evaluated on the same
+    ballots for the price of one tally (see `evaluate`).
+
+    How a truncated ballot, ranking only some of the candidates, scores is set by `truncation`:
+
+    - 'pessimistic': ranked candidates get the points of their position and unranked candidates
+      get nothing, as if they all shared the last positions and the points of those positions
+      were forfeited.
+    - 'averaged': ranked candidates get the points of their position and unranked candidates
+      share the points of the remaining positions equally.
+
+    Both conventions agree on complete ballots. Ballots ranking no candidate are ignored.
+
+    Parameters
+    ----------
+    candidates : Candidates
+        An instance of the `Candidates` class containing the list of candidates.
+    agents : list of Agent or Profile
+        A list of `Agent` instances representing the voters in the election, or a `Profile`.
+    scores : str or array_like, optional
+        The name of the rule ('plurality', 'borda', 'dowdall', 'veto' or 'k-approval'), or the
+        points awarded to each position from first to last, by default 'borda'.
+    k : int, optional
+        The number of approved positions, required by 'k-approval'.
+    truncation : {'pessimistic', 'averaged'}, optional
+        How truncated ballots score the candidates they leave unranked, by default 'pessimistic'.
+    workers : int, optional
+        The number of processes tallying the ballots in parallel, by default 1.
+    num_winners, allow_ties, tiebreak : optional
+        How `winners` selects the winners and breaks ties, as described in `Election`.
+
+    Attributes
+    ----------
+    scores : str or array_like
+        The name of the rule or its score vector.
+    k : int or None
+        The number of approved positions of 'k-approval'.
+    truncation : str
+        How truncated ballots score the candidates they leave unranked.
+    score_vector : numpy.ndarray
+        The points awarded to each position.
+
+    Methods
+    -------
+    calculate_results()
+        Calculates and returns every candidate with their score.
+    winners()
+        Returns only the candidates with the highest score.
+    evaluate(rules)
+        Calculates the results of several score vectors over the same tally.
+    """
+    # The conventions for scoring truncated ballots supported by the rule
+    _truncations = ('pessimistic', 'averaged')
+
+    def __init__(self, candidates, agents, scores='borda', k=None, truncation='pessimistic', workers=1, num_winners=1,
+                 allow_ties=True, tiebreak=None):
+        super().__init__(candidates, agents, workers, num_winners=num_winners, allow_ties=allow_ties, tiebreak=tiebreak)
+        if truncation not in self._truncations:
+            raise ValueError(f'truncation must be one of {", ".join(map(repr, self._truncations))}')
+        self.scores = scores
+        self.k = k
+        self.truncation = truncation
+
+    @property
+    def score_vector(self):
+        """numpy.ndarray : The points awarded to each position, from first to last."""
+        return score_vector(self.scores, len(self.candidates.names), self.k)
+
+    @property
+    def _batched(self):
+        # The points 'averaged' shares out are only computed for a single election
+        return self.truncation != 'averaged'
+
+    def _tally_batch(self, ranks):
+        num_candidates = len(self.candidates.names)
+        counts = _batch_position_counts(ranks, num_candidates)
+        if self.truncation == 'pessimistic':
+            return counts
+
+        return np.concatenate([counts, _batch_length_counts(ranks, num_candidates)], axis=-1)
+
+    def _counted_positions(self):
+        """Returns the positions whose vote counts the scores depend on."""
+        # Only the positions earning points need counting
+        return np.flatnonzero(self.score_vector)
+
+    def _tally(self, profile):
+        counts = profile.position_counts(self._counted_positions())
+        if self.truncation == 'pessimistic':
+            return counts
+
+        # Conventions depending on the length of the ballots also count votes by ballot length
+        return np.concatenate([counts, profile.length_counts()], axis=1)
+
+    def _finalize(self, state):
+        num_candidates = len(self.candidates.names)
+        scores = state[..., :num_candidates] @ self.score_vector
+
+        if self.truncation == 'averaged':
+            scores = scores + self._unranked_points(state[:, num_candidates:], self.score_vector[:, None])[:, 0]
+
+        return scores
+
+    def _unranked_points(self, lengths, vectors):
+        """Computes the points candidates receive from the ballots leaving them unranked, when
+        they share the points of the positions these ballots leave empty.
+
+        Parameters
+        ----------
+        lengths : numpy.ndarray
+            The vote counts by candidate and ballot length, as returned by `Profile.length_counts`.
+        vectors : numpy.ndarray
+            A (positions × rules) matrix of score vectors.
+
+        Returns
+        -------
+        numpy.ndarray
+            A (candidates × rules) matrix of points.
+        """
+        num_candidates = len(vectors)
+        if lengths.dtype == object:
+            # Exact tallies are divided into fractions rather than floats
+            divide = np.frompyfunc(lambda a, b: _as_fraction(a) / b if b else 0, 2, 1)
+        else:
+            divide = lambda a, b: np.divide(a, b, out=np.zeros(np.broadcast(a, b).shape), where=b != 0)
+
+        # A ballot ranking k candidates is counted once by each of them
+        ballots = divide(lengths.sum(axis=0), np.arange(num_candidates + 1))
+
+        # The average points of the positions after the first k, for every ballot length k
+        remaining = np.zeros((num_candidates + 1, vectors.shape[1]), dtype=ballots.dtype)
+        remaining[:num_candidates] = divide(np.cumsum(vectors[::-1], axis=0)[::-1], np.arange(num_candidates, 0, -1)[:, None])
+
+        return (ballots - lengths) @ remaining
+
+    def calculate_results(self):
+        """Calculates the results of the positional scoring election.
+
+        Returns
+        -------
+        dict
+            A sorted dictionary containing the candidates and their respective score.
+        """
+        return super().calculate_results()
+
+    def evaluate(self, rules):
+        """Calculates the results of several positional scoring rules over the ballots of the
+        election, counting the votes at each position only once.
+
+        Parameters
+        ----------
+        rules : dict
+            The rules to evaluate, mapping a label to a rule name or score vector as accepted by
+            the `scores` parameter. 'k-approval' rules are given as ('k-approval', k).
+
+        Returns
+        -------
+        dict
+            A dictionary mapping every label to the sorted results of its rule.
+
+        Raises
+        ------
+        ValueError
+            If the election has truncated ballots and scores them with a convention specific to
+            its rule.
+        """
+        num_candidates = len(self.candidates.names)
+        if self.truncation not in PositionalScoring._truncations:
+            # Every convention agrees on complete ballots
+            profile = self.profile
+            if len(profile) and (not profile._complete or profile.ranks.shape[1] < num_candidates):
+                raise ValueError(f'The {self.truncation!r} convention only applies to {type(self).__name__}')
+
+        counts = self._cached('position_counts', lambda: self._total(Profile.position_counts))
+
+        vectors = []
+        for rule in rules.values():
+            if isinstance(rule, tuple):
+                vectors.append(score_vector(rule[0], num_candidates, rule[1]))
+            else:
+                vectors.append(score_vector(rule, num_candidates))
+
+        # One matrix product scores every rule at once
+        if counts.dtype == object:
+            vectors = [vector.astype(object) for vector in vectors] # Keep integer points exact
+        vectors = np.stack(vectors, axis=1)
+        scores = counts @ vectors
+        if self.truncation == 'averaged':
+            lengths = self._cached('length_counts', lambda: self._total(Profile.length_counts))
+            scores = scores + self._unranked_points(lengths, vectors)
+        scores = _exact_numbers(scores)
+
+        return {label:self._results_dict(scores[:, i]) for i, label in enumerate(rules)}
+
+class Plurality(PositionalScoring):
+    """Represents a plurality (or first-past-the-post) voting system where the candidate with the most votes wins.
+
+    Each agent's top candidate preference receives the agent's `num_votes`. The candidate with the 
+    highest vote count is declared the winner.
+    
+    Parameters
+    ----------
+    candidates : Candidates
+        An instance of the `Candidates` class containing the list of candidates.
+    agents : list of Agent or Profile
+        A list of `Agent` instances representing the voters in the election, or a `Profile`.
+    allow_ties : bool, optional
+        A flag indicating whether ties are permitted, by default True. When False, ties for the
+        last winning place are broken by `tiebreak`.
+    num_winners : int, optional
+        The number of candidates with the most votes who win, by default 1.
+    workers : int, optional
+        The number of processes tallying the ballots in parallel, by default 1.
+
+    Attributes
+    ----------
+    allow_ties : bool
+        Indicates whether ties are allowed in the voting results.
+    num_winners : int
+        The number of candidates with the most votes who win.
+
+    Methods
+    -------
+    calculate_results()
+        Calculates and returns the winning candidate(s) and their vote count.
+    show_full_results()
+        Displays a summary of the full voting results, including each candidate's vote count.
+    """
+    def __init__(self, candidates, agents, allow_ties=True, num_winners=1, workers=1, tiebreak=None):
+        super().__init__(candidates, agents, 'plurality', workers=workers, num_winners=num_winners,
+                         allow_ties=allow_ties, tiebreak=tiebreak)
+
+    def calculate_results(self):
+        """Calculates the results of the plurality election.
+
+        Each agent's top candidate preference receives the agent's `num_votes`. The candidate with the
+        highest vote count is declared the winner. Candidates with equal vote counts are ordered
+        by `tiebreak`.
+
+        Returns
+        -------
+        dict
+            A sorted dictionary containing the candidates and their respective vote count.
+        """
+        return super().calculate_results()
+    
+    def winners(self):
+        """Returns only the winners of the plurality method: the `num_winners` candidates with the
+        most votes, along with every candidate tied with the last of them if `allow_ties` is True.
+
+        Returns
+        -------
+        dict
+            A sorted dictionary containing the winners and their respective vote count.
+        """
+        return super().winners()
+
+class Borda(PositionalScoring):
+    """Represents a Borda count voting system where candidates are ranked and points are awarded 
+    based on their rank order.
+
+    In the Borda count, agents assign rankings to candidates, and each rank is assigned a point
+    value, with higher ranks earning more points. The candidate with the highest cumulative 
+    score wins the election.
+
+    Parameters
+    ----------
+    candidates : Candidates
+        An instance of the `Candidates` class containing the list of candidates.
+    agents : list of Agent or Profile
+        A list of `Agent` instances representing the voters in the election, or a `Profile`.
+    weight_increment : int, optional
+        The increment by which points are awarded based on rank order, by default 1.
+    truncation : {'ballot_length', 'pessimistic', 'averaged', 'modified'}, optional
+        How ballots ranking only `k` of the candidates are scored, by default 'ballot_length':
+
+        - 'ballot_length': the first choice gets `k - 1` points, the last ranked candidate and
+          unranked candidates nothing, as if the ballot were complete among its ranked candidates.
+        - 'pessimistic': the first choice gets `candidates - 1` points as on a complete ballot and
+          unranked candidates get nothing.
+        - 'averaged': as 'pessimistic', with unranked candidates sharing the points of the
+          positions left empty.
+        - 'modified': the first choice gets `k` points, the last ranked candidate 1 and unranked
+          candidates nothing (Emerson's modified Borda count).
+
+        All four agree on complete ballots.
+    workers : int, optional
+        The number of processes tallying the ballots in parallel, by default 1.
+    num_winners, allow_ties, tiebreak : optional
+        How `winners` selects the winners and breaks ties, as described in `Election`.
+
+    Attributes
+    ----------
+    weight_increment : int
+        The point increment for each rank position in the Borda count.
+    truncation : str
+        How truncated ballots are scored.
+
+    Methods
+    -------
+    calculate_results()
+        Calculates and returns the winning candidate(s) and their total score.
+    show_full_results()
+        Displays a summary of the full voting results, including each candidate's score.
+    """
+    _truncations = PositionalScoring._truncations + ('modified', 'ballot_length')
+
+    def __init__(self, candidates, agents, weight_increment=1, truncation='ballot_length', workers=1, num_winners=1,
+                 allow_ties=True, tiebreak=None):
+        super().__init__(candidates, agents, 'borda', truncation=truncation, workers=workers, num_winners=num_winners,
+                         allow_ties=allow_ties, tiebreak=tiebreak)
+        self.weight_increment = weight_increment
+
+    @property
+    def score_vector(self):
+        """numpy.ndarray : The points awarded to each position, from first to last."""
+        return self.weight_increment * score_vector('borda', len(self.candidates.names))
+
+    def _counted_positions(self):
+        if self.truncation in ('modified', 'ballot_length'):
+            return None # The last position earns points on shorter ballots
+
+        return super()._counted_positions()
+
+    def _finalize(self, state):
+        if self.truncation not in ('modified', 'ballot_length'):
+            return super()._finalize(state)
+
+        # On a ballot ranking k candidates, position p is worth k - p points ('modified') or
+        # k - 1 - p points ('ballot_length'), summed over ballots from the counts by length.
+        # Written over the last two axes, to finalize a batch of elections as well
+        num_candidates = len(self.candidates.names)
+        counts, lengths = state[..., :num_candidates], state[..., num_candidates:]
+        points = lengths @ np.arange(num_candidates + 1) - counts @ np.arange(num_candidates)
+        if self.truncation == 'ballot_length':
+            points = points - lengths.sum(axis=-1)
+
+        return self.weight_increment * points
+
+    def calculate_results(self):
+        """Calculates the results of the Borda count election.
+
+        Each agent ranks candidates, and points are awarded incrementally based on rank position,
+        multiplied by the agent's `num_votes`. The candidate with the highest total score is declared the winner.
+        Ballots ranking only some of the candidates are scored following `truncation`.
+
+        Returns
+        -------
+        dict
+            A sorted dictionary containing the candidates and their respective vote count.
+        """
+        return super().calculate_results()
+
+    def winners(self):
+        """Returns only the winners of the Borda method.
+
+        Returns
+        -------
+        dict
+            A sorted dictionary containing the winners and their respective vote count.
+        """
+        return super().winners()
+
+class Copeland(Election):
+    """Represents the Copeland method, where candidates are ranked by the number of pairwise
+    comparisons they win.
+
+    Every candidate earns one point per opponent it beats in a head-to-head majority comparison,
+    and `tie_score` points per opponent it ties with. The Condorcet winner, when there is one,
+    always wins.
+
+    Parameters
+    ----------
+    candidates : Candidates
+        An instance of the `Candidates` class containing the list of candidates.
+    agents : list of Agent or Profile
+        A list of `Agent` instances representing the voters in the election, or a `Profile`.
+    tie_score : float, optional
+        The points awarded for a pairwise tie, by default 0.5.
+    workers : int, optional
+        The number of processes tallying the ballots in parallel, by default 1.
+    num_winners, allow_ties, tiebreak : optional
+        How `winners` selects the winners and breaks ties, as described in `Election`.
+
+    Attributes
+    ----------
+    tie_score : float
+        The points awarded for a pairwise tie.
+
+    Methods
+    -------
+    calculate_results()
+        Calculates and returns every candidate with their Copeland score.
+    winners()
+        Returns only the candidates with the highest Copeland score.
+    """
+    def __init__(self, candidates, agents, tie_score=0.5, workers=1, num_winners=1, allow_ties=True, tiebreak=None):
+        super().__init__(candidates, agents, workers, num_winners=num_winners, allow_ties=allow_ties, tiebreak=tiebreak)
+        self.tie_score = tie_score
+
+    def _tally(self, profile):
+        return profile.pairwise_matrix()
+
+    def _state(self):
+        return self.pairwise
+
+    _batched = True
+
+    def _tally_batch(self, ranks):
+        return _batch_pairwise(ranks, len(self.candidates.names))
+
+    def _finalize(self, pairwise):
+        # Written over the last two axes, to finalize a batch of pairwise matrices as well
+        margins = pairwise - pairwise.swapaxes(-1, -2)
+        ties = (margins == 0).sum(axis=-1) - 1 # A candidate always ties with itself
+
+        return (margins > 0).sum(axis=-1) + self.tie_score * ties
+
+    def calculate_results(self):
+        """Calculates the results of the Copeland election from the pairwise majority matrix.
+
+        Returns
+        -------
+        dict
+            A sorted dictionary containing the candidates and their respective Copeland score.
+        """
+        return super().calculate_results()
+
+class Minimax(Election):
+    """Represents the Minimax (Simpson–Kramer) method, where the winner is the candidate whose
+    worst pairwise defeat is the mildest.
+
+    Parameters
+    ----------
+    candidates : Candidates
+        An instance of the `Candidates` class containing the list of candidates.
+    agents : list of Agent or Profile
+        A list of `Agent` instances representing the voters in the election, or a `Profile`.
+    variant : {'margins', 'winning_votes', 'opposition'}, optional
+        How the strength of a pairwise defeat is measured, by default 'margins'.
+    workers : int, optional
+        The number of processes tallying the ballots in parallel, by default 1.
+    num_winners, allow_ties, tiebreak : optional
+        How `winners` selects the winners and breaks ties, as described in `Election`.
+
+    Attributes
+    ----------
+    variant : str
+        How the strength of a pairwise defeat is measured.
+
+    Methods
+    -------
+    calculate_results()
+        Calculates and returns every candidate with their Minimax score.
+    winners()
+        Returns only the candidates with the highest Minimax score.
+    """
+    def __init__(self, candidates, agents, variant='margins', workers=1, num_winners=1, allow_ties=True, tiebreak=None):
+        super().__init__(candidates, agents, workers, num_winners=num_winners, allow_ties=allow_ties, tiebreak=tiebreak)
+        if variant not in ('margins', 'winning_votes', 'opposition'):
+            raise ValueError("variant must be one of 'margins', 'winning_votes' or 'opposition'")
+        self.variant = variant
+
+    def _tally(self, profile):
+        return profile.pairwise_matrix()
+
+    def _state(self):
+        return self.pairwise
+
+    _batched = True
+
+    def _tally_batch(self, ranks):
+        return _batch_pairwise(ranks, len(self.candidates.names))
+
+    def _finalize(self, pairwise):
+        # Written over the last two axes, to finalize a batch of pairwise matrices as well
+        against = pairwise.swapaxes(-1, -2) # against[i, j]: votes preferring j to i
+
+        if self.variant == 'margins':
+            defeats = against - pairwise
+        elif self.variant == 'winning_votes':
+            defeats = np.where(against > pairwise, against, 0)
+        else:
+            defeats = against.copy()
+
+        diagonal = np.arange(defeats.shape[-1])
+        defeats[..., diagonal, diagonal] = 0
+
+        return -defeats.max(axis=-1)
+
+    def calculate_results(self):
+        """Calculates the results of the Minimax election from the pairwise majority matrix.
+
+        The score of a candidate is minus the strength of its worst pairwise defeat, so that the
+        candidate with the highest score wins.
+
+        Returns
+        -------
+        dict
+            A sorted dictionary containing the candidates and their respective Minimax score.
+        """
+        return super().calculate_results()
+
+
+class Schulze(Election):
+    """Represents the Schulze method, which ranks candidates by the strength of the strongest paths
+    of pairwise victories between them.
+
+    The strength of a path is its weakest pairwise victory, and candidate `i` ranks above candidate
+    `j` when the strongest path from `i` to `j` is stronger than the strongest path from `j` to `i`.
+    Strongest paths are computed from the shared pairwise majority matrix with a widest-path variant
+    of the Floyd–Warshall algorithm, vectorized over whole rows and columns for each intermediate
+    candidate. The Condorcet winner, when there is one, always wins.
+
+    Parameters
+    ----------
+    candidates : Candidates
+        An instance of the `Candidates` class containing the list of candidates.
+    agents : list of Agent or Profile
+        A list of `Agent` instances representing the voters in the election, or a `Profile`.
+    variant : {'winning_votes', 'margins'}, optional
+        How the strength of a pairwise victory is measured, by default 'winning_votes'.
+    workers : int, optional
+        The number of processes tallying the ballots in parallel, by default 1.
+    num_winners, allow_ties, tiebreak : optional
+        How `winners` selects the winners and breaks ties, as described in `Election`.
+
+    Attributes
+    ----------
+    variant : str
+        How the strength of a pairwise victory is measured.
+
+    Methods
+    -------
+    calculate_results()
+        Calculates and returns every candidate with the number of candidates they rank above.
+    winners()
+        Returns only the candidates ranked above every other candidate.
+    strongest_paths()
+        Returns the strength of the strongest path between every pair of candidates.
+    """
+    def __init__(self, candidates, agents, variant='winning_votes', workers=1, num_winners=1, allow_ties=True,
+                 tiebreak=None):
+        super().__init__(candidates, agents, workers, num_winners=num_winners, allow_ties=allow_ties, tiebreak=tiebreak)
+        if variant not in ('winning_votes', 'margins'):
+            raise ValueError("variant must be 'winning_votes' or 'margins'")
+        self.variant = variant
+
+    def _tally(self, profile):
+        return profile.pairwise_matrix()
+
+    def _state(self):
+        return self.pairwise
+
+    _batched = True
+
+    def _tally_batch(self, ranks):
+        return _batch_pairwise(ranks, len(self.candidates.names))
+
+    def _paths(self, pairwise):
+        """Computes the strength of the strongest path between every pair of candidates, over the
+        last two axes of a pairwise matrix or a batch of them."""
+        against = pairwise.swapaxes(-1, -2)
+        if self.variant == 'winning_votes':
+            paths = np.where(pairwise > against, pairwise, 0)
+        else:
+            paths = np.maximum(pairwise - against, 0)
+        diagonal = np.arange(paths.shape[-1])
+        paths[..., diagonal, diagonal] = 0
+
+        # Halving the memory traffic of the O(m³) loop matters more than anything else here
+        if paths.dtype.kind in 'iu' and (not paths.size or paths.max() < np.iinfo(np.int32).max):
+            paths = paths.astype(np.int32)
+
+        # Widest paths: route every pair through each intermediate candidate in turn
+        through = np.empty_like(paths)
+        for k in range(paths.shape[-1]):
+            np.minimum(paths[..., :, k, None], paths[..., k, None, :], out=through)
+            np.maximum(paths, through, out=paths)
+        paths[..., diagonal, diagonal] = 0
+
+        return paths
+
+    @staticmethod
+    def _ranked_above(paths):
+        """Counts the candidates each candidate beats by strongest path, over the last two axes."""
+        return (paths > paths.swapaxes(-1, -2)).sum(axis=-1)
+
+    def _finalize(self, pairwise):
+        return self._ranked_above(self._paths(pairwise))
+
+    def _strongest_paths(self):
+        """Returns the cached strongest paths of the whole election."""
+        return self._cached('paths', lambda: self._paths(self._state()))
+
+    def _scores(self):
+        # Scored from the cached paths, which `_finalize` cannot keep: it also finalizes streamed tallies
+        return self._cached('scores', lambda: self._ranked_above(self._strongest_paths()))
+
+    def strongest_paths(self):
+        """Returns the strength of the strongest path between every pair of candidates.
+
+        Returns
+        -------
+        numpy.ndarray
+            A (candidates × candidates) matrix where entry `[i, j]` is the strength of the strongest
+            path from candidate `i` to candidate `j`.
+        """
+        return self._strongest_paths().copy()
+
+    def calculate_results(self):
+        """Calculates the results of the Schulze election.
+
+        The score of a candidate is the number of candidates they rank above, so the dictionary
+        lists the candidates in the order of the Schulze ranking.
+
+        Returns
+        -------
+        dict
+            A sorted dictionary containing the candidates and the number of candidates they rank above.
+        """
+        return super().calculate_results()
+
+def _popcount(words):
+    """Counts the bits set in an array of unsigned integers."""
+    if hasattr(np, 'bitwise_count'):
+        return int(np.bitwise_count(words).sum())
+
+    return int(np.unpackbits(np.ascontiguousarray(words).view(np.uint8)).sum())
+
+class RankedPairs(Election):
+    """Represents the ranked pairs method (Tideman), which locks in pairwise victories from the
+    strongest to the weakest, skipping any victory that would create a cycle with those already
+    locked.
+
+    Victories are read from the shared pairwise majority matrix. Instead of searching the locked
+    graph for a cycle before each lock, the transitive closure of the locked graph is maintained as
+    one bitset per candidate: a victory of `i` over `j` creates a cycle exactly when `j` already
+    reaches `i`, a single bit test, and locking it ORs the bitset of `j` into every candidate
+    reaching `i`. Locking stops as soon as the closure orders every pair of candidates.
 
     Parameters
     ----------
     candidates : Candidates
         An instance of the `Candidates` class containing the list of candidates.
-    agents : list of Agent
-        A list of `Agent` instances representing the voters in the election.
+    agents : list of Agent or Profile
+        A list of `Agent` instances representing the voters in the election, or a `Profile`.
+    variant : {'margins', 'winning_votes'}, optional
+        How the strength of a pairwise victory is measured, by default 'margins'.
+    workers : int, optional
+        The number of processes tallying the ballots in parallel, by default 1.
+    num_winners, allow_ties : optional
+        How `winners` selects the winners, as described in `Election`.
+    tiebreak : TieBreaker or list of str, optional
+        The tie-breaker, or the candidates in order of priority, used to order victories of equal
+        strength: victories of higher-priority candidates are locked first, and for the same
+        winner, victories over lower-priority candidates first. Defaults to the order of
+        `Candidates.names`.
 
     Attributes
     ----------
-    candidates : Candidates
-        The collection of candidates participating in the election.
-    agents : list of Agent
-        The list of agents (voters) participating in the election.
+    variant : str
+        How the strength of a pairwise victory is measured.
+    tiebreak : TieBreaker, list of str or None
+        The tie-breaker for ordering victories of equal strength.
+
+    Methods
+    -------
+    calculate_results()
+        Calculates and returns every candidate with the number of candidates they rank above.
+    winners()
+        Returns only the first candidates of the ranking, by default those no other candidate is locked above.
+    locked_pairs()
+        Returns the pairwise victories locked in, in locking order.
     """
-    def __init__(self, candidates: Candidates, agents: list):
-        self.candidates = candidates
-        self.agents = agents
+    def __init__(self, candidates, agents, variant='margins', workers=1, num_winners=1, allow_ties=True, tiebreak=None):
+        super().__init__(candidates, agents, workers, num_winners=num_winners, allow_ties=allow_ties, tiebreak=tiebreak)
+        if variant not in ('margins', 'winning_votes'):
+            raise ValueError("variant must be 'margins' or 'winning_votes'")
+        self.variant = variant
 
-class Plurality(Election):
-    """Represents a plurality (or first-past-the-post) voting system where the candidate with the most votes wins.
+    def _tally(self, profile):
+        return profile.pairwise_matrix()
+
+    def _state(self):
+        return self.pairwise
+
+    def _priority(self):
+        """Returns the tie-breaking priority of every candidate, the lowest being the highest."""
+        return self._tiebreaker().keys(self.candidates)
+
+    def _lock(self, pairwise):
+        """Locks the pairwise victories in order and returns the closure and the locked pairs."""
+        num_candidates = len(pairwise)
+        winners, losers = np.nonzero(pairwise > pairwise.T)
+        strength = (pairwise - pairwise.T if self.variant == 'margins' else pairwise)[winners, losers]
+        if strength.dtype == object:
+            strength = np.unique(strength, return_inverse=True)[1].ravel() # Exact numbers, ranked
+
+        # Strongest first, then by priority of the winner, then lowest priority of the loser
+        priority = self._priority()
+        order = np.lexsort((-priority[losers], priority[winners], -strength))
+
+        words = (num_candidates + 63) // 64
+        closure = np.zeros((num_candidates, words), dtype=np.uint64)
+        one = np.uint64(1)
+        bits = [(c >> 6, one << np.uint64(c & 63)) for c in range(num_candidates)]
+
+        reachable, total = 0, num_candidates * (num_candidates - 1) // 2
+        locked = []
+
+        for winner, loser in zip(winners[order].tolist(), losers[order].tolist()):
+            if reachable == total:
+                break # Every pair is already ordered: the remaining victories cannot change anything
+
+            word, bit = bits[winner]
+            if closure[loser, word] & bit:
+                continue # The loser already reaches the winner: locking would create a cycle
+
+            locked.append((winner, loser))
+            word, bit = bits[loser]
+            if closure[winner, word] & bit:
+                continue # Already implied by the locked victories
+
+            # Everything reaching the winner (and the winner itself) now reaches everything the loser reaches
+            word, bit = bits[winner]
+            sources = np.flatnonzero(closure[:, word] & bit)
+            sources = np.append(sources, winner)
+            targets = closure[loser].copy()
+            word, bit = bits[loser]
+            targets[word] |= bit
+
+            before = _popcount(closure[sources])
+            closure[sources] |= targets
+            reachable += _popcount(closure[sources]) - before
+
+        return closure, locked
+
+    @staticmethod
+    def _ranked_above(closure):
+        """Counts the candidates each candidate is locked above, from the closure of the locked graph."""
+        return np.array([_popcount(row) for row in closure], dtype=np.int64)
+
+    def _finalize(self, pairwise):
+        return self._ranked_above(self._lock(pairwise)[0])
+
+    def _locked(self):
+        """Returns the cached closure and locked pairs of the whole election."""
+        return self._cached('locked', lambda: self._lock(self._state()))
+
+    def _scores(self):
+        # Scored from the cached lock, which `_finalize` cannot keep: it also finalizes streamed tallies
+        return self._cached('scores', lambda: self._ranked_above(self._locked()[0]))
+
+    def locked_pairs(self):
+        """Returns the pairwise victories locked in, in the order they were locked, up to the point
+        where the locked victories order every pair of candidates.
+
+        Returns
+        -------
+        list of tuple of str
+            The (winner, loser) pairs locked in.
+        """
+        names = self.candidates.names
+
+        return [(names[winner], names[loser]) for winner, loser in self._locked()[1]]
+
+    def calculate_results(self):
+        """Calculates the results of the ranked pairs election.
+
+        The score of a candidate is the number of candidates they are locked above, directly or
+        through other locked victories, so the dictionary lists the candidates in ranking order.
+
+        Returns
+        -------
+        dict
+            A sorted dictionary containing the candidates and the number of candidates they rank above.
+        """
+        return super().calculate_results()
+
+    def winners(self):
+        """Returns only the winners of the ranked pairs election: the first `num_winners` candidates
+        of the ranking, along with, if `allow_ties` is True, every candidate locked below fewer than
+        `num_winners` candidates, which some completion of the locked ranking places among them.
+        By default, the candidates that no other candidate is locked above.
+
+        Returns
+        -------
+        dict
+            A sorted dictionary containing the winners and the number of candidates they rank above.
+        """
+        def compute():
+            results = self.calculate_results()
+            names = list(results)
+            num_winners = min(self.num_winners, len(names))
+            elected = set(names[:num_winners])
+
+            if self.allow_ties:
+                # The number of candidates locked above each candidate, from the bits of the closure
+                closure = self._locked()[0].astype('<u8').view(np.uint8)
+                above = np.unpackbits(closure, axis=1, bitorder='little').sum(axis=0).tolist()
+                elected.update(name for name, count in zip(self.candidates.names, above) if count < num_winners)
+
+            return {name:value for name, value in results.items() if name in elected}
+
+        return dict(self._cached('winners', compute))
+
+class Kemeny(Election):
+    """Represents the Kemeny–Young method, which elects the consensus ranking closest to the votes:
+    the ranking minimizing the total number of pairwise disagreements with every vote (its Kemeny
+    score, or Kendall tau distance to the profile).
+
+    Every solver reads the shared pairwise majority matrix only. 'exact' finds an optimal ranking
+    by dynamic programming over subsets of candidates, practical up to about 20 candidates.
+    'borda', 'kwiksort' and 'local_search' are fast heuristics for larger elections: the Borda
+    ranking, the best of several KwikSort rankings, and either of them improved by moving single
+    candidates while that reduces the distance. 'auto' uses 'exact' up to `max_exact` candidates
+    and 'local_search' beyond.
 
-    Each agent's top candidate preference is counted as a single vote. The candidate with the 
-    highest vote count is declared the winner.
-    
     Parameters
     ----------
     candidates : Candidates
         An instance of the `Candidates` class containing the list of candidates.
-    agents : list of Agent
-        A list of `Agent` instances representing the voters in the election.
-    allow_ties : bool, optional
-        A flag indicating whether ties are permitted, by default True.
+    agents : list of Agent or Profile
+        A list of `Agent` instances representing the voters in the election, or a `Profile`.
+    solver : {'auto', 'exact', 'borda', 'kwiksort', 'local_search'}, optional
+        The algorithm computing the consensus ranking, by default 'auto'.
+    max_exact : int, optional
+        The largest number of candidates solved exactly by 'auto', by default 20 and at most 25.
+    restarts : int, optional
+        The number of KwikSort rankings tried by the heuristics, by default 10.
+    time_limit : float, optional
+        A budget in seconds after which the heuristics stop trying new KwikSort rankings.
+    seed : int or numpy.random.Generator, optional
+        The source of randomness of KwikSort.
+    workers : int, optional
+        The number of processes tallying the ballots in parallel, by default 1.
+    num_winners, allow_ties, tiebreak : optional
+        How `winners` selects the winners and breaks ties, as described in `Election`.
 
     Attributes
     ----------
-    allow_ties : bool
-        Indicates whether ties are allowed in the voting results.
+    solver : str
+        The algorithm computing the consensus ranking.
+    max_exact : int
+        The largest number of candidates solved exactly by 'auto'.
+    restarts : int
+        The number of KwikSort rankings tried by the heuristics.
+    time_limit : float or None
+        The budget in seconds of the heuristics.
+    seed : int, numpy.random.Generator or None
+        The source of randomness of KwikSort.
 
     Methods
     -------
     calculate_results()
-        Calculates and returns the winning candidate(s) and their vote count.
-    show_full_results()
-        Displays a summary of the full voting results, including each candidate's vote count.
+        Calculates and returns every candidate with the number of candidates ranked below them.
+    winners()
+        Returns only the candidate ranked first.
+    consensus()
+        Returns the consensus ranking with its Kemeny score and solver time.
+
+    Raises
+    ------
+    ValueError
+        If the solver is unknown, or if 'exact' would have to solve more than 25 candidates.
     """
-    def __init__(self, candidates, agents, allow_ties=True, num_winners=1):
-        super().__init__(candidates, agents)
-        self.allow_ties = allow_ties
-        self.num_winners = num_winners
+    def __init__(self, candidates, agents, solver='auto', max_exact=20, restarts=10, time_limit=None, seed=None,
+                 workers=1, num_winners=1, allow_ties=True, tiebreak=None):
+        super().__init__(candidates, agents, workers, num_winners=num_winners, allow_ties=allow_ties, tiebreak=tiebreak)
+        if solver not in ('auto', 'exact', 'borda', 'kwiksort', 'local_search'):
+            raise ValueError("solver must be one of 'auto', 'exact', 'borda', 'kwiksort' or 'local_search'")
+        if max_exact > MAX_EXACT_CANDIDATES:
+            raise ValueError(f'max_exact cannot exceed {MAX_EXACT_CANDIDATES}')
+        if solver == 'exact' and len(candidates.names) > MAX_EXACT_CANDIDATES:
+            raise ValueError(f"solver 'exact' cannot solve more than {MAX_EXACT_CANDIDATES} candidates, "
+                             "use 'local_search' instead")
+        self.solver = solver
+        self.max_exact = max_exact
+        self.restarts = restarts
+        self.time_limit = time_limit
+        self.seed = seed
+
+    def _tally(self, profile):
+        return profile.pairwise_matrix()
+
+    def _state(self):
+        return self.pairwise
+
+    def _solve(self, pairwise):
+        """Computes the consensus ranking with the configured solver."""
+        start = time.perf_counter()
+        solver = self.solver
+        if solver == 'auto':
+            solver = 'exact' if len(pairwise) <= self.max_exact else 'local_search'
+
+        if solver == 'exact':
+            ranking = kemeny_exact(pairwise)
+        elif solver == 'borda':
+            ranking = kemeny_borda(pairwise)
+        else:
+            rng = np.random.default_rng(self.seed)
+            candidates = [kemeny_borda(pairwise)]
+            for _ in range(self.restarts):
+                if self.time_limit is not None and time.perf_counter() - start > self.time_limit:
+                    break
+                candidates.append(kemeny_kwiksort(pairwise, rng))
+
+            if solver == 'local_search':
+                candidates = [kemeny_local_search(pairwise, ranking) for ranking in candidates]
+            ranking = min(candidates, key=lambda ranking: kemeny_distance(pairwise, ranking))
+
+        return {'ranking': ranking, 'distance': np.asarray(kemeny_distance(pairwise, ranking)).item(), 'solver': solver,
+                'time': time.perf_counter() - start}
+
+    @staticmethod
+    def _ranked_below(ranking):
+        """Counts the candidates ranked below each candidate of a ranking."""
+        scores = np.empty(len(ranking), dtype=np.int64)
+        scores[ranking] = np.arange(len(ranking) - 1, -1, -1)
+
+        return scores
+
+    def _finalize(self, pairwise):
+        return self._ranked_below(self._solve(pairwise)['ranking'])
+
+    def _consensus(self):
+        """Returns the cached consensus of the whole election."""
+        return self._cached('consensus', lambda: self._solve(self._state()))
+
+    def _scores(self):
+        # Scored from the cached consensus, which `_finalize` cannot keep: it also finalizes streamed tallies
+        return self._cached('scores', lambda: self._ranked_below(self._consensus()['ranking']))
+
+    def consensus(self):
+        """Returns the consensus ranking with its Kemeny score and the time the solver took.
+
+        Returns
+        -------
+        dict
+            A dictionary with the ranking ('ranking', candidate names from first to last), its total
+            number of pairwise disagreements with the votes ('distance'), the solver used ('solver')
+            and the time it took in seconds ('time').
+        """
+        consensus = dict(self._consensus())
+        consensus['ranking'] = [self.candidates.names[c] for c in consensus['ranking']]
+
+        return consensus
 
     def calculate_results(self):
-        """Calculates the results of the plurality election.
+        """Calculates the results of the Kemeny–Young election.
 
-        Each agent's top candidate preference is counted as a single vote. The candidate with the
-        highest vote count is declared the winner. If `allow_ties` is True, multiple candidates can
-        win in the case of a tie.
+        The score of a candidate is the number of candidates ranked below them in the consensus
+        ranking, so the dictionary lists the candidates in consensus order.
 
         Returns
         -------
         dict
-            A sorted dictionary containing the candidates and their respective vote count.
+            A sorted dictionary containing the candidates and the number of candidates ranked below them.
         """
-        
-        # Create empty dictionary for candidates with each candidate at 0
-        results = {c:0 for c in (self.candidates.names)}
+        return super().calculate_results()
 
-        # Run the election
-        for agent in self.agents:
-            choice = agent.choices[0]
-            results[choice]+=1
+class _RoundCounter:
+    """Follows every ballot of a profile through the rounds of a transferable vote count.
 
-        # Sorting the results
-        results = dict(sorted(results.items(), key=lambda item: item[1], reverse=True))
+    Each ballot keeps a pointer to its current preference. When candidates stop being continuing
+    (eliminated or elected), only the ballots pointing at them move their pointer forward, so every
+    round is a single vectorized tally of current preferences instead of a rebuild of the ballots.
+
+    With 'fixed' or 'exact' arithmetic, ballots sharing a weight form a parcel with an exact value,
+    and a transfer moves ballots to new parcels worth their old value times the transfer value.
+    Every round counts the ballots of each parcel held by each candidate with integers, then
+    multiplies the counts by the values of the parcels: no fraction is computed per ballot.
+
+    Parameters
+    ----------
+    profile : Profile
+        The ballots to count.
+    arithmetic : {'float', 'fixed', 'exact'}, optional
+        How votes are added up, by default 'float'. 'fixed' truncates every transfer value and
+        transferred vote to `decimals` decimal places.
+    decimals : int, optional
+        The decimal places of 'fixed' arithmetic, by default 6.
+    """
+    def __init__(self, profile: Profile, arithmetic='float', decimals=6):
+        self.ranks = profile.ranks
+        self.arithmetic = arithmetic
+        self.scale = 10 ** decimals
+        if arithmetic == 'float':
+            self.weights = profile.weights.astype(np.float64)
+            # Votes stay whole numbers until a surplus is transferred at a fractional value
+            self.integral = profile.weights.dtype.kind in 'iub'
+        elif arithmetic in Election._arithmetics:
+            values, parcels = np.unique(profile.exact_weights, return_inverse=True)
+            self.values = [self._rounded(_as_fraction(value)) for value in values.tolist()]
+            self.parcels = parcels.ravel()
+            self.integral = False
+        else:
+            raise ValueError("arithmetic must be one of 'float', 'fixed' or 'exact'")
+        self.continuing = np.ones(profile.num_candidates, dtype=bool)
+        self.pointers = np.zeros(profile.num_ballots, dtype=np.int64)
+        self.current = np.full(profile.num_ballots, -1, dtype=np.int64)
+        if self.ranks.shape[1]:
+            self.current[:] = self.ranks[:, 0]
+        self._advance(np.flatnonzero(self.current >= 0))
+
+    def _rounded(self, value):
+        """Truncates an exact value to the decimal places of 'fixed' arithmetic."""
+        if self.arithmetic != 'fixed':
+            return value
+        return Fraction(math.floor(value * self.scale), self.scale)
+
+    @property
+    def dtype(self):
+        """numpy.dtype : The type of the votes counted."""
+        return np.dtype(np.float64 if self.arithmetic == 'float' else object)
+
+    def _advance(self, ballots):
+        """Moves the pointers of `ballots` forward until they reach a continuing candidate or run out."""
+        width = self.ranks.shape[1]
+
+        while len(ballots):
+            stale = ballots[(self.current[ballots] >= 0) & ~self.continuing[self.current[ballots]]]
+            if not len(stale):
+                break
+
+            self.pointers[stale] += 1
+            exhausted = self.pointers[stale] >= width
+            self.current[stale[exhausted]] = -1
+            live = stale[~exhausted]
+            self.current[live] = self.ranks[live, self.pointers[live]]
+            ballots = live
+
+    def _parcel_totals(self, counts):
+        """Multiplies counts of ballots by parcel (along the last axis) by the parcel values."""
+        return counts.astype(object) @ np.array(self.values + [0], dtype=object)[:-1]
+
+    def total(self):
+        """Returns the votes of every ballot, exhausted or not."""
+        if self.arithmetic == 'float':
+            return self.weights.sum()
+        return self._parcel_totals(np.bincount(self.parcels, minlength=len(self.values)))
+
+    def tally(self):
+        """Returns the votes currently held by each candidate."""
+        live = self.current >= 0
+        num_candidates = len(self.continuing)
+
+        if self.arithmetic != 'float':
+            num_parcels = len(self.values)
+            counts = np.bincount(self.current[live] * num_parcels + self.parcels[live],
+                                 minlength=num_candidates * num_parcels)
+            return _exact_numbers(self._parcel_totals(counts.reshape(num_candidates, num_parcels)))
+
+        tally = np.bincount(self.current[live], weights=self.weights[live], minlength=num_candidates)
+
+        return np.rint(tally).astype(np.int64) if self.integral else tally
+
+    def ratio(self, surplus, votes):
+        """Returns the transfer value of a surplus of `votes`, exact unless counting in floats."""
+        return surplus / votes if self.arithmetic == 'float' else _as_fraction(surplus) / votes
+
+    def remove(self, candidate, transfer_value=1):
+        """Stops counting `candidate` and moves its ballots on to their next continuing preference,
+        multiplying their weight by `transfer_value`."""
+        self.remove_all([candidate], [transfer_value])
+
+    def remove_all(self, candidates, transfer_values):
+        """Stops counting several candidates at once, then moves the ballots of each on to their
+        next continuing preference at its transfer value, so no transfer reaches another of them."""
+        self.continuing[candidates] = False
+        for candidate, transfer_value in zip(candidates, transfer_values):
+            self._transfer(candidate, transfer_value)
+
+    def _transfer(self, candidate, transfer_value):
+        """Moves the ballots held by a candidate who is no longer continuing to their next preference."""
+        ballots = np.flatnonzero(self.current == candidate)
+        if transfer_value != 1:
+            if self.arithmetic == 'float':
+                self.weights[ballots] *= transfer_value
+                self.integral = False
+            else:
+                # Every parcel of the ballots moves to a new parcel worth the transferred value
+                parcels, inverse = np.unique(self.parcels[ballots], return_inverse=True)
+                self.parcels[ballots] = len(self.values) + inverse.ravel()
+                transfer_value = self._rounded(transfer_value)
+                self.values.extend(self._rounded(self.values[parcel] * transfer_value) for parcel in parcels.tolist())
+        self._advance(ballots)
+
+class InstantRunoff(Election):
+    """Represents instant-runoff voting (the alternative vote), where the candidate with the fewest
+    first preferences is eliminated round after round and their ballots transferred to the next
+    preference, until a candidate holds a majority of the continuing votes.
+
+    Rounds are counted over the compressed rank matrix with a pointer per distinct ballot, so each
+    round costs one vectorized tally. Ties for elimination are resolved by eliminating the tied
+    candidate `tiebreak` prefers least: by default the tied candidate that comes last in
+    `Candidates.names`, or with `PriorRoundTieBreaker`, the one with the fewest votes in the
+    latest round where the tied candidates differ.
+
+    Parameters
+    ----------
+    candidates : Candidates
+        An instance of the `Candidates` class containing the list of candidates.
+    agents : list of Agent or Profile
+        A list of `Agent` instances representing the voters in the election, or a `Profile`.
+    num_winners, allow_ties, tiebreak : optional
+        How `winners` selects the winners and breaks ties, as described in `Election`.
+
+    Methods
+    -------
+    calculate_results()
+        Calculates and returns every candidate with their votes in the last round they took part in.
+    winners()
+        Returns only the first candidates of the finishing order, by default the winner.
+    rounds()
+        Returns the votes of the continuing candidates in every round.
+    """
+    _additive = False
+
+    def _ordered(self, tally, candidates, history=None):
+        """Orders some of the candidates from the most to the fewest votes, ties broken by the tie-breaker."""
+        candidates = set(candidates)
+        return [c for c in self._ranking(tally, history).tolist() if c in candidates]
+
+    def _loser(self, tally, continuing, history):
+        """Returns the continuing candidate to eliminate, with the fewest votes."""
+        if self.tiebreak is None:
+            # The tied candidate last in the names, the lowest priority of `LexicographicTieBreaker`
+            return continuing[tally[continuing] == tally[continuing].min()][-1]
+
+        return self._ordered(tally, continuing, history)[-1]
+
+    def _eliminate(self, tally, continuing, history, ties, forced):
+        """Returns the continuing candidate to eliminate, recording every tie for elimination in
+        `ties` as the tied candidates and the one eliminated. `forced` is None, or the index of a
+        tie and the candidate to eliminate in it instead of the one the tie-breaker picks."""
+        loser = self._loser(tally, continuing, history)
+        tied = continuing[tally[continuing] == tally[loser]]
+        if len(tied) > 1:
+            if forced is not None and forced[0] == len(ties):
+                loser = forced[1]
+            ties.append((tied.tolist(), loser))
+
+        return loser
+
+    def _tally(self, profile, forced=None):
+        counter = _RoundCounter(profile, self.arithmetic, self.decimals)
+        votes = np.zeros(profile.num_candidates, dtype=counter.dtype)
+        eliminated, rounds, history, ties = [], [], [], []
+
+        while True:
+            tally = counter.tally()
+            history.append(tally)
+            continuing = np.flatnonzero(counter.continuing)
+            votes[continuing] = tally[continuing]
+            rounds.append(dict(zip((self.candidates.names[c] for c in continuing), tally[continuing].tolist())))
+
+            leader = continuing[np.argmax(tally[continuing])]
+            if len(continuing) == 1 or 2 * tally[leader] > tally[continuing].sum():
+                break
+
+            loser = self._eliminate(tally, continuing, history, ties, forced)
+            counter.remove(loser)
+            eliminated.append(loser)
+
+        if counter.integral:
+            votes = votes.astype(np.int64)
+
+        # Finishing order: the winner, the other final-round candidates, then the eliminated in reverse
+        finalists = self._ordered(votes, continuing, history)
+        return {'order': finalists + eliminated[::-1], 'votes': votes, 'rounds': rounds, 'ties': ties}
+
+    def _finalize(self, state):
+        return state['votes']
+
+    def _results_dict(self, scores):
+        order, scores = self._state()['order'], scores.tolist()
+        return {self.candidates.names[c]:scores[c] for c in order}
+
+    def calculate_results(self):
+        """Calculates the results of the instant-runoff election.
+
+        Returns
+        -------
+        dict
+            A dictionary of the candidates in finishing order, with their votes in the last round
+            they took part in.
+        """
+        return super().calculate_results()
 
-        return results
-    
     def winners(self):
-        """Returns only the winners of the plurality method.
+        """Returns only the winners of the election: the first `num_winners` candidates of the
+        finishing order. If `allow_ties` is True, the candidates who would be among them had a
+        single tie of the count been resolved otherwise are returned as well: the count is run
+        again with every other resolution of every tie for elimination, and candidates tied with
+        the last winner in the final round are added.
 
         Returns
         -------
         dict
-            A sorted dictionary containing the winners and their respective vote count.
+            A dictionary containing the elected candidates and their votes in the last round
+            they took part in.
         """
+        def compute():
+            state = self._state()
+            names, votes = self.candidates.names, _exact_numbers(state['votes']).tolist()
+            order, rounds = state['order'], state['rounds']
+            num_winners = min(self.num_winners, len(order))
+            elected = order[:num_winners]
 
-        results = self.calculate_results()
+            if self.allow_ties and num_winners:
+                profile = self.compressed_profile if self.arithmetic == 'float' else self.profile
+                for index, (tied, loser) in enumerate(state['ties']):
+                    for other in tied:
+                        if other != loser:
+                            recount = self._tally(profile, (index, other))['order'][:num_winners]
+                            elected = elected + [c for c in recount if c not in elected]
 
-        # Save the results
-        max_value = max(results.values())
-        winners = {key:value for key, value in results.items() if value == max_value}
+                # The final round orders the candidates left with the tie-breaker
+                final, last = rounds[-1], names[order[num_winners - 1]]
+                elected = elected + [c for c in order[num_winners:] if c not in elected and last in final
+                                     and final.get(names[c]) == final[last]]
 
-        return winners
+            return {names[c]:votes[c] for c in elected}
 
-class Borda(Election):
-    """Represents a Borda count voting system where candidates are ranked and points are awarded 
-    based on their rank order.
+        return dict(self._cached('winners', compute))
 
-    In the Borda count, agents assign rankings to candidates, and each rank is assigned a point
-    value, with higher ranks earning more points. The candidate with the highest cumulative 
-    score wins the election.
+    def rounds(self):
+        """Returns the votes held by every continuing candidate, round by round.
+
+        Returns
+        -------
+        list of dict
+            One dictionary per round mapping each continuing candidate to their votes.
+        """
+        return [dict(round) for round in self._state()['rounds']]
+
+class SingleTransferableVote(InstantRunoff):
+    """Represents the single transferable vote, electing `num_winners` candidates in proportion to
+    the preferences of the voters.
+
+    Candidates reaching the quota are elected and the surplus of their votes is transferred to the
+    next continuing preference of their ballots at a fractional transfer value (Gregory method).
+    Candidates reaching the quota in the same round are all elected before any surplus moves, so
+    no surplus is transferred to another elected candidate. When nobody reaches the quota, the
+    candidate with the fewest votes is eliminated and their ballots transferred at full value.
+    Ties for elimination are resolved as in `InstantRunoff`.
+
+    The Droop quota is the integral ``total // (num_winners + 1) + 1`` when the ballots hold a
+    whole number of votes. Otherwise it is the exact ``total / (num_winners + 1)``, which a
+    candidate must exceed, so scaling every weight by the same factor elects the same candidates.
 
     Parameters
     ----------
     candidates : Candidates
         An instance of the `Candidates` class containing the list of candidates.
-    agents : list of Agent
-        A list of `Agent` instances representing the voters in the election.
-    weight_increment : int, optional
-        The increment by which points are awarded based on rank order, by default 1.
+    agents : list of Agent or Profile
+        A list of `Agent` instances representing the voters in the election, or a `Profile`.
+    num_winners : int, optional
+        The number of seats to fill, by default 1.
+    quota : {'droop', 'hare'}, optional
+        The quota of votes needed to be elected, by default 'droop'.
+    allow_ties, tiebreak : optional
+        How `winners` breaks ties, as described in `Election`.
 
     Attributes
     ----------
-    weight_increment : int
-        The point increment for each rank position in the Borda count.
+    num_winners : int
+        The number of seats to fill.
+    quota : str
+        The quota of votes needed to be elected.
 
     Methods
     -------
     calculate_results()
-        Calculates and returns the winning candidate(s) and their total score.
-    show_full_results()
-        Displays a summary of the full voting results, including each candidate's score.
+        Calculates and returns every candidate with their votes in the last round they took part in.
+    winners()
+        Returns only the elected candidates.
+    rounds()
+        Returns the votes of the continuing candidates in every round.
     """
-    def __init__(self, candidates, agents, weight_increment=1):
-        super().__init__(candidates, agents)
-        self.weight_increment = weight_increment
+    def __init__(self, candidates, agents, num_winners=1, quota='droop', allow_ties=True, tiebreak=None):
+        super().__init__(candidates, agents, num_winners=num_winners, allow_ties=allow_ties, tiebreak=tiebreak)
+        if quota not in ('droop', 'hare'):
+            raise ValueError("quota must be 'droop' or 'hare'")
+        self.quota = quota
+
+    def _tally(self, profile, forced=None):
+        counter = _RoundCounter(profile, self.arithmetic, self.decimals)
+        votes = np.zeros(profile.num_candidates, dtype=counter.dtype)
+        elected, eliminated, rounds, history, ties = [], [], [], [], []
+
+        total = counter.total()
+        if counter.dtype == object:
+            total = Fraction(total) # Divided into an exact quota
+        # A whole number of votes needs the integral Droop quota, any other total exceeds the exact one
+        strict = self.quota == 'droop' and total % 1 != 0
+        if self.quota == 'hare':
+            quota = total / self.num_winners
+        elif strict:
+            quota = total / (self.num_winners + 1)
+        else:
+            quota = total // (self.num_winners + 1) + 1
+
+        while len(elected) < self.num_winners:
+            tally = counter.tally()
+            history.append(tally)
+            continuing = np.flatnonzero(counter.continuing)
+            if not len(continuing):
+                break
+            votes[continuing] = tally[continuing]
+            rounds.append(dict(zip((self.candidates.names[c] for c in continuing), tally[continuing].tolist())))
+
+            # Fill the remaining seats once there are no more continuing candidates than seats
+            if len(elected) + len(continuing) <= self.num_winners:
+                elected.extend(self._ordered(tally, continuing, history))
+                break
+
+            reached = continuing[tally[continuing] > quota if strict else tally[continuing] >= quota]
+            if len(reached):
+                # Everyone reaching the quota is elected before any surplus moves on
+                reached = self._ordered(tally, reached, history)
+                elected.extend(reached)
+                counter.remove_all(reached, [counter.ratio(tally[c] - quota, tally[c]) for c in reached])
+                continue
+
+            loser = self._eliminate(tally, continuing, history, ties, forced)
+            counter.remove(loser)
+            eliminated.append(loser)
+
+        if counter.integral:
+            votes = votes.astype(np.int64)
+
+        others = [c for c in self._ordered(votes, np.flatnonzero(counter.continuing), history) if c not in elected]
+        return {'order': elected + others + eliminated[::-1], 'votes': votes, 'rounds': rounds, 'ties': ties}
 
     def calculate_results(self):
-        """Calculates the results of the Borda count election.
+        """Calculates the results of the single transferable vote election.
+
+        Returns
+        -------
+        dict
+            A dictionary of the candidates in finishing order (elected candidates first, in order
+            of election), with their votes in the last round they took part in.
+        """
+        return super().calculate_results()
+
+class Approval(Election):
+    """Represents approval voting, where every voter approves any number of candidates and the
+    candidate approved by the most votes wins.
+
+    Ballots are held as an `ApprovalProfile`, one bitset per ballot, and tallied by unpacking the
+    bitsets a chunk at a time. A list of agents is read as approval ballots, each agent approving
+    every candidate in its `choices`.
 
-        Each agent ranks candidates, and points are awarded incrementally based on rank position. 
-        The candidate with the highest total score is declared the winner.
+    Parameters
+    ----------
+    candidates : Candidates
+        An instance of the `Candidates` class containing the list of candidates.
+    agents : list of Agent or ApprovalProfile
+        A list of `Agent` instances approving the candidates they list, or an `ApprovalProfile`.
+    normalize : bool, optional
+        Whether every ballot splits its votes equally between the candidates it approves
+        (satisfaction approval voting), by default False.
+    workers : int, optional
+        The number of processes tallying the ballots in parallel, by default 1.
+    num_winners, allow_ties, tiebreak : optional
+        How `winners` selects the winners and breaks ties, as described in `Election`.
+
+    Attributes
+    ----------
+    normalize : bool
+        Whether every ballot splits its votes equally between the candidates it approves.
+
+    Methods
+    -------
+    calculate_results()
+        Calculates and returns every candidate with their approval score.
+    winners()
+        Returns only the candidates with the highest approval score.
+    """
+    _profile_type = ApprovalProfile
+
+    def __init__(self, candidates, agents, normalize=False, workers=1, num_winners=1, allow_ties=True, tiebreak=None):
+        super().__init__(candidates, agents, workers, num_winners=num_winners, allow_ties=allow_ties, tiebreak=tiebreak)
+        self.normalize = normalize
+
+    def _tally(self, profile):
+        return profile.approval_scores(self.normalize)
+
+    def calculate_results(self):
+        """Calculates the results of the approval election.
 
         Returns
         -------
         dict
-            A sorted dictionary containing the candidates and their respective vote count.
+            A sorted dictionary containing the candidates and their respective approval score.
         """
+        return super().calculate_results()
 
-        results = {c:0 for c in (self.candidates.names)}
+class Range(Election):
+    """Represents range (score) voting, where every voter grades every candidate and the candidate
+    with the highest total grade wins.
 
-        # Run the election
-        for agent in self.agents:
-            i = len(agent.choices) - 1
-            for choice in agent.choices:
-                results[choice]+=i
-                i-=1
+    Ballots are held as a `ScoreProfile`, a matrix of small integer grades.
 
-        # Sorting the results
-        results = dict(sorted(results.items(), key=lambda item: item[1], reverse=True))
+    Parameters
+    ----------
+    candidates : Candidates
+        An instance of the `Candidates` class containing the list of candidates.
+    agents : ScoreProfile
+        The graded ballots of the election.
+    average : bool, optional
+        Whether candidates are scored by their average grade rather than their total grade,
+        by default False. Both give the same ranking.
+    workers : int, optional
+        The number of processes tallying the ballots in parallel, by default 1.
+    num_winners, allow_ties, tiebreak : optional
+        How `winners` selects the winners and breaks ties, as described in `Election`.
 
-        return results
+    Attributes
+    ----------
+    average : bool
+        Whether candidates are scored by their average grade.
 
-    def winners(self):
-        """Returns only the winners of the Borda method.
+    Methods
+    -------
+    calculate_results()
+        Calculates and returns every candidate with their total or average grade.
+    winners()
+        Returns only the candidates with the highest grade.
+    """
+    _profile_type = ScoreProfile
+
+    def __init__(self, candidates, agents, average=False, workers=1, num_winners=1, allow_ties=True, tiebreak=None):
+        super().__init__(candidates, agents, workers, num_winners=num_winners, allow_ties=allow_ties, tiebreak=tiebreak)
+        self.average = average
+
+    def _tally(self, profile):
+        # The total weight of the ballots is kept after the grade sums, to average them
+        return np.append(profile.score_sums(), profile.weights.sum())
+
+    def _finalize(self, state):
+        sums, total = state[:-1], state[-1]
+        if not self.average:
+            return sums
+        if sums.dtype == object:
+            total = Fraction(total) # Exact sums divide into fractions
+
+        return sums / total if total else np.zeros(len(sums))
+
+    def calculate_results(self):
+        """Calculates the results of the range election.
 
         Returns
         -------
         dict
-            A sorted dictionary containing the winners and their respective vote count.
+            A sorted dictionary containing the candidates and their respective total or average
+            grade.
         """
-        results = self.calculate_results()
+        return super().calculate_results()
 
-        # Save the results
-        max_value = max(results.values())
-        winners = {key:value for key, value in results.items() if value == max_value}
+class MajorityJudgment(Election):
+    """Represents majority judgment, where every voter grades every candidate and candidates are
+    ranked by their median grade.
 
-        return winners
-        
+    Ties between candidates sharing a median grade are broken with the majority gauge: a candidate
+    whose share of votes above its median grade `p` is larger than the share below it `q` scores
+    `median + p`, and `median - q` otherwise. The score therefore lies within half a grade of the
+    median and ranks candidates like the usual majority judgment tie-breaking rule.
+
+    Parameters
+    ----------
+    candidates : Candidates
+        An instance of the `Candidates` class containing the list of candidates.
+    agents : ScoreProfile
+        The graded ballots of the election.
+    max_score : int, optional
+        The highest grade, by default the `max_score` of the ballots. It must be given when the
+        ballots are streamed or added after construction.
+    workers : int, optional
+        The number of processes tallying the ballots in parallel, by default 1.
+    num_winners, allow_ties, tiebreak : optional
+        How `winners` selects the winners and breaks ties, as described in `Election`.
+
+    Attributes
+    ----------
+    max_score : int
+        The highest grade.
+
+    Methods
+    -------
+    calculate_results()
+        Calculates and returns every candidate with their majority gauge score.
+    winners()
+        Returns only the candidates with the highest majority gauge score.
+    """
+    _profile_type = ScoreProfile
+
+    def __init__(self, candidates, agents, max_score=None, workers=1, num_winners=1, allow_ties=True, tiebreak=None):
+        super().__init__(candidates, agents, workers, num_winners=num_winners, allow_ties=allow_ties, tiebreak=tiebreak)
+        if max_score is None and isinstance(agents, ScoreProfile):
+            max_score = agents.max_score
+        self.max_score = max_score
+
+    def _tally(self, profile):
+        if self.max_score is None:
+            raise ValueError('Please provide the highest grade (max_score)')
+
+        return profile.grade_counts(self.max_score + 1)
+
+    def _finalize(self, counts):
+        totals = counts.sum(axis=1)
+        cumulative = np.cumsum(counts, axis=1)
+
+        # The lower median: the lowest grade reached by at least half of the votes
+        median = (2 * cumulative < totals[:, None]).sum(axis=1)
+        median = np.minimum(median, counts.shape[1] - 1)
+        rows = np.arange(len(counts))
+        below = cumulative[rows, median] - counts[rows, median]
+        above = totals - cumulative[rows, median]
+
+        shares = np.maximum(totals, 1)
+        if counts.dtype == object:
+            shares = np.array([Fraction(share) for share in shares], dtype=object) # Exact counts divide into fractions
+        p, q = above / shares, below / shares
+
+        return median + np.where(p > q, p, -q)
+
+    def calculate_results(self):
+        """Calculates the results of the majority judgment election.
+
+        Returns
+        -------
+        dict
+            A sorted dictionary containing the candidates and their respective majority gauge
+            score.
+        """
+        return super().calculate_results()
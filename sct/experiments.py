@@ -0,0 +1,186 @@
+from itertools import combinations, product
+from statistics import NormalDist
+import numpy as np
+from sct.candidates import Candidates
+from sct.election import Borda, Plurality
+from sct.profile import _batch_pairwise
+from sct.simulation import simulate
+
+class Estimate:
+    """Represents the estimate of a probability from repeated trials, with a Wilson score
+    confidence interval.
+
+    Parameters
+    ----------
+    successes : int
+        The number of trials where the event occurred.
+    trials : int
+        The number of trials.
+    confidence : float, optional
+        The confidence level of the interval, by default 0.95.
+
+    Attributes
+    ----------
+    successes : int
+        The number of trials where the event occurred.
+    trials : int
+        The number of trials.
+    confidence : float
+        The confidence level of the interval.
+    value : float
+        The observed frequency of the event, NaN without trials.
+    low, high : float
+        The bounds of the confidence interval, 0 and 1 without trials.
+    """
+    def __init__(self, successes, trials, confidence=0.95):
+        self.successes = int(successes)
+        self.trials = int(trials)
+        self.confidence = confidence
+
+        if not self.trials:
+            self.value, self.low, self.high = float('nan'), 0.0, 1.0
+            return
+
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        p = self.successes / self.trials
+        center = (p + z * z / (2 * self.trials)) / (1 + z * z / self.trials)
+        spread = z / (1 + z * z / self.trials) * np.sqrt(p * (1 - p) / self.trials + z * z / (4 * self.trials ** 2))
+
+        self.value = p
+        self.low = max(0.0, center - spread)
+        self.high = min(1.0, center + spread)
+
+    @property
+    def half_width(self):
+        """float : Half the width of the confidence interval."""
+        return (self.high - self.low) / 2
+
+    def __repr__(self):
+        return f'Estimate({self.value:.4f}, [{self.low:.4f}, {self.high:.4f}], trials={self.trials})'
+
+def _cell_candidates(num_candidates):
+    """Names the candidates of a simulated election so that candidate `i` has index `i`."""
+    digits = len(str(max(num_candidates - 1, 0)))
+    return Candidates([f'c{i:0{digits}d}' for i in range(num_candidates)])
+
+def _run_cell(culture, num_voters, num_candidates, rules, precision, confidence, chunk_size, max_elections, seed):
+    """Estimates the probabilities of one cell of the grid, simulating elections a chunk at a
+    time until every confidence interval is narrow enough. Runs in a worker process."""
+    rng = np.random.default_rng(seed)
+    candidates = _cell_candidates(num_candidates)
+    elections = {label:rule(candidates, []) for label, rule in rules.items()}
+    pairs = list(combinations(rules, 2))
+
+    # [successes, trials] of every probability estimated
+    counts = {'condorcet_winner': [0, 0]}
+    counts.update({('condorcet_efficiency', label): [0, 0] for label in rules})
+    counts.update({('agreement', pair): [0, 0] for pair in pairs})
+
+    simulated = 0
+    while simulated < max_elections:
+        size = min(chunk_size, max_elections - simulated)
+        ranks = culture(size, num_voters, num_candidates, rng=rng)
+        simulated += size
+
+        pairwise = _batch_pairwise(ranks, num_candidates)
+        beats = ((pairwise > pairwise.swapaxes(-1, -2)).sum(axis=-1) == num_candidates - 1)
+        has_winner = beats.any(axis=1)
+        condorcet = beats.argmax(axis=1)
+        counts['condorcet_winner'][0] += int(has_winner.sum())
+        counts['condorcet_winner'][1] += size
+
+        winners = simulate(elections, ranks)
+        for label, elected in winners.items():
+            # The rule selects the Condorcet winner when it elects it alone
+            selects = (elected.sum(axis=1) == 1) & elected[np.arange(size), condorcet]
+            counts['condorcet_efficiency', label][0] += int((selects & has_winner).sum())
+            counts['condorcet_efficiency', label][1] += int(has_winner.sum())
+        for first, second in pairs:
+            counts['agreement', (first, second)][0] += int((winners[first] == winners[second]).all(axis=1).sum())
+            counts['agreement', (first, second)][1] += size
+
+        estimates = {key:Estimate(*count, confidence) for key, count in counts.items()}
+        if max(estimate.half_width for estimate in estimates.values()) <= precision:
+            break
+
+    results = {'elections': simulated, 'condorcet_winner': estimates['condorcet_winner'],
+               'condorcet_efficiency': {}, 'agreement': {}}
+    for key, estimate in estimates.items():
+        if key != 'condorcet_winner':
+            results[key[0]][key[1]] = estimate
+
+    return results
+
+def estimate_probabilities(cultures, voters, candidates, rules=None, precision=0.005, confidence=0.95,
+                           chunk_size=10_000, max_elections=1_000_000, workers=1, seed=None):
+    """Estimates, for every combination of culture, number of voters and number of candidates,
+    the probability that a Condorcet winner exists, the probability that each rule selects it and
+    the probability that every two rules agree.
+
+    Every cell of the grid simulates elections a chunk at a time, stopping as soon as every
+    confidence interval is narrower than `precision` on each side. Cells run in parallel in a pool
+    of `workers` processes, each with its own random stream spawned from `seed`, so the results
+    do not depend on the number of workers.
+
+    Parameters
+    ----------
+    cultures : dict
+        Maps a label to a generator of elections from `sct.simulation`, or any function called as
+        `culture(elections, voters, candidates, rng=rng)`, such as
+        `functools.partial(mallows, phi=0.5)`. With several workers, generators must be picklable
+        (not lambdas).
+    voters : iterable of int
+        The numbers of voters to simulate.
+    candidates : iterable of int
+        The numbers of candidates to simulate.
+    rules : dict, optional
+        Maps a label to an election class, or a function building an election from `candidates`
+        and `agents`, such as `functools.partial(Copeland, tie_score=1)`. Defaults to Plurality
+        and Borda.
+    precision : float, optional
+        The largest half-width of the confidence intervals at which a cell stops, by default 0.005.
+    confidence : float, optional
+        The confidence level of the intervals, by default 0.95.
+    chunk_size : int, optional
+        The number of elections simulated at once, by default 10,000.
+    max_elections : int, optional
+        The largest number of elections simulated per cell, by default 1,000,000.
+    workers : int, optional
+        The number of processes simulating cells in parallel, by default 1.
+    seed : int or numpy.random.SeedSequence, optional
+        The seed of the simulations.
+
+    Returns
+    -------
+    dict
+        Maps every (culture, voters, candidates) cell to a dictionary holding the number of
+        elections simulated ('elections'), the `Estimate` of the probability of a Condorcet winner
+        ('condorcet_winner'), the estimated probability that each rule elects the Condorcet winner
+        alone when there is one ('condorcet_efficiency', keyed by rule) and the estimated
+        probability that two rules elect the same candidates ('agreement', keyed by pairs of
+        rules).
+
+    Raises
+    ------
+    ValueError
+        If `max_elections` or `chunk_size` is not positive.
+    """
+    if max_elections < 1 or chunk_size < 1:
+        raise ValueError('max_elections and chunk_size must be positive')
+    if rules is None:
+        rules = {'plurality': Plurality, 'borda': Borda}
+
+    cells = list(product(cultures, voters, candidates))
+    seeds = np.random.SeedSequence(seed).spawn(len(cells))
+    arguments = [(cultures[culture], num_voters, num_candidates, rules, precision, confidence, chunk_size,
+                  max_elections, cell_seed) for (culture, num_voters, num_candidates), cell_seed in zip(cells, seeds)]
+
+    if workers > 1 and len(cells) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(cells))) as pool:
+            results = list(pool.map(_run_cell, *zip(*arguments)))
+    else:
+        results = [_run_cell(*args) for args in arguments]
+
+    return dict(zip(cells, results))
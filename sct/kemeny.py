@@ -0,0 +1,215 @@
+import numpy as np
+
+# kemeny_exact allocates several arrays of 2^m entries: 2^25 of them already take gigabytes
+MAX_EXACT_CANDIDATES = 25
+
+def kemeny_agreement(pairwise, ranking):
+    """Counts the votes agreeing with a ranking over all pairs of candidates.
+
+    Parameters
+    ----------
+    pairwise : numpy.ndarray
+        The pairwise majority matrix, where entry `[i, j]` is the number of votes ranking candidate
+        `i` above candidate `j`.
+    ranking : array_like of int
+        Candidate indices from first to last.
+
+    Returns
+    -------
+    float
+        The sum, over every pair ranked `i` above `j`, of the votes ranking `i` above `j`.
+    """
+    ranking = np.asarray(ranking)
+    return np.triu(pairwise[np.ix_(ranking, ranking)], 1).sum()
+
+def kemeny_distance(pairwise, ranking):
+    """Computes the Kemeny score of a ranking: its total Kendall tau distance to the votes.
+
+    Parameters
+    ----------
+    pairwise : numpy.ndarray
+        The pairwise majority matrix.
+    ranking : array_like of int
+        Candidate indices from first to last.
+
+    Returns
+    -------
+    float
+        The sum, over every pair ranked `i` above `j`, of the votes ranking `j` above `i`.
+    """
+    ranking = np.asarray(ranking)
+    return np.tril(pairwise[np.ix_(ranking, ranking)], -1).sum()
+
+def kemeny_exact(pairwise):
+    """Finds an optimal Kemeny ranking by dynamic programming over subsets of candidates.
+
+    The best ranking of every subset placed at the top is built from the best rankings of its
+    subsets with one candidate fewer, processed one subset size at a time with every subset of that
+    size handled in a single vectorized step. Time and memory grow as 2^m, which is practical up to
+    about 20 candidates.
+
+    Parameters
+    ----------
+    pairwise : numpy.ndarray
+        The pairwise majority matrix.
+
+    Returns
+    -------
+    numpy.ndarray
+        Candidate indices of an optimal ranking, from first to last.
+
+    Raises
+    ------
+    ValueError
+        If there are more than `MAX_EXACT_CANDIDATES` (25) candidates.
+    """
+    num_candidates = len(pairwise)
+    if num_candidates > MAX_EXACT_CANDIDATES:
+        raise ValueError(f'kemeny_exact needs 2^m memory and cannot solve more than {MAX_EXACT_CANDIDATES} '
+                         f'candidates ({num_candidates} given)')
+    if num_candidates == 0:
+        return np.array([], dtype=np.int64)
+
+    pairwise = pairwise.astype(np.float64)
+    subsets = np.arange(1 << num_candidates, dtype=np.int64)
+    sizes = np.zeros(len(subsets), dtype=np.int64)
+    for c in range(num_candidates):
+        sizes += (subsets >> c) & 1
+    layers = np.split(np.argsort(sizes, kind='stable'), np.cumsum(np.bincount(sizes))[:-1])
+
+    # Votes for c over the candidates of a subset, looked up in two half-width tables
+    low_bits = num_candidates // 2
+    low_mask = (1 << low_bits) - 1
+    def subset_sums(row):
+        low = np.zeros(1 << low_bits)
+        for j in range(low_bits):
+            low[1 << j:2 << j] = low[:1 << j] + row[j]
+        high = np.zeros(1 << (num_candidates - low_bits))
+        for j in range(num_candidates - low_bits):
+            high[1 << j:2 << j] = high[:1 << j] + row[low_bits + j]
+        return low, high
+    tables = [subset_sums(pairwise[c]) for c in range(num_candidates)]
+    totals = pairwise.sum(axis=1) - np.diag(pairwise)
+
+    # best[S]: highest agreement between the votes and the rankings placing S at the top
+    best = np.full(len(subsets), -np.inf)
+    best[0] = 0
+    choice = np.zeros(len(subsets), dtype=np.int8 if num_candidates < 128 else np.int64)
+
+    for layer in layers[:-1]:
+        for c in range(num_candidates):
+            placed = layer[(layer >> c) & 1 == 0]
+            low, high = tables[c]
+            # c is placed right below `placed`, hence above every candidate not yet placed
+            value = best[placed] + totals[c] - low[placed & low_mask] - high[placed >> low_bits]
+            target = placed | (1 << c)
+            better = value > best[target]
+            best[target[better]] = value[better]
+            choice[target[better]] = c
+
+    ranking = []
+    subset = len(subsets) - 1
+    while subset:
+        c = int(choice[subset])
+        ranking.append(c)
+        subset ^= 1 << c
+
+    return np.array(ranking[::-1], dtype=np.int64)
+
+def kemeny_borda(pairwise):
+    """Ranks candidates by their total pairwise support, the Borda ranking of complete ballots.
+
+    Parameters
+    ----------
+    pairwise : numpy.ndarray
+        The pairwise majority matrix.
+
+    Returns
+    -------
+    numpy.ndarray
+        Candidate indices from first to last.
+    """
+    return np.argsort(-(pairwise.sum(axis=1) - np.diag(pairwise)), kind='stable')
+
+def kemeny_kwiksort(pairwise, rng=None):
+    """Ranks candidates with KwikSort: a quicksort around random pivots where every candidate goes
+    above the pivot when a majority prefers it to the pivot.
+
+    Parameters
+    ----------
+    pairwise : numpy.ndarray
+        The pairwise majority matrix.
+    rng : numpy.random.Generator, optional
+        The source of randomness for choosing pivots.
+
+    Returns
+    -------
+    numpy.ndarray
+        Candidate indices from first to last.
+    """
+    rng = np.random.default_rng(rng)
+    ranking = []
+    stack = [np.arange(len(pairwise))]
+
+    # Iterative quicksort: the stack holds the groups still to sort, the top-ranked group last
+    while stack:
+        group = stack.pop()
+        if len(group) <= 1:
+            ranking.extend(group.tolist())
+            continue
+
+        pivot = group[rng.integers(len(group))]
+        others = group[group != pivot]
+        above = pairwise[others, pivot] > pairwise[pivot, others]
+        stack.extend([others[~above], np.array([pivot]), others[above]])
+
+    return np.array(ranking, dtype=np.int64)
+
+def kemeny_local_search(pairwise, ranking, max_passes=100):
+    """Improves a ranking by moving single candidates to the best position for them, until no
+    single move improves the agreement with the votes.
+
+    For each candidate, the change of agreement for every new position is a cumulative sum over the
+    candidates it would jump over, so trying every position costs one vectorized pass.
+
+    Parameters
+    ----------
+    pairwise : numpy.ndarray
+        The pairwise majority matrix.
+    ranking : array_like of int
+        The candidate indices of the ranking to improve, from first to last.
+    max_passes : int, optional
+        The maximum number of passes over all candidates, by default 100.
+
+    Returns
+    -------
+    numpy.ndarray
+        The improved ranking, from first to last.
+    """
+    ranking = list(np.asarray(ranking).tolist())
+    pairwise = pairwise.astype(np.float64)
+    num_candidates = len(ranking)
+
+    for _ in range(max_passes):
+        improved = False
+        for candidate in list(ranking):
+            i = ranking.index(candidate)
+            order = np.array(ranking)
+            # gain[x]: agreement gained by putting the candidate above x rather than below it
+            gain = pairwise[candidate, order] - pairwise[order, candidate]
+
+            # Moving up to k < i jumps over order[k:i], moving down to k > i over order[i + 1:k + 1]
+            deltas = np.zeros(num_candidates)
+            deltas[:i] = np.cumsum(gain[:i][::-1])[::-1]
+            deltas[i + 1:] = -np.cumsum(gain[i + 1:])
+            target = int(np.argmax(deltas))
+
+            if deltas[target] > 1e-9 * max(1, abs(deltas).max()):
+                ranking.pop(i)
+                ranking.insert(target, candidate)
+                improved = True
+
+        if not improved:
+            break
+
+    return np.array(ranking, dtype=np.int64)
@@ -0,0 +1,889 @@
+from itertools import chain
+from fractions import Fraction
+import math
+import numpy as np
+from sct.agent import Agent
+from sct.candidates import Candidates
+
+def _rank_dtype(num_candidates):
+    """Returns the smallest signed integer dtype able to hold every candidate index and the
+    `-1` sentinel used to pad unranked positions.
+
+    Parameters
+    ----------
+    num_candidates : int
+        The number of candidates in the election.
+
+    Returns
+    -------
+    numpy.dtype
+        The integer dtype used for the rank matrix.
+    """
+    for dtype in (np.int8, np.int16, np.int32):
+        if num_candidates <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+
+    return np.dtype(np.int64)
+
+def _bincount(values, weights, minlength):
+    """Sums the weights of every occurrence of each non-negative integer in `values`.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        The non-negative integers to count.
+    weights : numpy.ndarray or None
+        The weight of each value, or None to count every value once.
+    minlength : int
+        The minimum length of the output.
+
+    Returns
+    -------
+    numpy.ndarray
+        The weighted counts, kept as integers when the weights are integers.
+    """
+    if weights is None:
+        return np.bincount(values, minlength=minlength)
+
+    counts = np.bincount(values, weights=weights, minlength=minlength)
+    if weights.dtype.kind in 'iub':
+        counts = np.rint(counts).astype(np.int64)
+
+    return counts
+
+def _ranking_hashes(ranks):
+    """Hashes every row of a rank matrix to a 64-bit integer; different rows may collide.
+
+    Parameters
+    ----------
+    ranks : numpy.ndarray
+        A (ballots × positions) rank matrix.
+
+    Returns
+    -------
+    numpy.ndarray
+        The hash of every row, as unsigned 64-bit integers.
+    """
+    keys = np.zeros(len(ranks), dtype=np.uint64)
+    for column in np.ascontiguousarray(ranks.T):
+        keys *= np.uint64(0x9E3779B97F4A7C15)
+        keys += (column + 1).astype(np.uint64)
+
+    return keys
+
+def _as_fraction(value):
+    """Converts a weight (an integer, float, fraction or sympy `Rational`) to an exact fraction.
+    Floats are converted to the shortest decimal that prints as them, the number they were
+    written as, so 0.1 is 1/10 rather than the binary value nearest to it."""
+    if isinstance(value, (float, np.floating)):
+        return Fraction(repr(float(value)))
+    if isinstance(value, (int, Fraction, np.integer)):
+        return Fraction(value)
+
+    return Fraction(str(value)) # sympy numbers and decimals print as exact fractions
+
+def _exact_numbers(array):
+    """Converts the fractions of an object array to integers where they are whole, leaving other
+    arrays unchanged."""
+    if array.dtype != object:
+        return array
+
+    whole = lambda x: x.numerator if isinstance(x, Fraction) and x.denominator == 1 else x
+    return np.frompyfunc(whole, 1, 1)(array).astype(object)
+
+def _integer_weights(weights, arithmetic, decimals):
+    """Scales ballot weights to integers over a common denominator, converting every distinct
+    weight once rather than every ballot.
+
+    Parameters
+    ----------
+    weights : numpy.ndarray
+        The weight of each ballot: integers, floats or exact numbers.
+    arithmetic : {'fixed', 'exact'}
+        Whether weights are rounded to `decimals` decimal places or taken exactly.
+    decimals : int
+        The decimal places of 'fixed' arithmetic.
+
+    Returns
+    -------
+    numerators : list of int
+        Every distinct weight scaled to an integer.
+    inverse : numpy.ndarray
+        The index in `numerators` of the weight of each ballot.
+    denominator : int
+        The common denominator of the weights.
+    """
+    values, inverse = np.unique(weights, return_inverse=True)
+    fractions = [_as_fraction(value) for value in values.tolist()]
+
+    if arithmetic == 'fixed':
+        denominator = 10 ** decimals
+        numerators = [round(fraction * denominator) for fraction in fractions]
+    else:
+        denominator = math.lcm(*(fraction.denominator for fraction in fractions)) if fractions else 1
+        numerators = [fraction.numerator * (denominator // fraction.denominator) for fraction in fractions]
+
+    return numerators, inverse.ravel(), denominator
+
+def _exact_tally(profile, tally, arithmetic='exact', decimals=6):
+    """Tallies a profile with exact arithmetic, using only integer array operations per ballot.
+
+    The weights are scaled to integers over a common denominator and split into limbs small
+    enough that every tally of a limb is exact, even where it is accumulated in floats. Each limb
+    is tallied as an ordinary profile with integer weights; only the tallies, whose size does not
+    depend on the number of ballots, are recombined and divided with Python integers and fractions.
+
+    Parameters
+    ----------
+    profile : Profile, ApprovalProfile or ScoreProfile
+        The ballots to tally.
+    tally : callable
+        A tally of the profile that is a weighted sum over its ballots, such as
+        `Profile.pairwise_matrix`.
+    arithmetic : {'fixed', 'exact'}, optional
+        Whether weights are rounded to `decimals` decimal places or taken exactly, by default
+        'exact'.
+    decimals : int, optional
+        The decimal places of 'fixed' arithmetic, by default 6.
+
+    Returns
+    -------
+    numpy.ndarray
+        The tally as an object array of fractions, whole values being integers.
+
+    Raises
+    ------
+    ValueError
+        If the tally is not a whole number of times the weights of the ballots.
+    """
+    numerators, inverse, denominator = _integer_weights(getattr(profile, 'exact_weights', profile.weights),
+                                                        arithmetic, decimals)
+
+    # Tallies multiply weights by small counts (positions, grades); keep every sum below 2**53
+    bits = max(1, 42 - len(inverse).bit_length())
+    limbs = max(1, -(-max((abs(numerator).bit_length() for numerator in numerators), default=0) // bits))
+
+    state = 0
+    for limb in range(limbs):
+        shift, mask = bits * limb, (1 << bits) - 1
+        values = np.array([(abs(x) >> shift & mask) * (1 if x >= 0 else -1) for x in numerators], dtype=np.int64)
+        counts = tally(profile.reweight(values[inverse]).compress())
+        if counts.dtype.kind not in 'iub':
+            raise ValueError('This tally cannot be computed with exact arithmetic')
+        state = state + counts.astype(object) * (1 << shift)
+
+    state = np.asarray(state, dtype=object)
+    return _exact_numbers(np.frompyfunc(Fraction, 2, 1)(state, denominator).astype(object))
+
+class Profile:
+    """Represents a preference profile: every ballot of an election stored as a single contiguous
+    integer rank matrix, together with a weight per ballot.
+
+    Row `b` of the rank matrix is ballot `b`, and column `p` holds the index (into `Candidates.names`)
+    of the candidate ranked at position `p`. Ballots shorter than the widest ballot are padded with
+    `-1`. Storing the electorate this way avoids one Python object per voter and lets election
+    methods tally every ballot with array operations.
+
+    Parameters
+    ----------
+    candidates : Candidates
+        An instance of the `Candidates` class containing the list of candidates.
+    ranks : array_like of int
+        A (ballots × positions) matrix of candidate indices, padded with `-1`. A ballot ranks
+        every candidate at most once, and its padding comes after its last ranked candidate.
+    weights : array_like, optional
+        The weight (number of votes) of each ballot. Defaults to one vote per ballot.
+
+    Raises
+    ------
+    ValueError
+        If the rank matrix refers to unknown candidates, ranks a candidate twice on a ballot or
+        leaves a position unranked before a ranked one.
+
+    Attributes
+    ----------
+    candidates : Candidates
+        The collection of candidates the rank matrix refers to.
+    ranks : numpy.ndarray
+        The contiguous (ballots × positions) rank matrix.
+    weights : numpy.ndarray
+        The weight of each ballot. Weights given as fractions (such as `fractions.Fraction` or
+        sympy `Rational`) are held here as floats.
+    exact_weights : numpy.ndarray
+        The weight of each ballot as given, for exact arithmetic.
+
+    Methods
+    -------
+    from_agents(candidates, agents)
+        Builds a profile from a list of `Agent` instances.
+    from_ragged(candidates, offsets, flat, weights=None)
+        Builds a profile from ballots stored back to back in a flat array.
+    to_ragged()
+        Returns the ballots back to back in a flat array, with the offset of each ballot.
+    concatenate(profiles)
+        Stacks several profiles over the same candidates into one.
+    compress()
+        Collapses identical ballots into unique rankings weighted by their multiplicity.
+    remap(mapping)
+        Translates the rank matrix after candidates were added or removed.
+    position_counts()
+        Counts how many ballots rank each candidate at each position.
+    position_counts_at(position)
+        Counts the votes ranking each candidate at a single position.
+    length_counts()
+        Counts the votes ranking each candidate, by length of the ballot.
+    plurality_scores()
+        Counts the first preferences of every candidate.
+    borda_scores()
+        Computes the Borda score of every candidate.
+    positions()
+        Computes the position of every candidate on every ballot.
+    pairwise_matrix()
+        Counts, for every pair of candidates, the votes preferring one to the other.
+    """
+    def __init__(self, candidates: Candidates, ranks, weights=None):
+        num_candidates = len(candidates.names)
+        ranks = np.asarray(ranks)
+
+        if ranks.ndim == 1:
+            ranks = ranks.reshape(-1, 1) if ranks.size else ranks.reshape(0, 0)
+        if ranks.ndim != 2:
+            raise ValueError('The rank matrix must be two-dimensional (ballots × positions)')
+        if ranks.size and (ranks.min() < -1 or ranks.max() >= num_candidates):
+            raise ValueError('The rank matrix refers to candidates that are not in the election')
+        if ranks.shape[1] > 1:
+            ranked = ranks >= 0
+            if (ranked[:, 1:] & ~ranked[:, :-1]).any():
+                raise ValueError('Unranked positions (-1) must come after the ranked candidates of every ballot')
+            ordered = np.sort(ranks, axis=1)
+            if ((ordered[:, 1:] == ordered[:, :-1]) & (ordered[:, 1:] >= 0)).any():
+                raise ValueError('A ballot ranks the same candidate more than once')
+
+        self._assign(candidates, ranks, weights)
+
+    @classmethod
+    def _derived(cls, candidates: Candidates, ranks, weights=None):
+        """Builds a profile from a rank matrix derived from valid profiles (a selection, a
+        compression, a remapping), skipping the checks of its ballots."""
+        profile = cls.__new__(cls)
+        profile._assign(candidates, np.asarray(ranks), weights)
+
+        return profile
+
+    def _assign(self, candidates, ranks, weights):
+        """Stores the rank matrix and the weights, with the flags tallies rely on."""
+        num_candidates = len(candidates.names)
+        if weights is None:
+            weights = np.ones(ranks.shape[0], dtype=np.int64)
+        weights = np.asarray(weights)
+        if weights.shape != (ranks.shape[0],):
+            raise ValueError('Please provide exactly one weight per ballot')
+
+        # Weights given as fractions (or other exact numbers) are tallied as floats, and kept as
+        # given for exact arithmetic
+        self._exact_weights = None
+        if weights.dtype == object:
+            self._exact_weights = weights
+            weights = weights.astype(np.float64)
+
+        self.candidates = candidates
+        self.ranks = np.ascontiguousarray(ranks, dtype=_rank_dtype(num_candidates))
+        self.weights = weights
+        # Tallies skip the weighted reduction entirely when every ballot counts once,
+        # and skip masking out padding when every ballot is complete
+        self._unit_weights = bool((weights == 1).all())
+        self._complete = not ranks.size or ranks.min() >= 0
+        self._compressed = False
+        # Tallies shared by every election over this profile, and its compressed form
+        self._tallies = {}
+        # The candidate indices are those of this version of the candidates
+        self._version = candidates.version
+
+    @classmethod
+    def from_agents(cls, candidates: Candidates, agents: list):
+        """Builds a profile from a list of agents.
+
+        Parameters
+        ----------
+        candidates : Candidates
+            An instance of the `Candidates` class containing the list of candidates.
+        agents : list of Agent
+            A list of `Agent` instances representing the voters in the election.
+
+        Returns
+        -------
+        Profile
+            The profile holding every agent's ranking and number of votes.
+
+        Raises
+        ------
+        ValueError
+            If an agent ranks a candidate that is not in the election, or the same candidate twice.
+        """
+        lengths = np.fromiter((len(agent._choices) for agent in agents), dtype=np.int64, count=len(agents))
+        offsets = np.zeros(len(agents) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+
+        # Agents store their choices as ids into the table of names shared by every agent: join
+        # their arrays into one buffer and translate the ids into candidate indices in one lookup
+        if all(agent._choices.typecode == 'H' for agent in agents):
+            ids = np.frombuffer(b''.join(agent._choices for agent in agents), dtype=np.uint16)
+        else:
+            ids = np.fromiter(chain.from_iterable(agent._choices for agent in agents), dtype=np.int64,
+                              count=int(offsets[-1]))
+
+        # The table of names only grows, so only the ids these agents use are looked up: two-byte
+        # ids index a lookup of at most 65,536 entries, wider ids are numbered by sorting them
+        if ids.dtype == np.uint16:
+            present = np.flatnonzero(np.bincount(ids))
+            slots, keys = present, ids
+        else:
+            present, keys = np.unique(ids, return_inverse=True)
+            slots, keys = np.arange(len(present)), keys.ravel()
+        lookup = np.full(int(slots[-1]) + 1 if len(slots) else 0, -1, dtype=np.int64)
+        lookup[slots] = [candidates.index.get(Agent._names[id], -1) for id in present.tolist()]
+
+        flat = lookup[keys]
+        unknown = np.flatnonzero(flat < 0)
+        if unknown.size:
+            raise ValueError(f'{Agent._names[ids[unknown[0]]]!r} is not a candidate in this election')
+
+        weights = np.array([agent.num_votes for agent in agents])
+        if not len(agents):
+            weights = weights.astype(np.int64)
+
+        return cls.from_ragged(candidates, offsets, flat, weights)
+
+    @classmethod
+    def from_ragged(cls, candidates: Candidates, offsets, flat, weights=None):
+        """Builds a profile from ballots of different lengths stored back to back, in the
+        compressed sparse row layout: ballot `b` is `flat[offsets[b]:offsets[b + 1]]`.
+
+        The rank matrix is only as wide as the longest ballot, so ballots ranking a few of many
+        candidates take a few positions each.
+
+        Parameters
+        ----------
+        candidates : Candidates
+            An instance of the `Candidates` class containing the list of candidates.
+        offsets : array_like of int
+            The start of every ballot in `flat`, followed by the end of the last ballot.
+        flat : array_like of int
+            The candidate indices of every ballot, from most to least preferred, back to back.
+        weights : array_like, optional
+            The weight of each ballot. Defaults to one vote per ballot.
+
+        Returns
+        -------
+        Profile
+            The profile holding the ballots.
+
+        Raises
+        ------
+        ValueError
+            If the offsets are not non-decreasing from 0 to the length of `flat`.
+        """
+        offsets = np.asarray(offsets, dtype=np.int64)
+        flat = np.asarray(flat)
+        lengths = np.diff(offsets)
+
+        if not len(offsets) or offsets[0] != 0 or offsets[-1] != len(flat) or (lengths < 0).any():
+            raise ValueError('The offsets must go from 0 to the number of ranked candidates without decreasing')
+
+        width = int(lengths.max()) if len(lengths) else 0
+        ranks = np.full((len(lengths), width), -1, dtype=_rank_dtype(len(candidates.names)))
+        ranks[np.arange(width) < lengths[:, None]] = flat
+
+        return cls(candidates, ranks, weights)
+
+    def to_ragged(self):
+        """Returns the ballots back to back in a flat array, without padding.
+
+        Returns
+        -------
+        offsets : numpy.ndarray
+            The start of every ballot in `flat`, followed by the end of the last ballot.
+        flat : numpy.ndarray
+            The candidate indices of every ballot, from most to least preferred, back to back.
+        """
+        offsets = np.zeros(self.num_ballots + 1, dtype=np.int64)
+        np.cumsum(self.lengths, out=offsets[1:])
+
+        return offsets, self.ranks[self.ranks >= 0]
+
+    @classmethod
+    def concatenate(cls, profiles: list):
+        """Stacks several profiles over the same candidates into a single profile.
+
+        Parameters
+        ----------
+        profiles : list of Profile
+            The profiles to stack, in order. They must share the same candidates.
+
+        Returns
+        -------
+        Profile
+            The profile holding the ballots of every profile.
+        """
+        candidates = profiles[0].candidates
+        width = max(profile.ranks.shape[1] for profile in profiles)
+        ranks = np.full((sum(len(profile) for profile in profiles), width), -1,
+                        dtype=_rank_dtype(len(candidates.names)))
+
+        start = 0
+        for profile in profiles:
+            ranks[start:start + len(profile), :profile.ranks.shape[1]] = profile.ranks
+            start += len(profile)
+
+        weights = np.concatenate([profile.exact_weights for profile in profiles])
+
+        return cls._derived(candidates, ranks, weights)
+
+    @property
+    def num_ballots(self):
+        """int : The number of ballots (rows) in the profile."""
+        return self.ranks.shape[0]
+
+    @property
+    def num_candidates(self):
+        """int : The number of candidates in the election."""
+        return len(self.candidates.names)
+
+    @property
+    def exact_weights(self):
+        """numpy.ndarray : The weight of each ballot as given, fractions included."""
+        return self.weights if self._exact_weights is None else self._exact_weights
+
+    def __len__(self):
+        return self.num_ballots
+
+    def __getitem__(self, ballots):
+        """Returns the profile holding only the selected ballots (a slice, mask or index array)."""
+        return Profile._derived(self.candidates, self.ranks[ballots], self.exact_weights[ballots])
+
+    def reweight(self, weights):
+        """Returns a profile with the same ballots and new weights.
+
+        Parameters
+        ----------
+        weights : array_like
+            The new weight of each ballot.
+
+        Returns
+        -------
+        Profile
+            The reweighted profile.
+        """
+        return Profile._derived(self.candidates, self.ranks, weights)
+
+    def remap(self, mapping, candidates=None):
+        """Translates the rank matrix to new candidate indices, after a candidate was added to or
+        removed from the candidates of the profile.
+
+        Ballots are translated with a single lookup in `mapping`; a removed candidate is dropped
+        from every ballot, the candidates ranked below it moving up one position.
+
+        Parameters
+        ----------
+        mapping : array_like of int
+            The new index of every candidate, indexed by its old index, with -1 for removed
+            candidates, as returned by `Candidates.add_candidate` or `Candidates.remove_candidate`.
+        candidates : Candidates, optional
+            The candidates after the change, by default the candidates of the profile, changed in
+            place.
+
+        Returns
+        -------
+        Profile
+            The profile with the same ballots and weights over the new candidate indices.
+        """
+        # The padding -1 looks up the -1 appended after the mapping
+        lookup = np.append(np.asarray(mapping, dtype=np.int64), -1)
+        ranks = lookup[self.ranks]
+
+        if (lookup[:-1] < 0).any():
+            # Shift the remaining candidates of every ballot left over the removed ones
+            order = np.argsort(ranks < 0, axis=1, kind='stable')
+            ranks = np.take_along_axis(ranks, order, axis=1)
+            ranks = ranks[:, :int((ranks >= 0).sum(axis=1).max(initial=0))]
+
+        profile = Profile._derived(self.candidates if candidates is None else candidates, ranks, self.exact_weights)
+        profile._version = self._version + 1
+
+        return profile
+
+    @property
+    def lengths(self):
+        """numpy.ndarray : The number of candidates ranked on each ballot."""
+        return (self.ranks >= 0).sum(axis=1)
+
+    def compress(self):
+        """Collapses identical ballots into unique rankings whose weight is the total weight
+        of the ballots sharing that ranking.
+
+        Every ballot is encoded as a single integer (its ranking read as a number in base
+        `candidates + 1`), so grouping identical ballots is a counting problem rather than a
+        comparison of rows. Rankings too long for an exact 62-bit code are grouped by a 64-bit
+        hash instead, falling back to sorting whole rows if two different rankings collide.
+        With few candidates the number of distinct rankings is tiny, and every tally over the
+        compressed profile touches one row per ranking instead of one per voter.
+
+        Returns
+        -------
+        Profile
+            A profile with one row per distinct ranking. Tallies over it give the same results
+            as tallies over the original profile. Rankings whose weights cancel out are dropped.
+            Fractional weights are added up as floats.
+        """
+        if self._compressed:
+            return self
+
+        return self._shared('compressed', self._compress)
+
+    def _compress(self):
+        """Collapses identical ballots; see `compress`."""
+        base = self.num_candidates + 1
+        width = self.ranks.shape[1]
+
+        if width * np.log2(max(base, 2)) < 62:
+            keys = np.zeros(self.num_ballots, dtype=np.int64)
+            for column in self.ranks.T:
+                keys = keys * base + (column + 1)
+
+            if base ** width <= 1 << 22:
+                # Small key space: count every possible ranking directly, no sorting needed
+                totals = _bincount(keys, self._weights_or_none(), base ** width)
+                unique = np.flatnonzero(totals)
+                totals = totals[unique]
+            else:
+                unique, inverse = np.unique(keys, return_inverse=True)
+                totals = _bincount(inverse, self._weights_or_none(), len(unique))
+                unique, totals = unique[totals != 0], totals[totals != 0]
+
+            # Decode the unique keys back into rankings
+            ranks = np.empty((len(unique), width), dtype=self.ranks.dtype)
+            for position in range(width - 1, -1, -1):
+                unique, digit = np.divmod(unique, base)
+                ranks[:, position] = digit - 1
+        else:
+            # Rankings too long for an exact key: group them by a 64-bit hash, which is much
+            # faster to sort than whole rows, and check that no two rankings share a hash
+            _, first, inverse = np.unique(_ranking_hashes(self.ranks), return_index=True, return_inverse=True)
+            ranks = self.ranks[first]
+
+            # Only ballots grouped with an earlier ballot need comparing with it
+            grouped = np.flatnonzero(first[inverse] != np.arange(self.num_ballots))
+            if not (self.ranks[grouped] == ranks[inverse[grouped]]).all():
+                ranks, inverse = np.unique(self.ranks, axis=0, return_inverse=True)
+
+            totals = _bincount(inverse.ravel(), self._weights_or_none(), len(ranks))
+            ranks, totals = ranks[totals != 0], totals[totals != 0]
+
+        profile = Profile._derived(self.candidates, ranks, totals)
+        profile._compressed = True
+
+        return profile
+
+    def _shared(self, key, compute):
+        """Returns a value derived from the ballots and cached on the profile, computing it first
+        if needed, so that every election over the same profile computes it only once.
+
+        Profiles are not modified after construction, which keeps the cached values valid.
+
+        Parameters
+        ----------
+        key : hashable
+            The name of the value, with the parameters it depends on.
+        compute : callable
+            A function without arguments computing the value.
+
+        Returns
+        -------
+        object
+            The cached value.
+        """
+        if key not in self._tallies:
+            self._tallies[key] = compute()
+
+        return self._tallies[key]
+
+    def _weights_or_none(self):
+        """Returns the ballot weights, or None when every ballot counts once."""
+        return None if self._unit_weights else self.weights
+
+    def position_counts(self, positions=None):
+        """Counts how many votes rank each candidate at each position, multiplying every
+        ballot by its weight.
+
+        Parameters
+        ----------
+        positions : iterable of int, optional
+            The positions to count, the others being left at zero. Defaults to every position.
+
+        Returns
+        -------
+        numpy.ndarray
+            A (candidates × candidates) matrix where entry `[c, p]` is the number of votes
+            ranking candidate `c` at position `p`.
+        """
+        num_candidates = self.num_candidates
+        width = self.ranks.shape[1]
+        weights = self._weights_or_none()
+        dtype = np.int64 if weights is None or weights.dtype.kind in 'iub' else np.float64
+        counts = np.zeros((num_candidates, num_candidates), dtype=dtype)
+
+        if positions is None:
+            positions = range(width)
+
+        # One bincount per position: the number of positions is tiny compared to the number of ballots
+        for position in positions:
+            if position < width:
+                counts[:, position] = self.position_counts_at(position)
+
+        return counts
+
+    def plurality_scores(self):
+        """Counts the first preferences of every candidate, weighted by the number of votes
+        of each ballot.
+
+        Returns
+        -------
+        numpy.ndarray
+            The number of first-preference votes of each candidate, indexed like `Candidates.names`.
+        """
+        if not self.ranks.shape[1]:
+            return np.zeros(self.num_candidates, dtype=self.weights.dtype)
+
+        return self.position_counts_at(0)
+
+    def position_counts_at(self, position):
+        """Counts the votes ranking each candidate at a single position.
+
+        Parameters
+        ----------
+        position : int
+            The position (0 for first preferences) to count.
+
+        Returns
+        -------
+        numpy.ndarray
+            The number of votes ranking each candidate at `position`.
+        """
+        column = self.ranks[:, position]
+        weights = self._weights_or_none()
+
+        if not self._complete:
+            valid = column >= 0
+            column = column[valid]
+            weights = None if weights is None else weights[valid]
+
+        return _bincount(column, weights, self.num_candidates)
+
+    def length_counts(self):
+        """Counts the votes ranking each candidate, split by the number of candidates ranked on
+        the ballot. Conventions scoring truncated ballots by their length derive from it.
+
+        Returns
+        -------
+        numpy.ndarray
+            A (candidates × (candidates + 1)) matrix where entry `[c, k]` is the number of votes
+            of ballots ranking `k` candidates, `c` among them.
+        """
+        num_candidates = self.num_candidates
+        weights = self._weights_or_none()
+
+        if self._complete:
+            # Every ballot ranks the same number of candidates, so a single column is filled
+            width = self.ranks.shape[1]
+            ranked = _bincount(self.ranks.ravel(), None if weights is None else np.repeat(weights, width), num_candidates)
+            counts = np.zeros((num_candidates, num_candidates + 1), dtype=ranked.dtype)
+            counts[:, width] = ranked
+            return counts
+
+        valid = self.ranks >= 0
+        keys = self.ranks.astype(np.int64) * (num_candidates + 1) + self.lengths[:, None]
+        counts = _bincount(keys[valid], None if weights is None else np.broadcast_to(weights[:, None], valid.shape)[valid],
+                           num_candidates * (num_candidates + 1))
+
+        return counts.reshape(num_candidates, num_candidates + 1)
+
+    def borda_scores(self):
+        """Computes the Borda score of every candidate.
+
+        A ballot ranking `k` candidates gives `k - 1` points to its first choice, `k - 2` to its
+        second choice and so on down to 0 for its last choice, multiplied by its weight. This is
+        the 'ballot_length' convention of `Borda`.
+
+        Returns
+        -------
+        numpy.ndarray
+            The Borda score of each candidate, indexed like `Candidates.names`.
+        """
+        width = self.ranks.shape[1]
+
+        if self._complete:
+            # Ballots of equal length all share the same score vector: one matrix-vector product
+            points = np.zeros(self.num_candidates, dtype=np.int64)
+            points[:width] = np.arange(width - 1, -1, -1)
+            return self.position_counts() @ points
+
+        valid = self.ranks >= 0
+        points = (self.lengths[:, None] - 1 - np.arange(width)) * self.weights[:, None]
+
+        return _bincount(self.ranks[valid], points[valid], self.num_candidates)
+
+    def positions(self):
+        """Computes the position of every candidate on every ballot, the inverse of the rank matrix.
+
+        Returns
+        -------
+        numpy.ndarray
+            A (ballots × candidates) matrix where entry `[b, c]` is the position of candidate `c`
+            on ballot `b`. Candidates left unranked by a ballot all share the position equal to
+            the width of the rank matrix, after every ranked position.
+        """
+        width = self.ranks.shape[1]
+        positions = np.full((self.num_ballots, self.num_candidates), width, dtype=self.ranks.dtype)
+
+        if self._complete:
+            positions[np.arange(self.num_ballots)[:, None], self.ranks] = np.arange(width)
+        else:
+            ballots, places = np.nonzero(self.ranks >= 0)
+            positions[ballots, self.ranks[ballots, places]] = places
+
+        return positions
+
+    def pairwise_matrix(self, chunk_size=None):
+        """Counts, for every ordered pair of candidates, the votes preferring the first to the second.
+
+        A ranked candidate is preferred to every candidate its ballot leaves unranked, and
+        candidates left unranked by the same ballot are not compared. The matrix is computed in a
+        single pass over the ballots, in chunks to bound memory.
+
+        Parameters
+        ----------
+        chunk_size : int, optional
+            The number of ballots processed at once. Defaults to a size keeping the temporary
+            comparison arrays around a few megabytes.
+
+        Returns
+        -------
+        numpy.ndarray
+            A (candidates × candidates) matrix where entry `[i, j]` is the number of votes
+            ranking candidate `i` above candidate `j`.
+        """
+        num_candidates = self.num_candidates
+        weights = self.weights
+        matrix = np.zeros((num_candidates, num_candidates), dtype=weights.dtype if weights.dtype.kind == 'f' else np.int64)
+
+        if chunk_size is None:
+            chunk_size = max(1, (1 << 22) // max(num_candidates, 1))
+
+        for start in range(0, self.num_ballots, chunk_size):
+            chunk = self[start:start + chunk_size]
+            positions = chunk.positions()
+            chunk_weights = chunk.weights
+
+            for candidate in range(num_candidates):
+                matrix[candidate] += chunk_weights @ (positions[:, candidate, None] < positions)
+
+        return matrix
+
+def _batch_positions(ranks, num_candidates):
+    """Computes the position of every candidate on every ballot of a batch of elections.
+
+    Parameters
+    ----------
+    ranks : numpy.ndarray
+        An (elections × ballots × positions) tensor of candidate indices, padded with `-1`.
+    num_candidates : int
+        The number of candidates in every election.
+
+    Returns
+    -------
+    numpy.ndarray
+        An (elections × ballots × candidates) tensor of positions, unranked candidates sharing the
+        position after the last one.
+    """
+    width = ranks.shape[-1]
+    positions = np.full(ranks.shape[:-1] + (num_candidates,), width, dtype=_rank_dtype(max(num_candidates, width)))
+    elections, ballots, places = np.nonzero(ranks >= 0)
+    positions[elections, ballots, ranks[elections, ballots, places]] = places
+
+    return positions
+
+def _batch_position_counts(ranks, num_candidates):
+    """Counts the ballots ranking each candidate at each position, for a batch of elections, with
+    a single bincount over the whole tensor.
+
+    Parameters
+    ----------
+    ranks : numpy.ndarray
+        An (elections × ballots × positions) tensor of candidate indices, padded with `-1`.
+    num_candidates : int
+        The number of candidates in every election.
+
+    Returns
+    -------
+    numpy.ndarray
+        An (elections × candidates × candidates) tensor where entry `[e, c, p]` is the number of
+        ballots of election `e` ranking candidate `c` at position `p`.
+    """
+    num_elections, _, width = ranks.shape
+    keys = (np.arange(num_elections)[:, None, None] * num_candidates + ranks.astype(np.int64)) * num_candidates
+    keys = keys + np.arange(width)
+
+    counts = np.bincount(keys[ranks >= 0], minlength=num_elections * num_candidates * num_candidates)
+
+    return counts.reshape(num_elections, num_candidates, num_candidates)
+
+def _batch_length_counts(ranks, num_candidates):
+    """Counts the ballots ranking each candidate, by length of the ballot, for a batch of
+    elections, with a single bincount over the whole tensor.
+
+    Parameters
+    ----------
+    ranks : numpy.ndarray
+        An (elections × ballots × positions) tensor of candidate indices, padded with `-1`.
+    num_candidates : int
+        The number of candidates in every election.
+
+    Returns
+    -------
+    numpy.ndarray
+        An (elections × candidates × (candidates + 1)) tensor where entry `[e, c, k]` is the
+        number of ballots of election `e` ranking `k` candidates, `c` among them.
+    """
+    num_elections = len(ranks)
+    ranked = ranks >= 0
+    keys = (np.arange(num_elections)[:, None, None] * num_candidates + ranks.astype(np.int64)) * (num_candidates + 1)
+    keys = keys + ranked.sum(axis=-1, keepdims=True)
+
+    counts = np.bincount(keys[ranked], minlength=num_elections * num_candidates * (num_candidates + 1))
+
+    return counts.reshape(num_elections, num_candidates, num_candidates + 1)
+
+def _batch_pairwise(ranks, num_candidates):
+    """Computes the pairwise majority matrix of every election of a batch.
+
+    Parameters
+    ----------
+    ranks : numpy.ndarray
+        An (elections × ballots × positions) tensor of candidate indices, padded with `-1`.
+    num_candidates : int
+        The number of candidates in every election.
+
+    Returns
+    -------
+    numpy.ndarray
+        An (elections × candidates × candidates) tensor where entry `[e, i, j]` is the number of
+        ballots of election `e` ranking candidate `i` above candidate `j`.
+    """
+    positions = _batch_positions(ranks, num_candidates)
+    matrix = np.empty((len(ranks), num_candidates, num_candidates), dtype=np.int64)
+
+    # One candidate at a time keeps the temporary comparisons at the size of the positions
+    for candidate in range(num_candidates):
+        matrix[:, candidate] = (positions[:, :, candidate, None] < positions).sum(axis=1)
+
+    return matrix
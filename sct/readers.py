@@ -0,0 +1,224 @@
+import csv
+import numpy as np
+from sct.candidates import Candidates
+from sct.profile import Profile, _rank_dtype
+
+class _ChunkBuilder:
+    """Accumulates ballots given as lists of candidate indices into fixed-size profile chunks,
+    so that at most one chunk of ballots is held in memory at a time.
+
+    Parameters
+    ----------
+    candidates : Candidates
+        The candidates the ballots refer to.
+    chunk_size : int
+        The number of ballots per chunk.
+    """
+    def __init__(self, candidates: Candidates, chunk_size: int):
+        self.candidates = candidates
+        self.chunk_size = chunk_size
+        self.width = len(candidates.names)
+        self._reset()
+
+    def _reset(self):
+        self.ranks = np.full((self.chunk_size, self.width), -1, dtype=_rank_dtype(self.width))
+        self.weights = np.empty(self.chunk_size, dtype=np.float64)
+        self.integral = True
+        self.size = 0
+
+    def add(self, ballot, weight):
+        """Adds a ballot, returning a full chunk when one is complete and None otherwise."""
+        self.ranks[self.size, :len(ballot)] = ballot
+        self.weights[self.size] = weight
+        self.integral = self.integral and float(weight).is_integer()
+        self.size += 1
+
+        if self.size == self.chunk_size:
+            return self.flush()
+
+        return None
+
+    def flush(self):
+        """Returns the ballots accumulated so far as a profile, or None if there are none."""
+        if not self.size:
+            return None
+
+        # Trim the chunk to the widest ballot it actually holds
+        ranks = self.ranks[:self.size]
+        width = int((ranks >= 0).sum(axis=1).max())
+        weights = self.weights[:self.size]
+        if self.integral:
+            weights = weights.astype(np.int64)
+
+        profile = Profile(self.candidates, ranks[:, :width].copy(), weights)
+        self._reset()
+
+        return profile
+
+def read_csv(path, candidates: Candidates, chunk_size=100_000, weighted=False, delimiter=','):
+    """Reads ranked ballots from a CSV file, yielding them as profile chunks.
+
+    Every row is a ballot listing candidate names from most to least preferred. Empty fields are
+    ignored, so a ballot may rank only some of the candidates. Ballots are parsed straight into
+    rank matrices, without creating an `Agent` per row, and only one chunk is held in memory.
+
+    Parameters
+    ----------
+    path : str or path-like
+        The path of the CSV file.
+    candidates : Candidates
+        The candidates the ballots refer to.
+    chunk_size : int, optional
+        The number of ballots per chunk, by default 100,000.
+    weighted : bool, optional
+        Whether the first field of every row is the weight (number of votes) of the ballot,
+        by default False.
+    delimiter : str, optional
+        The field delimiter, by default ','.
+
+    Yields
+    ------
+    Profile
+        The ballots of the file, `chunk_size` at a time.
+
+    Raises
+    ------
+    ValueError
+        If a ballot ranks a candidate that is not in the election, or the same candidate twice.
+    """
+    index = candidates.index
+    builder = _ChunkBuilder(candidates, chunk_size)
+
+    with open(path, newline='') as file:
+        for line, row in enumerate(csv.reader(file, delimiter=delimiter), start=1):
+            weight = 1
+            if weighted and row:
+                weight = float(row[0])
+                row = row[1:]
+
+            try:
+                ballot = [index[name.strip().lower()] for name in row if name.strip()]
+            except KeyError as error:
+                raise ValueError(f'line {line}: {error.args[0]!r} is not a candidate in this election') from None
+            if len(set(ballot)) != len(ballot):
+                repeated = next(c for i, c in enumerate(ballot) if c in ballot[:i])
+                raise ValueError(f'line {line}: {candidates.names[repeated]!r} is ranked more than once')
+
+            if not ballot:
+                continue
+
+            chunk = builder.add(ballot, weight)
+            if chunk is not None:
+                yield chunk
+
+    chunk = builder.flush()
+    if chunk is not None:
+        yield chunk
+
+def _parse_preflib_ballot(text, line):
+    """Parses a PrefLib ranking such as `3,1,{2,4}` into a list of alternative ids.
+
+    A group of tied alternatives is only supported as the last group of the ranking, where it
+    means the same as leaving those alternatives unranked.
+    """
+    ballot = []
+    groups = text.replace(' ', '').split('{')
+    for i, group in enumerate(groups):
+        if i == 0:
+            ballot.extend(int(x) for x in group.split(',') if x)
+            continue
+
+        tied, _, rest = group.partition('}')
+        rest = [int(x) for x in rest.split(',') if x]
+        if rest or i != len(groups) - 1:
+            raise ValueError(f'line {line}: ties between ranked alternatives are not supported')
+        if ',' not in tied:
+            ballot.append(int(tied)) # A single alternative in braces is not a tie
+
+    if len(set(ballot)) != len(ballot):
+        repeated = next(x for i, x in enumerate(ballot) if x in ballot[:i])
+        raise ValueError(f'line {line}: alternative {repeated} is ranked more than once')
+
+    return ballot
+
+def read_preflib(path, chunk_size=100_000):
+    """Reads a PrefLib `.soc`, `.soi` or `.toc` file, yielding its ballots as profile chunks.
+
+    Both the current PrefLib format (with `#` metadata lines) and the legacy format (with the
+    alternatives listed on the first lines) are supported. Ballots are parsed straight into rank
+    matrices and only one chunk is held in memory, whatever the size of the file. In `.toc` files,
+    alternatives tied in last position are treated as unranked; other ties are not supported.
+
+    Parameters
+    ----------
+    path : str or path-like
+        The path of the PrefLib file.
+    chunk_size : int, optional
+        The number of ballots per chunk, by default 100,000.
+
+    Yields
+    ------
+    Profile
+        The ballots of the file, `chunk_size` at a time. Every chunk refers to the same
+        `Candidates`, built from the alternative names of the file.
+
+    Raises
+    ------
+    ValueError
+        If the file is malformed, ranks an alternative twice or contains ties the package cannot
+        represent.
+    """
+    with open(path) as file:
+        first = file.readline()
+        names = {}
+
+        if first.startswith('#'):
+            header, line = first, 0
+            while header.startswith('#'):
+                key, _, value = header[1:].partition(':')
+                if key.strip().upper().startswith('ALTERNATIVE NAME'):
+                    names[int(key.split()[-1])] = value.strip()
+                position = file.tell()
+                header = file.readline()
+                line += 1
+            file.seek(position)
+        else:
+            for _ in range(int(first)):
+                alternative, _, name = file.readline().partition(',')
+                names[int(alternative)] = name.strip()
+            file.readline() # Number of voters, sum of votes and number of unique orders
+            line = len(names) + 2
+
+        if not names:
+            raise ValueError('The file does not name its alternatives')
+
+        candidates = Candidates(list(names.values()))
+        ids = {alternative:candidates.index[name.lower()] for alternative, name in names.items()}
+        builder = _ChunkBuilder(candidates, chunk_size)
+
+        for line, text in enumerate(file, start=line + 1):
+            text = text.strip()
+            if not text or text.startswith('#'):
+                continue
+
+            # Current format: "count: ranking", legacy format: "count,ranking"
+            if ':' in text:
+                count, _, ranking = text.partition(':')
+            else:
+                count, _, ranking = text.partition(',')
+
+            try:
+                ballot = [ids[alternative] for alternative in _parse_preflib_ballot(ranking, line)]
+            except KeyError as error:
+                raise ValueError(f'line {line}: unknown alternative {error.args[0]}') from None
+
+            if not ballot:
+                continue
+
+            chunk = builder.add(ballot, float(count))
+            if chunk is not None:
+                yield chunk
+
+    chunk = builder.flush()
+    if chunk is not None:
+        yield chunk
@@ -0,0 +1,268 @@
+import math
+import numpy as np
+from sct.profile import _rank_dtype
+
+def impartial_culture(num_elections, num_voters, num_candidates, rng=None):
+    """Generates elections where every voter draws a ranking uniformly at random, independently
+    of the other voters (impartial culture).
+
+    Parameters
+    ----------
+    num_elections : int
+        The number of elections to generate.
+    num_voters : int
+        The number of voters in every election.
+    num_candidates : int
+        The number of candidates in every election.
+    rng : numpy.random.Generator or int, optional
+        The source of randomness, or a seed for one.
+
+    Returns
+    -------
+    numpy.ndarray
+        An (elections × voters × positions) tensor of candidate indices: entry `[e, v, p]` is the
+        candidate that voter `v` of election `e` ranks at position `p`.
+    """
+    rng = np.random.default_rng(rng)
+    identity = np.broadcast_to(np.arange(num_candidates, dtype=_rank_dtype(num_candidates)),
+                               (num_elections, num_voters, num_candidates))
+
+    return rng.permuted(identity, axis=-1)
+
+def urn(num_elections, num_voters, num_candidates, alpha, rng=None):
+    """Generates elections under the Pólya–Eggenberger urn model.
+
+    The urn starts with one ball per ranking. Every voter draws a ball, adopts its ranking and
+    returns it with `alpha` times the number of rankings further copies of it, so that voters
+    tend to copy the rankings already drawn. An alpha of 0 is impartial culture.
+
+    Voter `i` draws one of the original balls with probability `1 / (1 + i * alpha)`, and
+    otherwise copies a previous voter chosen uniformly. Every voter first picks the voter it
+    copies (itself for an original ball), and the chains of copies are then resolved for every
+    voter at once by pointer jumping, in a logarithmic number of vectorized steps.
+
+    Parameters
+    ----------
+    num_elections : int
+        The number of elections to generate.
+    num_voters : int
+        The number of voters in every election.
+    num_candidates : int
+        The number of candidates in every election.
+    alpha : float
+        The copies returned to the urn after every draw, relative to the number of rankings.
+    rng : numpy.random.Generator or int, optional
+        The source of randomness, or a seed for one.
+
+    Returns
+    -------
+    numpy.ndarray
+        An (elections × voters × positions) tensor of candidate indices.
+    """
+    rng = np.random.default_rng(rng)
+    fresh = impartial_culture(num_elections, num_voters, num_candidates, rng)
+
+    voters = np.arange(num_voters)
+    original = rng.random((num_elections, num_voters)) * (1 + voters * alpha) < 1
+    copied = (rng.random((num_elections, num_voters)) * voters).astype(np.int64)
+    source = np.where(original, voters, copied)
+
+    # Follow the chains of copies until every voter points to an original draw
+    while True:
+        jumped = np.take_along_axis(source, source, axis=1)
+        if np.array_equal(jumped, source):
+            break
+        source = jumped
+
+    return np.take_along_axis(fresh, source[:, :, None], axis=1)
+
+def impartial_anonymous_culture(num_elections, num_voters, num_candidates, rng=None):
+    """Generates elections under impartial anonymous culture, where every anonymous profile (the
+    number of voters casting each ranking) is equally likely.
+
+    This is the urn model returning a single copy of every ball drawn.
+
+    Parameters
+    ----------
+    num_elections : int
+        The number of elections to generate.
+    num_voters : int
+        The number of voters in every election.
+    num_candidates : int
+        The number of candidates in every election.
+    rng : numpy.random.Generator or int, optional
+        The source of randomness, or a seed for one.
+
+    Returns
+    -------
+    numpy.ndarray
+        An (elections × voters × positions) tensor of candidate indices.
+    """
+    return urn(num_elections, num_voters, num_candidates, 1 / math.factorial(num_candidates), rng)
+
+def mallows(num_elections, num_voters, num_candidates, phi, central=None, rng=None):
+    """Generates elections under the Mallows model, where the probability of a ranking decreases
+    geometrically with its Kendall tau distance to a central ranking.
+
+    Rankings are drawn with the repeated insertion model: candidates of the central ranking are
+    inserted one at a time, the `i`-th at a position `j` positions from the bottom with probability
+    proportional to `phi ** j`. Each step is one vectorized draw over every voter of every election.
+
+    Parameters
+    ----------
+    num_elections : int
+        The number of elections to generate.
+    num_voters : int
+        The number of voters in every election.
+    num_candidates : int
+        The number of candidates in every election.
+    phi : float
+        The dispersion, between 0 (every voter casts the central ranking) and 1 (impartial culture).
+    central : array_like of int, optional
+        The central ranking, shared by every election or given per election as an
+        (elections × candidates) matrix. Defaults to the candidates in index order.
+    rng : numpy.random.Generator or int, optional
+        The source of randomness, or a seed for one.
+
+    Returns
+    -------
+    numpy.ndarray
+        An (elections × voters × positions) tensor of candidate indices.
+    """
+    rng = np.random.default_rng(rng)
+    shape = (num_elections, num_voters)
+
+    # positions[..., i]: the position of the i-th candidate of the central ranking
+    positions = np.zeros(shape + (num_candidates,), dtype=np.int64)
+    for i in range(1, num_candidates):
+        weights = float(phi) ** np.arange(i, -1, -1)
+        place = rng.choice(i + 1, size=shape, p=weights / weights.sum())
+        positions[..., :i] += positions[..., :i] >= place[..., None]
+        positions[..., i] = place
+
+    order = np.argsort(positions, axis=-1)
+    if central is None:
+        return order.astype(_rank_dtype(num_candidates))
+
+    central = np.broadcast_to(np.asarray(central), (num_elections, num_candidates))
+    return np.take_along_axis(central[:, None, :], order, axis=-1).astype(_rank_dtype(num_candidates))
+
+def plackett_luce(num_elections, num_voters, num_candidates, weights, rng=None):
+    """Generates elections under the Plackett–Luce model, where every voter picks candidates from
+    first to last, each with probability proportional to its weight among those left.
+
+    Rankings are drawn all at once by sorting the log-weights perturbed with Gumbel noise, which
+    follows the same distribution as picking candidates one by one.
+
+    Parameters
+    ----------
+    num_elections : int
+        The number of elections to generate.
+    num_voters : int
+        The number of voters in every election.
+    num_candidates : int
+        The number of candidates in every election.
+    weights : array_like of float
+        The positive weight of every candidate, shared by every election or given per election as
+        an (elections × candidates) matrix.
+    rng : numpy.random.Generator or int, optional
+        The source of randomness, or a seed for one.
+
+    Returns
+    -------
+    numpy.ndarray
+        An (elections × voters × positions) tensor of candidate indices.
+    """
+    rng = np.random.default_rng(rng)
+    weights = np.broadcast_to(np.asarray(weights, dtype=np.float64), (num_elections, num_candidates))
+
+    utilities = np.log(weights)[:, None, :] + rng.gumbel(size=(num_elections, num_voters, num_candidates))
+
+    return np.argsort(-utilities, axis=-1).astype(_rank_dtype(num_candidates))
+
+def spatial(num_elections, num_voters, num_candidates, dimensions=2, rng=None):
+    """Generates elections under the Euclidean spatial model: voters and candidates are placed at
+    random in a space of `dimensions` dimensions, and every voter ranks the candidates from the
+    closest to the farthest.
+
+    Positions are drawn from a standard normal distribution, independently for every election.
+
+    Parameters
+    ----------
+    num_elections : int
+        The number of elections to generate.
+    num_voters : int
+        The number of voters in every election.
+    num_candidates : int
+        The number of candidates in every election.
+    dimensions : int, optional
+        The number of dimensions of the space, by default 2.
+    rng : numpy.random.Generator or int, optional
+        The source of randomness, or a seed for one.
+
+    Returns
+    -------
+    numpy.ndarray
+        An (elections × voters × positions) tensor of candidate indices.
+    """
+    rng = np.random.default_rng(rng)
+    voters = rng.standard_normal((num_elections, num_voters, dimensions))
+    candidates = rng.standard_normal((num_elections, num_candidates, dimensions))
+
+    # Squared distances without the (elections × voters × candidates × dimensions) differences;
+    # the squared norm of each voter is the same for every candidate and does not change the order
+    distances = (candidates ** 2).sum(axis=-1)[:, None, :] - 2 * np.einsum('evd,ecd->evc', voters, candidates)
+
+    return np.argsort(distances, axis=-1).astype(_rank_dtype(num_candidates))
+
+def simulate(elections, ranks, batch_size=None):
+    """Runs several election methods over a batch of simulated elections.
+
+    Election methods tallying from position counts or pairwise comparisons (positional scoring
+    rules, Copeland, Minimax, Schulze) process whole batches with array operations; the others
+    run one election at a time.
+
+    Parameters
+    ----------
+    elections : dict
+        Maps a label to an election whose method and parameters are applied to every simulated
+        election, such as `Borda(candidates, [])`. Its own ballots are not used.
+    ranks : numpy.ndarray
+        An (elections × voters × positions) tensor of candidate indices, as returned by the
+        generators of this module.
+    batch_size : int, optional
+        The number of elections tallied at once, bounding memory. Defaults to a size keeping the
+        temporary arrays around a few tens of megabytes.
+
+    Returns
+    -------
+    dict
+        Maps every label to an (elections × candidates) boolean matrix, True for the winners of
+        each election.
+
+    Examples
+    --------
+    How often Plurality and Borda elect different candidates under impartial culture:
+
+    >>> candidates = Candidates(['a', 'b', 'c', 'd'])
+    >>> ranks = impartial_culture(10_000, 101, 4, rng=0)
+    >>> winners = simulate({'plurality': Plurality(candidates, []), 'borda': Borda(candidates, [])}, ranks)
+    >>> disagreement = (winners['plurality'] != winners['borda']).any(axis=1).mean()
+    """
+    ranks = np.asarray(ranks)
+    if ranks.ndim != 3:
+        raise ValueError('The simulated ballots must be an (elections × voters × positions) tensor')
+
+    num_elections, num_voters, width = ranks.shape
+    if batch_size is None:
+        num_candidates = max((len(election.candidates.names) for election in elections.values()), default=1)
+        batch_size = max(1, (1 << 22) // max(1, num_voters * max(width, num_candidates)))
+
+    winners = {label:[] for label in elections}
+    for start in range(0, num_elections, batch_size):
+        batch = ranks[start:start + batch_size]
+        for label, election in elections.items():
+            winners[label].append(election._batch_winners(batch))
+
+    return {label:np.concatenate(batches) if batches else np.zeros((0, len(elections[label].candidates.names)), dtype=bool)
+            for label, batches in winners.items()}
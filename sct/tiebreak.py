@@ -0,0 +1,144 @@
+import numpy as np
+from sct.candidates import Candidates
+
+class TieBreaker:
+    """Base class for the strategies breaking ties between candidates with equal scores.
+
+    A tie-breaker gives every candidate a key, and among tied candidates the one with the lowest
+    key is preferred: it is ranked higher, elected first or eliminated last. Election methods sort
+    candidates by score and then by key in a single `numpy.lexsort`, so breaking every tie of an
+    election, or of a batch of simulated elections, is one array operation.
+
+    Methods
+    -------
+    keys(candidates, shape=(), history=None)
+        Returns the tie-breaking key of every candidate.
+    """
+    def keys(self, candidates: Candidates, shape=(), history=None):
+        """Returns the tie-breaking key of every candidate, the lowest key being preferred.
+
+        Parameters
+        ----------
+        candidates : Candidates
+            The candidates of the election.
+        shape : tuple of int, optional
+            The leading dimensions of the keys, such as `(elections,)` for a batch of elections.
+        history : list of numpy.ndarray, optional
+            The scores of every candidate in the earlier rounds of the count, oldest first.
+
+        Returns
+        -------
+        numpy.ndarray
+            A `shape + (candidates,)` array of keys.
+        """
+        raise NotImplementedError
+
+class LexicographicTieBreaker(TieBreaker):
+    """Breaks ties by a fixed order of priority between the candidates.
+
+    Parameters
+    ----------
+    order : list of str, optional
+        The candidates from the highest to the lowest priority. Candidates left out come after
+        those listed, in the order of `Candidates.names`. Defaults to the order of `Candidates.names`.
+
+    Attributes
+    ----------
+    order : list of str or None
+        The candidates from the highest to the lowest priority.
+    """
+    def __init__(self, order=None):
+        self.order = order
+
+    def keys(self, candidates: Candidates, shape=(), history=None):
+        num_candidates = len(candidates.names)
+        keys = np.arange(num_candidates)
+
+        if self.order is not None:
+            listed = candidates.indices(self.order)
+            # The candidates in order of priority, then the position of each in that order
+            keys = np.argsort(np.concatenate([listed, np.setdiff1d(keys, listed)]))
+
+        return np.broadcast_to(keys, tuple(shape) + (num_candidates,))
+
+class PriorRoundTieBreaker(TieBreaker):
+    """Breaks ties by the scores of the earlier rounds of the count: the candidate with the higher
+    score in the latest round where the tied candidates differ is preferred.
+
+    This is the usual rule for ties in instant-runoff and single transferable vote counts. Ties the
+    earlier rounds do not break, and ties of single-round methods, are broken by `fallback`.
+
+    Parameters
+    ----------
+    fallback : TieBreaker, optional
+        The tie-breaker used when the earlier rounds do not break a tie, by default lexicographic.
+
+    Attributes
+    ----------
+    fallback : TieBreaker
+        The tie-breaker used when the earlier rounds do not break a tie.
+    """
+    def __init__(self, fallback=None):
+        self.fallback = LexicographicTieBreaker() if fallback is None else fallback
+
+    def keys(self, candidates: Candidates, shape=(), history=None):
+        keys = self.fallback.keys(candidates, shape)
+        if not history:
+            return keys
+
+        # The latest round is the primary sort key, every earlier round breaking its ties in turn
+        order = np.lexsort([keys] + [-np.asarray(scores, dtype=np.float64) for scores in history], axis=-1)
+        ranks = np.empty(order.shape, dtype=np.int64)
+        np.put_along_axis(ranks, order, np.arange(order.shape[-1]), axis=-1)
+
+        return ranks
+
+class RandomTieBreaker(TieBreaker):
+    """Breaks every tie at random, independently of the other ties.
+
+    Keys are drawn from a `numpy.random.Generator`, one array per call, so a seeded tie-breaker
+    breaks the same ties the same way from one run to the next, and a batch of simulated
+    elections draws the keys of every election at once.
+
+    Parameters
+    ----------
+    seed : int, numpy.random.SeedSequence or numpy.random.Generator, optional
+        The source of randomness, or a seed for one.
+
+    Attributes
+    ----------
+    rng : numpy.random.Generator
+        The source of randomness.
+    """
+    def __init__(self, seed=None):
+        self.rng = np.random.default_rng(seed)
+
+    def keys(self, candidates: Candidates, shape=(), history=None):
+        return self.rng.random(tuple(shape) + (len(candidates.names),))
+
+class LotteryTieBreaker(TieBreaker):
+    """Breaks ties by a single random order of the candidates drawn before the count, as in the
+    public lotteries some election laws hold before counting the votes.
+
+    Every tie of the count is broken by the same order, unlike `RandomTieBreaker`.
+
+    Parameters
+    ----------
+    seed : int, numpy.random.SeedSequence or numpy.random.Generator, optional
+        The source of randomness of the draw, or a seed for one.
+
+    Attributes
+    ----------
+    order : list of str or None
+        The candidates from the highest to the lowest priority, once drawn.
+    """
+    def __init__(self, seed=None):
+        self.rng = np.random.default_rng(seed)
+        self.order = None
+
+    def keys(self, candidates: Candidates, shape=(), history=None):
+        # Draw again only if the candidates changed since the draw
+        if self.order is None or sorted(self.order) != candidates.names:
+            self.order = [candidates.names[c] for c in self.rng.permutation(len(candidates.names))]
+
+        return LexicographicTieBreaker(self.order).keys(candidates, shape)
@@ -0,0 +1,49 @@
+import pickle
+from array import array
+
+import numpy as np
+import pytest
+from sct import Agent, Candidates, Profile
+
+def test_choices_are_lowercased_copies():
+    agent = Agent('v', 2, ['Alice', 'BOB'])
+    choices = agent.choices
+    choices.append('carol')
+
+    assert agent.choices == ['alice', 'bob']
+    agent.choices = ['Carol']
+    assert agent.choices == ['carol']
+    assert not hasattr(agent, '__dict__')
+
+def test_agents_share_the_names_they_rank():
+    first, second = Agent('x', 1, ['Alice', 'bob']), Agent('y', 1, ['alice'])
+
+    assert first._choices[0] == second._choices[0]
+    assert first._choices.itemsize == 2
+
+def test_agents_pickle_by_name():
+    agent = Agent('v', 1.5, ['alice', 'bob'])
+    copy = pickle.loads(pickle.dumps(agent))
+
+    assert (copy.name, copy.num_votes, copy.choices) == ('v', 1.5, ['alice', 'bob'])
+
+def test_profiles_only_look_up_the_names_their_agents_rank():
+    # Names ranked by other agents of the process do not change the profile nor the error reported
+    [Agent(f'other{i}', 1, [f'unrelated{i}']) for i in range(100)]
+    candidates = Candidates(['alice', 'bob', 'carol'])
+    agents = [Agent('x', 1, ['carol', 'alice']), Agent('y', 3, ['bob'])]
+
+    profile = Profile.from_agents(candidates, agents)
+    np.testing.assert_array_equal(profile.ranks, [[2, 0], [1, -1]])
+    with pytest.raises(ValueError, match="'unrelated7' is not a candidate"):
+        Profile.from_agents(candidates, agents + [Agent('z', 1, ['bob', 'unrelated7'])])
+
+def test_wide_ids_are_looked_up_too():
+    candidates = Candidates(['alice', 'bob', 'carol'])
+    agents = [Agent('x', 1, ['carol', 'alice']), Agent('y', 3, ['bob'])]
+    agents[0]._choices = array('I', agents[0]._choices) # As stored once over 65,536 names were ranked
+
+    np.testing.assert_array_equal(Profile.from_agents(candidates, agents).ranks, [[2, 0], [1, -1]])
+    agents.append(Agent('z', 1, ['dave']))
+    with pytest.raises(ValueError, match="'dave' is not a candidate"):
+        Profile.from_agents(candidates, agents)
@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+from sct import Agent, Borda, Candidates, Profile, ProfileArchive
+
+@pytest.fixture
+def candidates():
+    return Candidates(['a', 'b', 'c', 'd'])
+
+@pytest.fixture
+def profile(candidates):
+    rng = np.random.default_rng(11)
+    ranks = np.array([rng.permutation(4) for _ in range(300)])
+    ranks[np.arange(4) >= rng.integers(1, 5, 300)[:, None]] = -1
+    return Profile(candidates, ranks, rng.integers(1, 9, 300))
+
+def test_appended_blocks_read_back(tmp_path, candidates, profile):
+    archive = ProfileArchive.create(tmp_path / 'ballots.sct', candidates)
+    assert len(archive) == 0 and list(archive.chunks()) == []
+
+    archive.append(profile[:100])
+    archive.append(profile[100:])
+    archive.append([Agent('x', 5, ['d', 'a'])])
+    reopened = ProfileArchive(tmp_path / 'ballots.sct', candidates)
+
+    assert len(reopened) == 301
+    whole = reopened.read()
+    np.testing.assert_array_equal(whole.ranks[:300], profile.ranks)
+    np.testing.assert_array_equal(whole.weights[:300], profile.weights)
+    np.testing.assert_array_equal(whole.ranks[300], [3, 0, -1, -1])
+    assert [len(chunk) for chunk in reopened.chunks(chunk_size=80)] == [80, 20, 80, 80, 40, 1]
+
+def test_streamed_archive_tallies_like_the_profile(tmp_path, candidates, profile):
+    archive = ProfileArchive.create(tmp_path / 'ballots.sct', candidates, width=4)
+    for start in range(0, 300, 70):
+        archive.append(profile[start:start + 70])
+
+    assert Borda(candidates, []).tally_stream(archive.chunks(chunk_size=50)) == \
+        Borda(candidates, profile).calculate_results()
+
+def test_blocks_appended_during_a_read_are_included(tmp_path, candidates, profile):
+    archive = ProfileArchive.create(tmp_path / 'ballots.sct', candidates)
+    archive.append(profile[:100])
+    chunks = archive.chunks()
+
+    first = next(chunks)
+    archive.append(profile[100:200])
+    archive.append(profile[200:])
+    rest = list(chunks)
+
+    assert [len(first)] + [len(chunk) for chunk in rest] == [100, 100, 100]
+    np.testing.assert_array_equal(first.ranks, profile.ranks[:100])
+    np.testing.assert_array_equal(rest[1].ranks, profile.ranks[200:])
+
+def test_partial_blocks_are_skipped_and_corruption_detected(tmp_path, candidates, profile):
+    path = tmp_path / 'ballots.sct'
+    archive = ProfileArchive.create(path, candidates)
+    archive.append(profile[:10])
+    archive.append(profile[10:20])
+    block = 16 + 10 * 4 + 10 * 8 # Header, 4 one-byte ranks and an 8-byte weight per ballot
+    size = path.stat().st_size
+
+    with open(path, 'r+b') as file:
+        file.truncate(size - 8)
+    assert len(archive) == 10
+
+    with open(path, 'r+b') as file:
+        file.truncate(size - block)
+        file.seek(size - block)
+        file.write(b'NOTABLOCK' * 4)
+    with pytest.raises(ValueError, match='corrupted'):
+        list(archive.chunks())
+
+def test_archives_are_validated(tmp_path, candidates, profile):
+    path = tmp_path / 'ballots.sct'
+    archive = ProfileArchive.create(path, candidates, width=2)
+
+    with pytest.raises(ValueError, match='more than the 2 candidates'):
+        archive.append(profile)
+    with pytest.raises(ValueError, match='integer weights'):
+        archive.append(Profile(candidates, [[0, 1], [2, 3]], [0.5, 1.5]))
+    with pytest.raises(ValueError, match='candidates'):
+        ProfileArchive(path, Candidates(['a', 'b']))
+    with pytest.raises(ValueError):
+        ProfileArchive.create(path, candidates, width=5)
+    (tmp_path / 'other.txt').write_bytes(b'hello')
+    with pytest.raises(ValueError, match='not a profile archive'):
+        ProfileArchive(tmp_path / 'other.txt')
+
+    floats = ProfileArchive.create(tmp_path / 'floats.sct', candidates, weight_dtype=np.float64)
+    floats.append(profile[:2].reweight([0.5, 1.5]))
+    np.testing.assert_array_equal(floats.read().weights, [0.5, 1.5])
+
+def test_blocks_with_out_of_range_ranks_are_rejected(tmp_path, candidates, profile):
+    path = tmp_path / 'ballots.sct'
+    archive = ProfileArchive.create(path, candidates)
+    archive.append(profile[:10])
+
+    # A file written by another program may hold ranks past the candidates
+    with open(path, 'r+b') as file:
+        file.seek(archive._data_start + 16)
+        file.write(bytes([9]))
+    with pytest.raises(ValueError, match='corrupted'):
+        list(archive.chunks())
+    assert len(archive) == 10
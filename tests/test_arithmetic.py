@@ -0,0 +1,85 @@
+from fractions import Fraction
+
+import numpy as np
+import pytest
+from sct import Agent, Borda, Candidates, MajorityJudgment, Plurality, Profile, Range, ScoreProfile, Schulze
+
+@pytest.fixture
+def candidates():
+    return Candidates(['a', 'b', 'c'])
+
+def test_near_ties_are_decided_exactly(candidates):
+    agents = [Agent('x', 0.1, ['a']), Agent('y', 0.2, ['a']), Agent('z', 0.3, ['b'])]
+    election = Plurality(candidates, agents)
+
+    assert election.calculate_results()['a'] > election.calculate_results()['b'] # Rounding error
+    assert set(election.winners()) == {'a', 'b'}
+
+def test_near_ties_for_the_last_seat_are_decided_exactly(candidates):
+    agents = [Agent('w', 1, ['a']), Agent('x', 0.1, ['b']), Agent('y', 0.2, ['b']), Agent('z', 0.3, ['c'])]
+
+    # In floats b has 0.30000000000000004 votes and c 0.3, in exact arithmetic both have 3/10
+    assert set(Plurality(candidates, agents, num_winners=2).winners()) == {'a', 'b', 'c'}
+    assert set(Plurality(candidates, agents, False, 2, tiebreak=['c']).winners()) == {'a', 'c'}
+
+def test_exact_arithmetic_reads_floats_as_the_decimals_they_print_as(candidates):
+    agents = [Agent('x', 0.1, ['a', 'b']), Agent('y', 0.2, ['a', 'c']), Agent('z', 0.3, ['b', 'a'])]
+    election = Borda(candidates, agents)
+    election.arithmetic = 'exact'
+
+    assert election.calculate_results() == {'a': Fraction(3, 10), 'b': Fraction(3, 10), 'c': 0}
+    assert set(election.winners()) == {'a', 'b'}
+
+def test_exact_scores_are_fractions_or_integers(candidates):
+    profile = Profile(candidates, [[0, 1, 2], [1, 2, 0], [2, 0, 1]], [Fraction(1, 2), Fraction(1, 2), 1])
+    election = Borda(candidates, profile)
+    election.arithmetic = 'exact'
+    results = election.calculate_results()
+
+    assert results == {'c': Fraction(5, 2), 'a': 2, 'b': Fraction(3, 2)}
+    assert type(results['a']) is int
+
+def test_fixed_arithmetic_rounds_weights_to_its_decimals(candidates):
+    profile = Profile(candidates, [[0], [0], [0], [1]], [1 / 3, 1 / 3, 1 / 3, 1])
+    election = Plurality(candidates, profile)
+    election.arithmetic, election.decimals = 'fixed', 2
+
+    assert election.calculate_results() == {'b': 1, 'a': Fraction(99, 100), 'c': 0}
+    assert election.winners() == {'b': 1}
+
+@pytest.mark.parametrize('method', [Plurality, Borda, Schulze])
+def test_exact_arithmetic_agrees_with_floats_away_from_ties(method):
+    rng = np.random.default_rng(12)
+    candidates = Candidates(['a', 'b', 'c', 'd'])
+    profile = Profile(candidates, np.array([rng.permutation(4) for _ in range(500)]), rng.integers(1, 1000, 500) / 100)
+
+    floats = method(candidates, profile).calculate_results()
+    election = method(candidates, profile)
+    election.arithmetic = 'exact'
+    exact = election.calculate_results()
+
+    assert list(exact) == list(floats)
+    assert [float(score) for score in exact.values()] == pytest.approx(list(floats.values()))
+
+def test_exact_arithmetic_over_graded_ballots(candidates):
+    profile = ScoreProfile(candidates, [[2, 1, 0], [0, 2, 1]], [0.1, 0.2])
+    election = Range(candidates, profile)
+    election.arithmetic = 'exact'
+
+    assert election.calculate_results() == {'b': Fraction(1, 2), 'a': Fraction(1, 5), 'c': Fraction(1, 5)}
+
+def test_exact_arithmetic_divides_grades_exactly(candidates):
+    profile = ScoreProfile(candidates, [[4, 3, 2], [3, 3, 1], [1, 3, 4]], [1, 2, 3], max_score=4)
+    judgment, averages = MajorityJudgment(candidates, profile), Range(candidates, profile, average=True)
+    judgment.arithmetic = averages.arithmetic = 'exact'
+
+    assert judgment.calculate_results() == {'b': 3, 'c': Fraction(5, 2), 'a': Fraction(3, 2)}
+    assert averages.calculate_results() == {'b': 3, 'c': Fraction(8, 3), 'a': Fraction(13, 6)}
+    assert all(type(score) in (int, Fraction) for score in judgment.calculate_results().values())
+
+def test_unknown_arithmetic_is_rejected(candidates):
+    election = Plurality(candidates, [Agent('x', 1, ['a'])])
+    election.arithmetic = 'decimal'
+
+    with pytest.raises(ValueError, match='arithmetic'):
+        election.calculate_results()
@@ -0,0 +1,105 @@
+from fractions import Fraction
+
+import numpy as np
+import pytest
+from sct import Agent, Approval, ApprovalProfile, Candidates, MajorityJudgment, Range, ScoreProfile
+
+@pytest.fixture
+def candidates():
+    return Candidates(['a', 'b', 'c', 'd'])
+
+def random_approvals(num_candidates, num_ballots, seed):
+    """Draws a boolean approval matrix and integer weights."""
+    rng = np.random.default_rng(seed)
+    return rng.random((num_ballots, num_candidates)) < 0.3, rng.integers(1, 5, num_ballots)
+
+def test_approvals_are_packed_one_bit_per_candidate(candidates):
+    profile = ApprovalProfile.from_sets(candidates, [['a', 'c'], [], ['D', 'b', 'a']])
+
+    assert profile.bits.dtype == np.uint64
+    np.testing.assert_array_equal(profile.bits[:, 0], [0b0101, 0, 0b1011])
+    np.testing.assert_array_equal(profile.approval_counts(), [2, 0, 3])
+    np.testing.assert_array_equal(profile.approvals(), [[1, 0, 1, 0], [0, 0, 0, 0], [1, 1, 0, 1]])
+
+@pytest.mark.parametrize('num_candidates', [5, 64, 70, 130])
+def test_approval_scores_match_a_loop(num_candidates):
+    matrix, weights = random_approvals(num_candidates, 300, seed=num_candidates)
+    candidates = Candidates([f'c{i:03d}' for i in range(num_candidates)])
+    profile = ApprovalProfile.from_matrix(candidates, matrix, weights)
+
+    expected = np.zeros(num_candidates, dtype=np.int64)
+    for row, weight in zip(matrix, weights):
+        expected[row] += weight
+    assert profile.bits.shape == (300, (num_candidates + 63) // 64)
+    np.testing.assert_array_equal(profile.approval_scores(chunk_size=64), expected)
+    np.testing.assert_array_equal(profile.compress().approval_scores(), expected)
+
+def test_satisfaction_approval_splits_every_vote(candidates):
+    profile = ApprovalProfile.from_sets(candidates, [['a', 'b'], ['a'], []], [2, 1, 5])
+
+    np.testing.assert_allclose(profile.approval_scores(normalize=True), [2, 1, 0, 0])
+    assert Approval(candidates, profile, normalize=True).calculate_results() == {'a': 2, 'b': 1, 'c': 0, 'd': 0}
+
+def test_approval_election_reads_agents_as_approvals(candidates):
+    agents = [Agent('x', 3, ['a', 'b']), Agent('y', 2, ['c', 'b']), Agent('z', 1, ['d'])]
+    election = Approval(candidates, agents)
+
+    assert election.calculate_results() == {'b': 5, 'a': 3, 'c': 2, 'd': 1}
+    assert election.winners() == {'b': 5}
+    assert Approval(candidates, ApprovalProfile.from_agents(candidates, agents)).calculate_results() == \
+        election.calculate_results()
+
+def test_remap_moves_approvals_to_the_new_indices(candidates):
+    profile = ApprovalProfile.from_sets(candidates, [['a', 'c'], ['b', 'd']])
+    remapped = profile.remap([0, -1, 2, 1])
+
+    np.testing.assert_array_equal(remapped.approvals(), [[1, 0, 1, 0], [0, 1, 0, 0]])
+
+def test_score_profiles_are_validated(candidates):
+    with pytest.raises(ValueError):
+        ScoreProfile(candidates, [[1, 2, 3]])
+    with pytest.raises(ValueError):
+        ScoreProfile(candidates, [[1, 2, 3, -1]])
+    with pytest.raises(ValueError):
+        ScoreProfile(candidates, [[1, 2, 3, 6]], max_score=5)
+    with pytest.raises(TypeError):
+        ScoreProfile.from_agents(candidates, [Agent('x', 1, ['a'])])
+    assert ScoreProfile(candidates, [[0, 5, 3, 1]]).scores.dtype == np.uint8
+
+def test_range_totals_and_averages(candidates):
+    profile = ScoreProfile(candidates, [[5, 3, 0, 1], [0, 5, 2, 1], [2, 2, 2, 2]], [1, 2, 1])
+
+    assert Range(candidates, profile).calculate_results() == {'b': 15, 'a': 7, 'c': 6, 'd': 5}
+    assert list(Range(candidates, profile).calculate_results()) == ['b', 'a', 'c', 'd']
+    assert Range(candidates, profile, average=True).calculate_results() == {'b': 3.75, 'a': 1.75, 'c': 1.5, 'd': 1.25}
+
+def test_majority_judgment_ranks_by_median_then_gauge(candidates):
+    profile = ScoreProfile(candidates, [[4, 3, 2, 0], [3, 3, 1, 0], [1, 3, 4, 0], [0, 2, 4, 0]], max_score=4)
+    results = MajorityJudgment(candidates, profile).calculate_results()
+
+    # Lower medians 1, 3, 2 and 0, moved up or down by the larger share of votes above or below them
+    assert results == {'b': 3 - 1 / 4, 'c': 2 + 2 / 4, 'a': 1 + 2 / 4, 'd': 0}
+    assert list(results) == ['b', 'c', 'a', 'd']
+    assert MajorityJudgment(candidates, profile).winners() == {'b': 2.75}
+
+def test_majority_judgment_needs_the_highest_grade_to_stream(candidates):
+    profile = ScoreProfile(candidates, [[4, 3, 1, 0]])
+
+    with pytest.raises(ValueError, match='max_score'):
+        MajorityJudgment(candidates, []).tally_stream([profile])
+    assert MajorityJudgment(candidates, [], max_score=4).tally_stream([profile]) == \
+        MajorityJudgment(candidates, profile).calculate_results()
+
+def test_fraction_weights_are_tallied_as_floats_and_kept_exact(candidates):
+    weights = [Fraction(1, 10), Fraction(1, 5)]
+    scores = ScoreProfile(candidates, [[2, 1, 0, 0], [0, 2, 1, 0]], weights)
+    approvals = ApprovalProfile.from_sets(candidates, [['a'], ['a', 'b']], weights)
+
+    assert scores.weights.dtype == approvals.weights.dtype == np.float64
+    assert Range(candidates, scores).calculate_results() == pytest.approx({'b': 0.5, 'a': 0.2, 'c': 0.2, 'd': 0})
+    assert Approval(candidates, approvals).calculate_results() == pytest.approx({'a': 0.3, 'b': 0.2, 'c': 0, 'd': 0})
+    assert list(scores[[1]].exact_weights) == list(approvals[[1]].exact_weights) == [Fraction(1, 5)]
+
+    election = Range(candidates, scores)
+    election.arithmetic = 'exact'
+    assert election.calculate_results() == {'b': Fraction(1, 2), 'a': Fraction(1, 5), 'c': Fraction(1, 5), 'd': 0}
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+from sct import Agent, ApprovalProfile, Approval, Borda, Candidates, Plurality, Profile
+
+@pytest.fixture
+def candidates():
+    return Candidates(['Carol', 'alice', 'Bob'])
+
+@pytest.fixture
+def agents():
+    return [Agent('x', 3, ['alice', 'bob']), Agent('y', 2, ['bob', 'carol', 'alice']), Agent('z', 2, ['carol'])]
+
+def test_names_are_lowercase_sorted_and_indexed(candidates):
+    assert candidates.names == ['alice', 'bob', 'carol']
+    assert candidates.index == {'alice': 0, 'bob': 1, 'carol': 2}
+    assert candidates.indices(['CAROL', 'alice']) == [2, 0]
+    assert 'Bob' in candidates and 'dave' not in candidates and 3 not in candidates
+    with pytest.raises(ValueError, match="'dave' is not a candidate"):
+        candidates.indices(['dave'])
+    with pytest.raises(ValueError):
+        Candidates(['a', 'A'])
+    with pytest.raises(TypeError):
+        Candidates(['a', 1])
+
+def test_add_and_remove_return_the_new_indices(candidates):
+    assert candidates.add_candidate('Ben') == [0, 2, 3]
+    assert candidates.names == ['alice', 'ben', 'bob', 'carol']
+    assert candidates.index['carol'] == 3
+    assert candidates.remove_candidate('alice') == [-1, 0, 1, 2]
+    assert candidates.names == ['ben', 'bob', 'carol']
+    assert candidates.version == 2
+    with pytest.raises(ValueError):
+        candidates.add_candidate('BOB')
+    with pytest.raises(ValueError):
+        candidates.remove_candidate('alice')
+
+def test_copies_are_independent(candidates):
+    copy = candidates.copy()
+    copy.add_candidate('dave')
+
+    assert candidates.names == ['alice', 'bob', 'carol'] and 'dave' not in candidates.index
+    assert (copy.version, candidates.version) == (1, 0)
+
+def test_remapped_profiles_drop_removed_candidates(candidates, agents):
+    profile = Profile.from_agents(candidates, agents)
+    remapped = profile.remap(candidates.remove_candidate('bob'))
+
+    np.testing.assert_array_equal(remapped.ranks, [[0, -1], [1, 0], [1, -1]])
+    np.testing.assert_array_equal(remapped.weights, profile.weights)
+
+def test_election_candidates_can_change(candidates, agents):
+    election = Borda(candidates, agents)
+    election.remove_candidate('bob')
+    assert election.calculate_results() == {'carol': 2, 'alice': 0}
+
+    election.add_candidate('bob')
+    assert election.calculate_results() == {'carol': 2, 'alice': 0, 'bob': 0}
+    with pytest.raises(ValueError):
+        election.remove_candidate('dave')
+
+def test_changing_the_candidates_of_an_election_leaves_other_elections_alone(candidates, agents):
+    expected = Plurality(candidates, agents).calculate_results()
+    profile = Profile.from_agents(candidates, agents)
+    approvals = ApprovalProfile.from_agents(candidates, agents)
+
+    Borda(candidates, agents).remove_candidate('alice')
+    Borda(candidates, profile).add_candidate('dave')
+    Approval(candidates, approvals).remove_candidate('carol')
+
+    assert candidates.names == ['alice', 'bob', 'carol'] and candidates.version == 0
+    assert Plurality(candidates, agents).calculate_results() == expected
+    assert Plurality(candidates, profile).calculate_results() == expected
+    assert Approval(candidates, approvals).calculate_results() == {'alice': 5, 'bob': 5, 'carol': 4}
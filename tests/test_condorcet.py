@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+from sct import Agent, Borda, Candidates, Copeland, Minimax, Profile, RankedPairs, Schulze
+
+def random_profile(num_candidates, num_ballots, seed, truncated=False):
+    """Draws ballots ranking the candidates in a random order, possibly truncated."""
+    rng = np.random.default_rng(seed)
+    candidates = Candidates([f'c{i}' for i in range(num_candidates)])
+    ranks = np.array([rng.permutation(num_candidates) for _ in range(num_ballots)])
+    if truncated:
+        lengths = rng.integers(1, num_candidates + 1, num_ballots)
+        ranks[np.arange(num_candidates) >= lengths[:, None]] = -1
+
+    return Profile(candidates, ranks, rng.integers(1, 4, num_ballots))
+
+def brute_force_pairwise(profile):
+    """Counts the votes preferring each candidate to each other, one ballot and pair at a time."""
+    num_candidates = profile.num_candidates
+    matrix = np.zeros((num_candidates, num_candidates), dtype=np.int64)
+    for row, weight in zip(profile.ranks.tolist(), profile.weights.tolist()):
+        ranked = [c for c in row if c >= 0]
+        unranked = [c for c in range(num_candidates) if c not in ranked]
+        for i, first in enumerate(ranked):
+            for second in ranked[i + 1:] + unranked:
+                matrix[first, second] += weight
+
+    return matrix
+
+@pytest.mark.parametrize('truncated', [False, True])
+def test_pairwise_matrix_matches_brute_force(truncated):
+    profile = random_profile(6, 300, seed=1, truncated=truncated)
+
+    np.testing.assert_array_equal(profile.pairwise_matrix(), brute_force_pairwise(profile))
+    np.testing.assert_array_equal(profile.pairwise_matrix(chunk_size=7), brute_force_pairwise(profile))
+    np.testing.assert_array_equal(Copeland(profile.candidates, profile).pairwise, brute_force_pairwise(profile))
+
+def test_condorcet_winner_and_loser():
+    candidates = Candidates(['a', 'b', 'c'])
+    agents = [Agent('x', 3, ['a', 'b', 'c']), Agent('y', 2, ['b', 'c', 'a']), Agent('z', 1, ['a', 'c', 'b'])]
+    election = Borda(candidates, agents)
+
+    assert election.condorcet_winner() == 'a'
+    assert election.condorcet_loser() == 'c'
+    np.testing.assert_array_equal(election.margins, -election.margins.T)
+
+def test_cycles_have_no_condorcet_winner():
+    candidates = Candidates(['a', 'b', 'c'])
+    agents = [Agent('x', 1, ['a', 'b', 'c']), Agent('y', 1, ['b', 'c', 'a']), Agent('z', 1, ['c', 'a', 'b'])]
+
+    assert Copeland(candidates, agents).condorcet_winner() is None
+    assert Copeland(candidates, agents).condorcet_loser() is None
+
+def test_pairwise_matrix_is_computed_once_for_every_condorcet_method(monkeypatch):
+    profile = random_profile(5, 200, seed=2)
+    calls = []
+    pairwise_matrix = Profile.pairwise_matrix
+    monkeypatch.setattr(Profile, 'pairwise_matrix', lambda self, *args: calls.append(self) or pairwise_matrix(self, *args))
+
+    results = [method(profile.candidates, profile).calculate_results() for method in (Copeland, Minimax, Schulze)]
+
+    assert len(calls) == 1
+    assert results[0] == Copeland(profile.candidates, Profile(profile.candidates, profile.ranks, profile.weights)).calculate_results()
+
+def test_streamed_tallies_do_not_share_the_cached_strongest_paths():
+    own, streamed = random_profile(5, 100, seed=3), random_profile(5, 100, seed=4)
+    candidates = own.candidates
+    election = Schulze(candidates, own)
+    expected = Schulze(candidates, streamed)
+
+    assert election.tally_stream([streamed]) == expected.calculate_results()
+    assert election.calculate_results() == Schulze(candidates, own).calculate_results()
+    assert election.tally_stream([streamed[:50], streamed[50:]]) == expected.calculate_results()
+    np.testing.assert_array_equal(election.strongest_paths(), Schulze(candidates, own).strongest_paths())
+    assert election.calculate_results() != expected.calculate_results()
+
+def test_streamed_tallies_do_not_share_the_cached_locked_pairs():
+    own, streamed = random_profile(5, 100, seed=3), random_profile(5, 100, seed=4)
+    candidates = own.candidates
+    election = RankedPairs(candidates, own)
+    expected = RankedPairs(candidates, streamed)
+
+    assert election.tally_stream([streamed]) == expected.calculate_results()
+    assert election.locked_pairs() == RankedPairs(candidates, own).locked_pairs()
+    assert election.winners() == RankedPairs(candidates, own).winners()
+    assert election.tally_stream([streamed]) == expected.calculate_results()
+    assert election.calculate_results() != expected.calculate_results()
+
+def test_ranked_pairs_locks_the_strongest_victories_first():
+    candidates = Candidates(['a', 'b', 'c'])
+    agents = [Agent('x', 5, ['a', 'b', 'c']), Agent('y', 4, ['b', 'c', 'a']), Agent('z', 3, ['c', 'a', 'b'])]
+    election = RankedPairs(candidates, agents)
+
+    # Margins: b > c by 6, a > b by 4, c > a by 2, which would close a cycle
+    assert election.locked_pairs() == [('b', 'c'), ('a', 'b')]
+    assert election.calculate_results() == {'a': 2, 'b': 1, 'c': 0}
+    assert election.winners() == {'a': 2}
@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+from sct import (Agent, Borda, Candidates, Copeland, Election, InstantRunoff, Minimax, Plurality, Profile, RankedPairs,
+                 Schulze)
+
+@pytest.fixture
+def candidates():
+    return Candidates(['a', 'b', 'c'])
+
+@pytest.fixture
+def agents():
+    return [Agent('x', 3, ['a', 'b', 'c']), Agent('y', 2, ['b', 'c', 'a']), Agent('z', 2, ['c', 'b', 'a'])]
+
+def count_tallies(monkeypatch, method):
+    """Counts the calls to the tally of an election method."""
+    calls = []
+    tally = method._tally
+    monkeypatch.setattr(method, '_tally', lambda self, profile: calls.append(profile) or tally(self, profile))
+
+    return calls
+
+def test_results_and_winners_are_tallied_once(monkeypatch, candidates, agents):
+    calls = count_tallies(monkeypatch, Borda)
+    election = Borda(candidates, agents)
+
+    results = election.calculate_results()
+    assert election.winners() == {'b': 9}
+    assert election.calculate_results() == results == {'b': 9, 'a': 6, 'c': 6}
+    assert len(calls) == 1
+
+def test_returned_results_can_be_modified(candidates, agents):
+    election = Borda(candidates, agents)
+    election.calculate_results()['b'] = 0
+
+    assert election.calculate_results()['b'] == 9
+
+def test_changing_a_parameter_or_the_agents_invalidates_the_cache(candidates, agents):
+    election = Borda(candidates, agents)
+    assert election.winners() == {'b': 9}
+
+    election.weight_increment = 2
+    assert election.winners() == {'b': 18}
+
+    agents.append(Agent('w', 5, ['a', 'c', 'b']))
+    assert election.winners() == {'a': 32}
+
+    election.agents = agents[:1]
+    assert election.winners() == {'a': 12}
+
+def test_invalidate_after_modifying_agents_in_place(candidates, agents):
+    election = Plurality(candidates, agents)
+    assert election.winners() == {'a': 3}
+
+    agents[0].num_votes = 1
+    election.invalidate()
+    assert election.winners() == {'b': 2, 'c': 2}
+
+@pytest.mark.parametrize('method', [Plurality, Borda, Copeland, Minimax, Schulze, RankedPairs, InstantRunoff])
+def test_incremental_updates_match_a_recount(method):
+    rng = np.random.default_rng(3)
+    candidates = Candidates(['a', 'b', 'c', 'd'])
+    ranks = np.array([rng.permutation(4) for _ in range(400)])
+    ranks[np.arange(4) >= rng.integers(1, 5, 400)[:, None]] = -1
+    profile = Profile(candidates, ranks, rng.integers(1, 5, 400))
+
+    election = method(candidates, profile[:100])
+    election.calculate_results()
+    election.pairwise
+    election.add_ballots(profile[100:300])
+    election.add_ballots(profile[300:])
+    assert election.calculate_results() == method(candidates, profile).calculate_results()
+    np.testing.assert_array_equal(election.pairwise, profile.pairwise_matrix())
+
+    election.remove_ballots(profile[:150])
+    assert election.calculate_results() == method(candidates, profile[150:]).calculate_results()
+    assert election.winners() == method(candidates, profile[150:]).winners()
+
+def test_add_ballots_accepts_agents(candidates, agents):
+    election = Plurality(candidates, agents)
+    election.winners()
+    election.add_ballots([Agent('w', 4, ['c'])])
+
+    assert election.calculate_results() == {'c': 6, 'a': 3, 'b': 2}
+    assert election.agents is agents and len(agents) == 3
+
+@pytest.mark.parametrize('method', [Plurality, Borda, Copeland, Schulze])
+def test_sharded_tallies_match_a_single_process(monkeypatch, method):
+    rng = np.random.default_rng(4)
+    candidates = Candidates(['a', 'b', 'c', 'd', 'e'])
+    profile = Profile(candidates, np.array([rng.permutation(5) for _ in range(3000)]), rng.integers(1, 9, 3000))
+    expected = method(candidates, profile).calculate_results()
+
+    monkeypatch.setattr(Election, '_min_shard_size', 500)
+    election = method(candidates, Profile(candidates, profile.ranks, profile.weights), workers=3)
+    assert election.calculate_results() == expected
+
+def test_shard_tallies_merge_by_summing():
+    rng = np.random.default_rng(5)
+    candidates = Candidates(['a', 'b', 'c', 'd'])
+    profile = Profile(candidates, np.array([rng.permutation(4) for _ in range(1000)]), rng.random(1000))
+    shards = [profile[:400], profile[400:401], profile[401:]]
+
+    for tally in (Profile.pairwise_matrix, Profile.position_counts, Profile.length_counts):
+        np.testing.assert_allclose(sum(tally(shard.compress()) for shard in shards), tally(profile))
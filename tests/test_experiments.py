@@ -0,0 +1,63 @@
+import math
+
+import pytest
+from sct import Borda, Copeland, Estimate, Plurality, estimate_probabilities, impartial_culture
+
+def test_estimate_has_a_wilson_interval():
+    estimate = Estimate(50, 100)
+
+    assert estimate.value == 0.5
+    assert estimate.low == pytest.approx(0.4038, abs=1e-4)
+    assert estimate.high == pytest.approx(0.5962, abs=1e-4)
+    assert estimate.half_width == pytest.approx(0.0962, abs=1e-4)
+    assert Estimate(50, 100, confidence=0.99).half_width > estimate.half_width
+    assert Estimate(0, 20).low == 0 and Estimate(20, 20).high == 1
+
+def test_estimate_without_trials():
+    estimate = Estimate(0, 0)
+
+    assert math.isnan(estimate.value)
+    assert (estimate.low, estimate.high) == (0, 1)
+
+def test_condorcet_winner_probability_under_impartial_culture():
+    # Three voters over three candidates have a Condorcet winner with probability 17/18
+    cell = estimate_probabilities({'ic': impartial_culture}, [3], [3], precision=0.005, seed=0)['ic', 3, 3]
+
+    assert abs(cell['condorcet_winner'].value - 17 / 18) < 2 * cell['condorcet_winner'].half_width
+    assert cell['condorcet_winner'].half_width <= 0.005
+    assert cell['elections'] % 10_000 == 0
+
+def test_majority_rules_agree_on_two_candidates():
+    rules = {'plurality': Plurality, 'borda': Borda, 'copeland': Copeland}
+    cell = estimate_probabilities({'ic': impartial_culture}, [5], [2], rules, precision=0.05, chunk_size=500,
+                                  seed=1)['ic', 5, 2]
+
+    assert cell['condorcet_winner'].value == 1
+    assert all(estimate.value == 1 for estimate in cell['condorcet_efficiency'].values())
+    assert set(cell['agreement']) == {('plurality', 'borda'), ('plurality', 'copeland'), ('borda', 'copeland')}
+    assert all(estimate.value == 1 for estimate in cell['agreement'].values())
+
+def test_cells_stop_at_the_precision_or_the_budget():
+    cells = estimate_probabilities({'ic': impartial_culture}, [5, 6], [3, 4], precision=0.2, chunk_size=100, seed=2)
+
+    assert set(cells) == {('ic', 5, 3), ('ic', 5, 4), ('ic', 6, 3), ('ic', 6, 4)}
+    assert all(cell['elections'] == 100 for cell in cells.values())
+    capped = estimate_probabilities({'ic': impartial_culture}, [5], [4], precision=0, chunk_size=100, max_elections=250,
+                                    seed=2)
+    assert capped['ic', 5, 4]['elections'] == 250
+
+def test_budgets_must_be_positive():
+    with pytest.raises(ValueError, match='max_elections'):
+        estimate_probabilities({'ic': impartial_culture}, [5], [3], max_elections=0)
+    with pytest.raises(ValueError, match='chunk_size'):
+        estimate_probabilities({'ic': impartial_culture}, [5], [3], chunk_size=0)
+
+def test_results_do_not_depend_on_the_number_of_workers():
+    arguments = ({'ic': impartial_culture}, [5, 7], [3])
+    serial = estimate_probabilities(*arguments, precision=0.05, chunk_size=200, seed=3)
+    parallel = estimate_probabilities(*arguments, precision=0.05, chunk_size=200, seed=3, workers=2)
+
+    for key, cell in serial.items():
+        assert parallel[key]['elections'] == cell['elections']
+        assert parallel[key]['condorcet_winner'].successes == cell['condorcet_winner'].successes
+        assert parallel[key]['agreement']['plurality', 'borda'].successes == cell['agreement']['plurality', 'borda'].successes
@@ -0,0 +1,40 @@
+"""Checks which modules importing parts of the package loads.
+
+Every import runs in a fresh interpreter, so nothing is already in `sys.modules`. Checking the
+modules loaded rather than timing the import keeps the test deterministic on slow or busy machines.
+"""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = '''
+import sys, json
+exec({statement!r})
+print(json.dumps(sorted(sys.modules)))
+'''
+
+def loaded_modules(statement):
+    """Returns the names of the modules loaded by a fresh interpreter running `statement`."""
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    output = subprocess.run([sys.executable, '-c', PROBE.format(statement=statement)], env=env,
+                            capture_output=True, text=True, check=True).stdout
+
+    return set(json.loads(output))
+
+@pytest.mark.parametrize('statement', ['import sct', 'from sct import Agent, Candidates'])
+def test_lightweight_imports_skip_numpy_and_the_election_methods(statement):
+    modules = loaded_modules(statement)
+
+    assert not modules & {'numpy', 'sympy', 'sct.profile', 'sct.election', 'concurrent.futures'}
+
+def test_election_classes_skip_optional_and_unrelated_modules():
+    modules = loaded_modules('from sct import Plurality, Borda')
+
+    assert 'sct.election' in modules
+    assert not modules & {'sympy', 'concurrent.futures', 'multiprocessing', 'sct.simulation', 'sct.experiments',
+                          'sct.readers', 'sct.archive'}
@@ -0,0 +1,57 @@
+from itertools import permutations
+
+import numpy as np
+import pytest
+from sct import Candidates, Kemeny, kemeny_distance, kemeny_exact
+from tests.test_condorcet import random_profile
+
+def brute_force_distance(pairwise):
+    """Finds the smallest Kemeny score by trying every ranking."""
+    return min(kemeny_distance(pairwise, ranking) for ranking in permutations(range(len(pairwise))))
+
+@pytest.mark.parametrize('seed', range(4))
+def test_exact_solver_matches_brute_force(seed):
+    pairwise = random_profile(6, 50, seed=seed, truncated=True).pairwise_matrix()
+
+    assert kemeny_distance(pairwise, kemeny_exact(pairwise)) == brute_force_distance(pairwise)
+
+@pytest.mark.parametrize('solver', ['borda', 'kwiksort', 'local_search'])
+def test_heuristics_return_rankings_no_better_than_the_optimum(solver):
+    profile = random_profile(6, 50, seed=5)
+    consensus = Kemeny(profile.candidates, profile, solver=solver, seed=0).consensus()
+
+    assert sorted(consensus['ranking']) == profile.candidates.names
+    assert consensus['distance'] >= brute_force_distance(profile.pairwise_matrix())
+    assert consensus['solver'] == solver
+
+def test_consensus_orders_the_results():
+    profile = random_profile(5, 80, seed=6)
+    election = Kemeny(profile.candidates, profile)
+    consensus = election.consensus()
+
+    assert consensus['solver'] == 'exact'
+    assert list(election.calculate_results()) == consensus['ranking']
+    assert election.winners() == {consensus['ranking'][0]: 4}
+
+def test_streamed_tallies_do_not_share_the_cached_consensus():
+    own, streamed = random_profile(5, 100, seed=3), random_profile(5, 100, seed=4)
+    candidates = own.candidates
+    election = Kemeny(candidates, own)
+    expected = Kemeny(candidates, streamed)
+
+    assert election.tally_stream([streamed]) == expected.calculate_results()
+    assert election.consensus()['ranking'] == Kemeny(candidates, own).consensus()['ranking']
+    assert election.winners() == Kemeny(candidates, own).winners()
+    assert election.tally_stream([streamed]) == expected.calculate_results()
+    assert election.calculate_results() != expected.calculate_results()
+
+def test_exact_solver_refuses_too_many_candidates():
+    candidates = Candidates([f'c{i}' for i in range(26)])
+
+    with pytest.raises(ValueError, match='25'):
+        Kemeny(candidates, [], solver='exact')
+    with pytest.raises(ValueError, match='25'):
+        Kemeny(candidates, [], max_exact=30)
+    with pytest.raises(ValueError, match='25'):
+        kemeny_exact(np.zeros((26, 26)))
+    assert Kemeny(candidates, [], solver='borda').consensus()['solver'] == 'borda'
@@ -0,0 +1,159 @@
+import numpy as np
+import pytest
+from sct import Agent, Borda, Candidates, Plurality, PositionalScoring, Profile, score_vector, simulate
+
+def loop_plurality(candidates, agents):
+    """Counts first preferences one agent at a time."""
+    results = dict.fromkeys(candidates.names, 0)
+    for agent in agents:
+        results[agent.choices[0]] += agent.num_votes
+
+    return results
+
+def loop_borda(candidates, agents):
+    """Scores complete ballots one position at a time."""
+    results = dict.fromkeys(candidates.names, 0)
+    for agent in agents:
+        for position, choice in enumerate(agent.choices):
+            results[choice] += (len(candidates.names) - 1 - position) * agent.num_votes
+
+    return results
+
+def loop_borda_truncated(candidates, agents):
+    """Scores every ballot from the length of the ballot, one position at a time."""
+    results = dict.fromkeys(candidates.names, 0)
+    for agent in agents:
+        for position, choice in enumerate(agent.choices):
+            results[choice] += (len(agent.choices) - 1 - position) * agent.num_votes
+
+    return results
+
+def sorted_results(results):
+    """Sorts results by decreasing score, ties in the order of the names."""
+    return dict(sorted(results.items(), key=lambda item: item[1], reverse=True))
+
+@pytest.mark.parametrize('seed', range(5))
+def test_vectorized_tallies_match_a_loop_over_agents(seed):
+    rng = np.random.default_rng(seed)
+    candidates = Candidates(list('abcdef'))
+    complete = [Agent(f'v{i}', 1, [candidates.names[c] for c in rng.permutation(6)]) for i in range(200)]
+
+    assert Plurality(candidates, complete).calculate_results() == sorted_results(loop_plurality(candidates, complete))
+    assert Borda(candidates, complete).calculate_results() == sorted_results(loop_borda(candidates, complete))
+
+def test_results_are_sorted_with_ties_in_name_order():
+    candidates = Candidates(['c', 'a', 'b'])
+    agents = [Agent('x', 1, ['b', 'a', 'c']), Agent('y', 1, ['c', 'a', 'b'])]
+
+    assert list(Plurality(candidates, agents).calculate_results().items()) == [('b', 1), ('c', 1), ('a', 0)]
+    assert list(Borda(candidates, agents).calculate_results().items()) == [('a', 2), ('b', 2), ('c', 2)]
+    assert Plurality(candidates, agents).winners() == {'b': 1, 'c': 1}
+
+def test_scores_stay_integers():
+    candidates = Candidates(['a', 'b'])
+    results = Borda(candidates, [Agent('x', 1, ['a', 'b'])]).calculate_results()
+
+    assert all(type(score) is int for score in results.values())
+
+def test_empty_elections():
+    candidates = Candidates(['a', 'b'])
+
+    assert Plurality(candidates, []).calculate_results() == {'a': 0, 'b': 0}
+    assert Borda(candidates, Profile(candidates, np.empty((0, 2), dtype=np.int8))).calculate_results() == {'a': 0, 'b': 0}
+
+@pytest.mark.parametrize('seed', range(5))
+def test_borda_scores_truncated_ballots_by_their_length_by_default(seed):
+    rng = np.random.default_rng(seed)
+    candidates = Candidates(list('abcde'))
+    agents = [Agent(f'v{i}', int(rng.integers(1, 4)), [candidates.names[c] for c in rng.permutation(5)[:rng.integers(1, 6)]])
+              for i in range(100)]
+
+    expected = sorted_results(loop_borda_truncated(candidates, agents))
+    assert Borda(candidates, agents).calculate_results() == expected
+    assert Borda(candidates, agents, truncation='ballot_length').calculate_results() == expected
+
+def test_truncation_conventions():
+    candidates = Candidates(['a', 'b', 'c', 'd'])
+    profile = Profile(candidates, [[0, 1, -1, -1]])
+
+    assert Borda(candidates, profile).calculate_results() == {'a': 1, 'b': 0, 'c': 0, 'd': 0}
+    assert Borda(candidates, profile, truncation='pessimistic').calculate_results() == {'a': 3, 'b': 2, 'c': 0, 'd': 0}
+    assert Borda(candidates, profile, truncation='modified').calculate_results() == {'a': 2, 'b': 1, 'c': 0, 'd': 0}
+    assert Borda(candidates, profile, truncation='averaged').calculate_results() == {'a': 3, 'b': 2, 'c': 0.5, 'd': 0.5}
+    with pytest.raises(ValueError):
+        Borda(candidates, profile, truncation='optimistic')
+
+def test_conventions_agree_on_complete_ballots():
+    candidates = Candidates(['a', 'b', 'c'])
+    profile = Profile(candidates, [[0, 1, 2], [2, 1, 0], [1, 0, 2]], [3, 2, 2])
+    results = [Borda(candidates, profile, truncation=truncation).calculate_results()
+               for truncation in ('ballot_length', 'pessimistic', 'averaged', 'modified')]
+
+    assert results[0] == results[1] == results[2] == {'b': 9, 'a': 8, 'c': 4}
+    assert results[3] == {'b': 16, 'a': 15, 'c': 11}
+
+def test_score_vectors():
+    np.testing.assert_array_equal(score_vector('borda', 4), [3, 2, 1, 0])
+    np.testing.assert_array_equal(score_vector('veto', 3), [1, 1, 0])
+    np.testing.assert_array_equal(score_vector('k-approval', 4, k=2), [1, 1, 0, 0])
+    np.testing.assert_allclose(score_vector('dowdall', 3), [1, 1 / 2, 1 / 3])
+    np.testing.assert_array_equal(score_vector([5, 1], 3), [5, 1, 0])
+    with pytest.raises(ValueError):
+        score_vector('k-approval', 3)
+    with pytest.raises(ValueError):
+        score_vector([1, 1, 1, 1], 3)
+
+def test_evaluate_scores_several_rules_over_one_tally():
+    candidates = Candidates(['a', 'b', 'c'])
+    profile = Profile(candidates, [[0, 1, 2], [2, 1, 0], [1, 0, 2]], [3, 2, 2])
+    results = Borda(candidates, profile).evaluate({'plurality': 'plurality', 'borda': 'borda', 'top2': ('k-approval', 2)})
+
+    assert results['plurality'] == PositionalScoring(candidates, profile, 'plurality').calculate_results()
+    assert results['borda'] == Borda(candidates, profile).calculate_results()
+    assert results['top2'] == {'b': 7, 'a': 5, 'c': 2}
+    with pytest.raises(ValueError):
+        Borda(candidates, Profile(candidates, [[0, 1]])).evaluate({'borda': 'borda'})
+
+@pytest.mark.parametrize('truncation', ['ballot_length', 'pessimistic', 'modified'])
+def test_batched_simulation_scores_truncated_ballots_like_single_elections(truncation):
+    rng = np.random.default_rng(6)
+    candidates = Candidates(['a', 'b', 'c', 'd'])
+    ranks = np.array([[rng.permutation(4) for _ in range(15)] for _ in range(40)])
+    ranks[np.arange(4) >= rng.integers(1, 5, (40, 15, 1))] = -1
+    election = Borda(candidates, [], truncation=truncation)
+
+    winners = simulate({'borda': election}, ranks)['borda']
+    for ballots, elected in zip(ranks, winners):
+        expected = Borda(candidates, Profile(candidates, ballots), truncation=truncation).winners()
+        assert {candidates.names[c] for c in np.flatnonzero(elected)} == set(expected)
+
+def loop_truncated_borda(candidates, agents, truncation):
+    """Scores truncated ballots one agent at a time, giving unranked candidates nothing, or an
+    equal share of the points left ('averaged')."""
+    num_candidates = len(candidates.names)
+    results = dict.fromkeys(candidates.names, 0)
+    for agent in agents:
+        length = len(agent.choices)
+        top = {'pessimistic': num_candidates - 1, 'modified': length, 'averaged': num_candidates - 1}[truncation]
+        for position, choice in enumerate(agent.choices):
+            results[choice] += (top - position) * agent.num_votes
+        if truncation == 'averaged' and length < num_candidates:
+            share = sum(range(num_candidates - length)) / (num_candidates - length)
+            for name in set(candidates.names) - set(agent.choices):
+                results[name] += share * agent.num_votes
+
+    return results
+
+@pytest.mark.parametrize('truncation', ['pessimistic', 'modified', 'averaged'])
+def test_truncation_conventions_match_a_loop(truncation):
+    rng = np.random.default_rng(8)
+    candidates = Candidates([f'c{i:02d}' for i in range(40)])
+    agents = [Agent(f'v{i}', int(rng.integers(1, 4)), [candidates.names[c] for c in rng.permutation(40)[:rng.integers(1, 4)]])
+              for i in range(200)]
+    profile = Profile.from_agents(candidates, agents)
+
+    assert profile.ranks.shape[1] == 3
+    expected = loop_truncated_borda(candidates, agents, truncation)
+    results = Borda(candidates, profile, truncation=truncation).calculate_results()
+    assert results == pytest.approx(expected)
+    assert Borda(candidates, agents, truncation=truncation).calculate_results() == results
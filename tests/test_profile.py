@@ -0,0 +1,153 @@
+import numpy as np
+import pytest
+import sct.profile
+from sct import Agent, Borda, Candidates, Plurality, Profile
+
+@pytest.fixture
+def candidates():
+    return Candidates(['a', 'b', 'c', 'd'])
+
+@pytest.fixture
+def agents():
+    return [Agent('v1', 1, ['a', 'b', 'c', 'd']), Agent('v2', 2, ['c', 'a']), Agent('v3', 1, ['d']),
+            Agent('v4', 3, ['b', 'd', 'a', 'c'])]
+
+def test_from_agents_builds_the_rank_matrix(candidates, agents):
+    profile = Profile.from_agents(candidates, agents)
+
+    np.testing.assert_array_equal(profile.ranks, [[0, 1, 2, 3], [2, 0, -1, -1], [3, -1, -1, -1], [1, 3, 0, 2]])
+    np.testing.assert_array_equal(profile.weights, [1, 2, 1, 3])
+    np.testing.assert_array_equal(profile.lengths, [4, 2, 1, 4])
+    assert profile.num_ballots == len(profile) == 4
+    assert profile.num_candidates == 4
+
+def test_agents_and_profile_give_the_same_results(candidates, agents):
+    profile = Profile.from_agents(candidates, agents)
+
+    for method in (Plurality, Borda):
+        assert method(candidates, agents).calculate_results() == method(candidates, profile).calculate_results()
+
+def test_ranks_round_trip_through_the_ragged_layout(candidates, agents):
+    profile = Profile.from_agents(candidates, agents)
+    offsets, flat = profile.to_ragged()
+
+    np.testing.assert_array_equal(offsets, [0, 4, 6, 7, 11])
+    rebuilt = Profile.from_ragged(candidates, offsets, flat, profile.weights)
+    np.testing.assert_array_equal(rebuilt.ranks, profile.ranks)
+    np.testing.assert_array_equal(rebuilt.weights, profile.weights)
+
+def test_ragged_ballots_are_only_as_wide_as_the_longest():
+    candidates = Candidates([f'c{i:02d}' for i in range(40)])
+    rng = np.random.default_rng(7)
+    lengths = rng.integers(0, 4, 1000)
+    flat = np.concatenate([rng.permutation(40)[:length] for length in lengths])
+    profile = Profile.from_ragged(candidates, np.append(0, np.cumsum(lengths)), flat)
+
+    assert profile.ranks.shape == (1000, 3)
+    assert profile.ranks.nbytes == 3000
+    np.testing.assert_array_equal(profile.lengths, lengths)
+    np.testing.assert_array_equal(profile.to_ragged()[1], flat)
+
+def test_ragged_offsets_are_validated(candidates):
+    for offsets in ([1, 2], [0, 3, 2], [0, 1]):
+        with pytest.raises(ValueError, match='offsets'):
+            Profile.from_ragged(candidates, offsets, [0, 1])
+    assert Profile.from_ragged(candidates, [0, 0, 2], [3, 1]).ranks.tolist() == [[-1, -1], [3, 1]]
+
+def test_truncated_tallies_match_a_loop(candidates, agents):
+    profile = Profile.from_agents(candidates, agents)
+    position_counts = np.zeros((4, 4), dtype=np.int64)
+    length_counts = np.zeros((4, 5), dtype=np.int64)
+    borda = np.zeros(4, dtype=np.int64)
+    for agent in agents:
+        for position, index in enumerate(candidates.indices(agent.choices)):
+            position_counts[index, position] += agent.num_votes
+            length_counts[index, len(agent.choices)] += agent.num_votes
+            borda[index] += (len(agent.choices) - 1 - position) * agent.num_votes
+
+    np.testing.assert_array_equal(profile.position_counts(), position_counts)
+    np.testing.assert_array_equal(profile.length_counts(), length_counts)
+    np.testing.assert_array_equal(profile.borda_scores(), borda)
+    np.testing.assert_array_equal(profile.positions()[1], [1, 4, 0, 4])
+
+def test_selection_and_concatenation_round_trip(candidates, agents):
+    profile = Profile.from_agents(candidates, agents)
+    joined = Profile.concatenate([profile[:1], profile[1:3], profile[3:]])
+
+    np.testing.assert_array_equal(joined.ranks, profile.ranks)
+    np.testing.assert_array_equal(joined.weights, profile.weights)
+
+def test_rank_dtype_is_the_smallest_that_fits():
+    assert Profile(Candidates(['a', 'b']), [[0, 1]]).ranks.dtype == np.int8
+    assert Profile(Candidates([f'c{i}' for i in range(200)]), [[0, 199]]).ranks.dtype == np.int16
+
+@pytest.mark.parametrize('ranks', [[[0, 0, 1]], [[2, 1, 2]], [[0, 1], [3, 3]]])
+def test_duplicate_candidates_are_rejected(candidates, ranks):
+    with pytest.raises(ValueError, match='more than once'):
+        Profile(candidates, ranks)
+
+@pytest.mark.parametrize('ranks', [[[-1, 2, -1]], [[0, -1, 1]], [[1, 2], [-1, 0]]])
+def test_padding_before_a_ranked_candidate_is_rejected(candidates, ranks):
+    with pytest.raises(ValueError, match='Unranked positions'):
+        Profile(candidates, ranks)
+
+def test_invalid_profiles_are_rejected(candidates):
+    with pytest.raises(ValueError):
+        Profile(candidates, [[0, 4]])
+    with pytest.raises(ValueError):
+        Profile(candidates, [[0, -2]])
+    with pytest.raises(ValueError):
+        Profile(candidates, [[0, 1]], weights=[1, 2])
+    with pytest.raises(ValueError):
+        Profile.from_agents(candidates, [Agent('v', 1, ['a', 'e'])])
+    with pytest.raises(ValueError):
+        Profile.from_agents(candidates, [Agent('v', 1, ['a', 'b', 'A'])])
+
+def test_padding_and_empty_ballots_are_accepted(candidates):
+    profile = Profile(candidates, [[0, 1, -1], [-1, -1, -1]])
+
+    np.testing.assert_array_equal(profile.lengths, [2, 0])
+    assert Profile(candidates, np.empty((0, 0), dtype=np.int64)).num_ballots == 0
+
+def brute_force_compress(profile):
+    """Sums the weights of identical rows with a dictionary."""
+    totals = {}
+    for row, weight in zip(profile.ranks.tolist(), profile.weights.tolist()):
+        totals[tuple(row)] = totals.get(tuple(row), 0) + weight
+
+    return {row: total for row, total in totals.items() if total != 0}
+
+@pytest.mark.parametrize('num_candidates, width', [(4, 4), (12, 12), (40, 40), (40, 3)])
+def test_compress_sums_the_weights_of_identical_rankings(num_candidates, width):
+    rng = np.random.default_rng(num_candidates + width)
+    candidates = Candidates([f'c{i:02d}' for i in range(num_candidates)])
+    pool = np.array([rng.permutation(num_candidates)[:width] for _ in range(30)])
+    profile = Profile(candidates, pool[rng.integers(0, len(pool), 5000)], rng.integers(1, 4, 5000))
+
+    compressed = profile.compress()
+    assert compressed.num_ballots == len(np.unique(profile.ranks, axis=0))
+    assert brute_force_compress(compressed) == brute_force_compress(profile)
+    assert compressed.compress() is compressed
+
+def test_compress_keeps_tallies_and_drops_cancelled_rankings(candidates):
+    profile = Profile(candidates, [[0, 1, -1], [0, 1, -1], [2, -1, -1], [3, 0, 1], [3, 0, 1]], [1, 2, 5, 4, -4])
+    compressed = profile.compress()
+
+    np.testing.assert_array_equal(compressed.ranks, [[0, 1, -1], [2, -1, -1]])
+    np.testing.assert_array_equal(compressed.weights, [3, 5])
+    np.testing.assert_array_equal(compressed.pairwise_matrix(), profile.pairwise_matrix())
+    np.testing.assert_array_equal(compressed.position_counts(), profile.position_counts())
+
+@pytest.mark.parametrize('hashes', [lambda ranks: np.zeros(len(ranks), dtype=np.uint64),
+                                    lambda ranks: (ranks[:, 0] + 1).astype(np.uint64)], ids=['zeros', 'first'])
+def test_compress_survives_hash_collisions(monkeypatch, hashes):
+    rng = np.random.default_rng(9)
+    candidates = Candidates([f'c{i:02d}' for i in range(30)])
+    pool = np.array([rng.permutation(30) for _ in range(20)])
+    profile = Profile(candidates, pool[rng.integers(0, 20, 2000)], rng.integers(1, 4, 2000))
+    expected = brute_force_compress(profile)
+
+    monkeypatch.setattr(sct.profile, '_ranking_hashes', hashes)
+    compressed = profile.compress()
+    assert compressed.num_ballots == 20
+    assert brute_force_compress(compressed) == expected
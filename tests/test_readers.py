@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+from sct import Borda, Candidates, InstantRunoff, Profile, read_csv, read_preflib
+
+PREFLIB = '''\
+# FILE NAME: example.soi
+# DATA TYPE: soi
+# NUMBER ALTERNATIVES: 3
+# ALTERNATIVE NAME 1: Alice
+# ALTERNATIVE NAME 2: Bob
+# ALTERNATIVE NAME 3: Carol
+5: 1,2,3
+3: 2
+2: 3,{1,2}
+'''
+
+LEGACY = '''\
+3
+1,Alice
+2,Bob
+3,Carol
+10,10,3
+5,1,2,3
+3,2
+2,3
+'''
+
+@pytest.fixture
+def candidates():
+    return Candidates(['a', 'b', 'c'])
+
+def write(tmp_path, text, name='ballots.csv'):
+    path = tmp_path / name
+    path.write_text(text)
+    return path
+
+def test_read_csv_parses_ballots_in_chunks(tmp_path, candidates):
+    path = write(tmp_path, 'a,b,c\nB, a\n\nc\n,c,,a\n')
+    chunks = list(read_csv(path, candidates, chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2]
+    np.testing.assert_array_equal(chunks[0].ranks, [[0, 1, 2], [1, 0, -1]])
+    np.testing.assert_array_equal(chunks[1].ranks, [[2, -1], [2, 0]])
+    assert all(chunk.candidates is candidates for chunk in chunks)
+
+def test_read_csv_reads_weights(tmp_path, candidates):
+    path = write(tmp_path, '3,a,b\n1.5,c\n')
+    chunk, = read_csv(path, candidates, weighted=True)
+
+    np.testing.assert_array_equal(chunk.weights, [3, 1.5])
+    election = Borda(candidates, [], truncation='pessimistic')
+    assert election.tally_stream(read_csv(path, candidates, weighted=True)) == {'a': 6.0, 'c': 3.0, 'b': 3.0}
+
+def test_read_csv_integer_weights_stay_integers(tmp_path, candidates):
+    chunk, = read_csv(write(tmp_path, '3;a;b\n2;c\n'), candidates, weighted=True, delimiter=';')
+
+    assert chunk.weights.dtype.kind == 'i'
+
+def test_read_csv_reports_unknown_candidates(tmp_path, candidates):
+    with pytest.raises(ValueError, match="line 2: 'd' is not a candidate"):
+        list(read_csv(write(tmp_path, 'a,b\nd,a\n'), candidates))
+
+def test_read_csv_rejects_repeated_candidates(tmp_path, candidates):
+    with pytest.raises(ValueError, match="line 3: 'a' is ranked more than once"):
+        list(read_csv(write(tmp_path, 'a,b\nc\na,b,A\n'), candidates))
+
+def test_streamed_chunks_tally_like_the_whole_file(tmp_path, candidates):
+    rng = np.random.default_rng(0)
+    rows = [[candidates.names[c] for c in rng.permutation(3)[:rng.integers(1, 4)]] for _ in range(500)]
+    path = write(tmp_path, ''.join(','.join(row) + '\n' for row in rows))
+    whole = Profile.concatenate(list(read_csv(path, candidates)))
+
+    assert Borda(candidates, []).tally_stream(read_csv(path, candidates, chunk_size=37)) == \
+        Borda(candidates, whole).calculate_results()
+
+@pytest.mark.parametrize('text', [PREFLIB, LEGACY])
+def test_read_preflib(tmp_path, text):
+    chunk, = read_preflib(write(tmp_path, text, 'example.soi'))
+
+    assert chunk.candidates.names == ['alice', 'bob', 'carol']
+    np.testing.assert_array_equal(chunk.ranks, [[0, 1, 2], [1, -1, -1], [2, -1, -1]])
+    np.testing.assert_array_equal(chunk.weights, [5, 3, 2])
+    assert InstantRunoff(chunk.candidates, chunk).winners() == {'alice': 5}
+
+def test_read_preflib_rejects_ties_and_repeated_alternatives(tmp_path):
+    with pytest.raises(ValueError, match='line 7: ties'):
+        list(read_preflib(write(tmp_path, PREFLIB.replace('5: 1,2,3', '5: {1,2},3'), 'example.soi')))
+    with pytest.raises(ValueError, match='line 8: alternative 2 is ranked more than once'):
+        list(read_preflib(write(tmp_path, PREFLIB.replace('3: 2', '3: 2,3,2'), 'example.soi')))
+    with pytest.raises(ValueError, match='line 9: unknown alternative 4'):
+        list(read_preflib(write(tmp_path, PREFLIB.replace('2: 3,{1,2}', '2: 4'), 'example.soi')))
@@ -0,0 +1,96 @@
+from fractions import Fraction
+
+import numpy as np
+import pytest
+from sct import Agent, Candidates, InstantRunoff, Profile, SingleTransferableVote
+
+def ballots(*blocs):
+    """Builds agents from (votes, 'abc') pairs, one agent per bloc."""
+    return [Agent(f'bloc{i}', votes, list(choices)) for i, (votes, choices) in enumerate(blocs)]
+
+def loop_instant_runoff(candidates, agents):
+    """Counts rounds by rebuilding every ballot's first continuing preference, eliminating the
+    tied candidate that comes last in the names."""
+    continuing = list(candidates.names)
+    while True:
+        tally = dict.fromkeys(continuing, 0)
+        for agent in agents:
+            choices = [choice for choice in agent.choices if choice in tally]
+            if choices:
+                tally[choices[0]] += agent.num_votes
+        leader = max(continuing, key=lambda name: tally[name])
+        if len(continuing) == 1 or 2 * tally[leader] > sum(tally.values()):
+            return leader
+        continuing.remove(min(reversed(continuing), key=lambda name: tally[name]))
+
+def test_instant_runoff_rounds():
+    candidates = Candidates(['a', 'b', 'c', 'd'])
+    agents = ballots((8, 'abc'), (7, 'bca'), (4, 'cb'), (2, 'dc'))
+    election = InstantRunoff(candidates, agents)
+
+    assert election.rounds() == [{'a': 8, 'b': 7, 'c': 4, 'd': 2}, {'a': 8, 'b': 7, 'c': 6}, {'a': 8, 'b': 11}]
+    assert election.winners() == {'b': 11}
+    assert election.calculate_results() == {'b': 11, 'a': 8, 'c': 6, 'd': 2}
+
+@pytest.mark.parametrize('seed', range(5))
+def test_instant_runoff_matches_a_loop(seed):
+    rng = np.random.default_rng(seed)
+    candidates = Candidates(list('abcde'))
+    agents = [Agent(f'v{i}', int(rng.integers(1, 6)), [candidates.names[c] for c in rng.permutation(5)[:rng.integers(1, 6)]])
+              for i in range(60)]
+
+    assert list(InstantRunoff(candidates, agents, allow_ties=False).winners()) == [loop_instant_runoff(candidates, agents)]
+
+def test_single_transferable_vote_with_one_seat_is_instant_runoff():
+    candidates = Candidates(['a', 'b', 'c', 'd'])
+    agents = ballots((8, 'abc'), (7, 'bca'), (5, 'cb'), (2, 'dc'))
+
+    assert SingleTransferableVote(candidates, agents).winners() == InstantRunoff(candidates, agents).winners()
+
+def test_surplus_transfers_skip_candidates_elected_in_the_same_round():
+    candidates = Candidates(['a', 'b', 'c', 'd'])
+    agents = ballots((40, 'abc'), (30, 'bd'), (16, 'c'), (14, 'd'))
+    election = SingleTransferableVote(candidates, agents, num_winners=3)
+
+    assert list(election.winners()) == ['a', 'b', 'c']
+    assert election.rounds()[1] == {'c': 30, 'd': 18}
+
+def test_surplus_is_transferred_at_its_fractional_value():
+    candidates = Candidates(['a', 'b', 'c'])
+    agents = ballots((6, 'ab'), (2, 'ba'), (1, 'c'))
+    election = SingleTransferableVote(candidates, agents, num_winners=2)
+
+    # The Droop quota is 9 // 3 + 1 = 4, so a transfers 2 of their 6 votes to b
+    assert election.rounds() == [{'a': 6, 'b': 2, 'c': 1}, {'b': 4, 'c': 1}]
+    assert list(election.winners()) == ['a', 'b']
+
+def test_fractional_weights_use_the_exact_droop_quota():
+    candidates = Candidates(['a', 'b', 'c'])
+    blocs = [(0.6, 'ac'), (0.3, 'b'), (0.1, 'c')]
+
+    fractional = SingleTransferableVote(candidates, ballots(*blocs), num_winners=2)
+    whole = SingleTransferableVote(candidates, ballots(*((round(votes * 100), choices) for votes, choices in blocs)),
+                                   num_winners=2)
+    assert set(fractional.winners()) == set(whole.winners()) == {'a', 'c'}
+
+@pytest.mark.parametrize('arithmetic, transferred, winners', [('exact', 1, {'a', 'b', 'd'}),
+                                                              ('fixed', Fraction(999999, 10 ** 6), {'a', 'd'})])
+def test_exact_arithmetic_counts_parcels_exactly(arithmetic, transferred, winners):
+    candidates = Candidates(['a', 'b', 'c', 'd'])
+    profile = Profile.from_agents(candidates, ballots((7, 'abc'), (3, 'bc'), (2, 'c'), (4, 'dc')))
+    election = SingleTransferableVote(candidates, profile, num_winners=2)
+    election.arithmetic = arithmetic
+
+    # The quota is 16 // 3 + 1 = 6: a transfers 1/7 of their 7 votes to b, truncated in 'fixed'
+    assert election.rounds()[1] == {'b': 3 + transferred, 'c': 2, 'd': 4}
+    assert all(isinstance(votes, (int, Fraction)) for round in election.rounds() for votes in round.values())
+    # Exactly, b and d tie for the last seat
+    assert set(election.winners()) == winners
+
+def test_hare_quota():
+    candidates = Candidates(['a', 'b', 'c'])
+    agents = ballots((5, 'ab'), (3, 'b'), (2, 'c'))
+
+    assert list(SingleTransferableVote(candidates, agents, num_winners=2, quota='hare').winners()) == ['a', 'b']
+    with pytest.raises(ValueError):
+        SingleTransferableVote(candidates, agents, quota='imperiali')
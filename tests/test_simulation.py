@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+from sct import (Borda, Candidates, Copeland, InstantRunoff, Minimax, Plurality, Profile, Schulze, impartial_anonymous_culture,
+                 impartial_culture, mallows, plackett_luce, simulate, spatial, urn)
+
+GENERATORS = {
+    'impartial_culture': impartial_culture,
+    'impartial_anonymous_culture': impartial_anonymous_culture,
+    'urn': lambda *args, rng=None: urn(*args, alpha=0.5, rng=rng),
+    'mallows': lambda *args, rng=None: mallows(*args, phi=0.5, rng=rng),
+    'plackett_luce': lambda *args, rng=None: plackett_luce(*args, weights=[4, 3, 2, 1, 1], rng=rng),
+    'spatial': spatial,
+}
+
+def first_place_shares(ranks, num_candidates):
+    """Returns the share of voters ranking each candidate first, over every election."""
+    return np.bincount(ranks[..., 0].ravel(), minlength=num_candidates) / ranks[..., 0].size
+
+@pytest.mark.parametrize('generate', GENERATORS.values(), ids=GENERATORS.keys())
+def test_generators_draw_complete_rankings(generate):
+    ranks = generate(20, 30, 5, rng=1)
+
+    assert ranks.shape == (20, 30, 5)
+    assert ranks.dtype == np.int8
+    np.testing.assert_array_equal(np.sort(ranks, axis=-1), np.broadcast_to(np.arange(5), ranks.shape))
+    np.testing.assert_array_equal(generate(20, 30, 5, rng=1), ranks)
+
+def test_impartial_culture_is_uniform():
+    np.testing.assert_allclose(first_place_shares(impartial_culture(200, 500, 4, rng=2), 4), 0.25, atol=0.01)
+
+def test_impartial_anonymous_culture_makes_every_anonymous_profile_equally_likely():
+    # With two candidates and three voters, 0, 1, 2 or 3 voters rank candidate 0 first, each in a quarter of elections
+    ranks = impartial_anonymous_culture(40000, 3, 2, rng=3)
+    counts = np.bincount((ranks[..., 0] == 0).sum(axis=1), minlength=4) / 40000
+
+    np.testing.assert_allclose(counts, 0.25, atol=0.015)
+
+def test_urn_copies_rankings_more_as_alpha_grows():
+    def distinct(ranks):
+        return np.mean([len(np.unique(election, axis=0)) for election in ranks])
+
+    assert distinct(urn(50, 40, 5, alpha=10, rng=4)) < distinct(urn(50, 40, 5, alpha=0, rng=4)) / 3
+    np.testing.assert_allclose(first_place_shares(urn(200, 500, 4, alpha=0, rng=5), 4), 0.25, atol=0.01)
+
+def test_mallows_probabilities_decrease_with_the_distance_to_the_central_ranking():
+    ranks = mallows(1, 200000, 3, phi=0.5, central=[2, 0, 1], rng=6)[0]
+    rankings, counts = np.unique(ranks, axis=0, return_counts=True)
+
+    distances = {(2, 0, 1): 0, (0, 2, 1): 1, (2, 1, 0): 1, (0, 1, 2): 2, (1, 2, 0): 2, (1, 0, 2): 3}
+    expected = np.array([0.5 ** distances[tuple(ranking)] for ranking in rankings.tolist()])
+    np.testing.assert_allclose(counts / counts.sum(), expected / expected.sum(), atol=0.005)
+    assert (mallows(3, 10, 4, phi=0, central=[3, 1, 0, 2], rng=7) == [3, 1, 0, 2]).all()
+
+def test_plackett_luce_picks_first_places_in_proportion_to_the_weights():
+    shares = first_place_shares(plackett_luce(100, 1000, 3, weights=[6, 3, 1], rng=8), 3)
+
+    np.testing.assert_allclose(shares, [0.6, 0.3, 0.1], atol=0.01)
+
+def test_spatial_rankings_on_a_line_are_few():
+    ranks = spatial(10, 200, 4, dimensions=1, rng=9)
+
+    # Voters on a line cast at most one ranking per interval between midpoints of candidates
+    assert all(len(np.unique(election, axis=0)) <= 4 * 3 // 2 + 1 for election in ranks)
+    assert spatial(5, 10, 6, dimensions=3, rng=9).shape == (5, 10, 6)
+
+@pytest.mark.parametrize('batch_size', [None, 7])
+def test_simulate_matches_one_election_at_a_time(batch_size):
+    candidates = Candidates(['a', 'b', 'c', 'd'])
+    ranks = impartial_culture(30, 15, 4, rng=10)
+    elections = {method.__name__: method(candidates, []) for method in (Plurality, Borda, Copeland, Minimax, Schulze,
+                                                                      InstantRunoff)}
+
+    winners = simulate(elections, ranks, batch_size=batch_size)
+    for label, election in elections.items():
+        assert winners[label].shape == (30, 4)
+        for ballots, elected in zip(ranks, winners[label]):
+            expected = type(election)(candidates, Profile(candidates, ballots)).winners()
+            assert {candidates.names[c] for c in np.flatnonzero(elected)} == set(expected)
+
+def test_simulate_needs_a_batch_of_elections():
+    candidates = Candidates(['a', 'b'])
+
+    with pytest.raises(ValueError):
+        simulate({'plurality': Plurality(candidates, [])}, np.zeros((3, 2), dtype=np.int8))
+    assert simulate({'plurality': Plurality(candidates, [])}, np.zeros((0, 3, 2), dtype=np.int8))['plurality'].shape == (0, 2)
@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+from sct import (Agent, Borda, Candidates, InstantRunoff, LexicographicTieBreaker, LotteryTieBreaker, Plurality,
+                 PriorRoundTieBreaker, RandomTieBreaker, RankedPairs, Schulze, SingleTransferableVote)
+
+def ballots(*blocs):
+    """Builds agents from (votes, 'abc') pairs, one agent per bloc."""
+    return [Agent(f'bloc{i}', votes, list(choices)) for i, (votes, choices) in enumerate(blocs)]
+
+@pytest.fixture
+def candidates():
+    return Candidates(['a', 'b', 'c'])
+
+def test_lexicographic_keys_follow_the_order(candidates):
+    np.testing.assert_array_equal(LexicographicTieBreaker().keys(candidates), [0, 1, 2])
+    np.testing.assert_array_equal(LexicographicTieBreaker(['c']).keys(candidates, (2,)), [[1, 2, 0], [1, 2, 0]])
+
+def test_prior_round_keys_prefer_the_latest_difference(candidates):
+    history = [np.array([1, 3, 2]), np.array([4, 4, 3])]
+
+    np.testing.assert_array_equal(PriorRoundTieBreaker().keys(candidates, history=history), [1, 0, 2])
+    np.testing.assert_array_equal(PriorRoundTieBreaker(LexicographicTieBreaker(['b'])).keys(candidates), [1, 0, 2])
+
+def test_random_keys_are_reproducible(candidates):
+    keys = RandomTieBreaker(0).keys(candidates, (4,))
+
+    assert keys.shape == (4, 3)
+    np.testing.assert_array_equal(RandomTieBreaker(0).keys(candidates, (4,)), keys)
+
+def test_lottery_draws_a_single_order(candidates):
+    tiebreak = LotteryTieBreaker(1)
+    keys = tiebreak.keys(candidates)
+    order = tiebreak.order
+
+    np.testing.assert_array_equal(tiebreak.keys(candidates, (2,)), [keys, keys])
+    assert all(tiebreak.keys(candidates).tolist() == keys.tolist() for _ in range(10))
+    assert tiebreak.order == order
+    assert sorted(order) == ['a', 'b', 'c']
+
+def test_default_elimination_is_lexicographic(candidates):
+    agents = ballots((3, 'a'), (2, 'b'), (2, 'c'))
+    default = InstantRunoff(candidates, agents)
+
+    # b and c tie for the fewest votes: c, the last in the names, is eliminated
+    assert default.rounds() == [{'a': 3, 'b': 2, 'c': 2}, {'a': 3, 'b': 2}]
+    assert default.rounds() == InstantRunoff(candidates, agents, tiebreak=LexicographicTieBreaker()).rounds()
+    assert InstantRunoff(candidates, agents, tiebreak=['c', 'b']).rounds()[1] == {'a': 3, 'c': 2}
+
+def test_every_method_takes_the_winner_parameters(candidates):
+    agents = ballots((2, 'abc'), (2, 'bac'), (1, 'cab'), (1, 'cba'))
+
+    assert Borda(candidates, agents).winners() == {'a': 7, 'b': 7}
+    assert Borda(candidates, agents, allow_ties=False).winners() == {'a': 7}
+    assert Borda(candidates, agents, allow_ties=False, tiebreak=['b']).winners() == {'b': 7}
+    assert list(Schulze(candidates, agents, num_winners=3, allow_ties=False).winners()) == ['a', 'b', 'c']
+    assert Plurality(candidates, agents, False, 2, tiebreak=['c', 'b']).winners() == {'c': 2, 'b': 2}
+
+def test_ranked_pairs_winners_follow_the_parameters(candidates):
+    # a and b are tied pairwise and both beat c
+    agents = ballots((1, 'abc'), (1, 'bac'))
+
+    assert RankedPairs(candidates, agents).winners() == {'a': 1, 'b': 1}
+    assert RankedPairs(candidates, agents, allow_ties=False).winners() == {'a': 1}
+    assert RankedPairs(candidates, agents, tiebreak=['b'], allow_ties=False).winners() == {'b': 1}
+    assert RankedPairs(candidates, agents, num_winners=2, allow_ties=False).winners() == {'a': 1, 'b': 1}
+    assert RankedPairs(candidates, agents, num_winners=3).winners() == {'a': 1, 'b': 1, 'c': 0}
+    assert RankedPairs(candidates, agents, 'margins', 1, 1, False, ['b']).winners() == {'b': 1}
+
+def test_instant_runoff_winners_follow_the_parameters(candidates):
+    agents = ballots((3, 'a'), (2, 'ba'), (2, 'ca'))
+
+    assert InstantRunoff(candidates, agents).winners() == {'a': 5}
+    # b and c only tie in the round c is eliminated in
+    assert InstantRunoff(candidates, agents, num_winners=2).winners() == {'a': 5, 'b': 2, 'c': 2}
+    assert InstantRunoff(candidates, agents, num_winners=2, allow_ties=False).winners() == {'a': 5, 'b': 2}
+
+def test_final_round_ties_are_kept_when_allowed():
+    candidates = Candidates(['a', 'b'])
+    agents = ballots((2, 'a'), (2, 'b'))
+
+    assert InstantRunoff(candidates, agents).winners() == {'a': 2, 'b': 2}
+    assert InstantRunoff(candidates, agents, allow_ties=False).winners() == {'a': 2}
+    assert SingleTransferableVote(candidates, agents, allow_ties=False, tiebreak=['b']).winners() == {'b': 2}
+
+def test_only_ties_changing_the_winners_are_reported(candidates):
+    # a, b and c tie in the first round, and c loses however the ties are broken
+    agents = ballots((1, 'ab'), (1, 'ba'), (1, 'c'))
+
+    assert InstantRunoff(candidates, agents).winners() == {'a': 2, 'b': 1}
+    assert SingleTransferableVote(candidates, agents).winners() == {'a': 2, 'b': 1}
+
+    # d and e tie without votes, and eliminating either first elects the same candidates
+    five = Candidates(['a', 'b', 'c', 'd', 'e'])
+    agents = ballots((4, 'a'), (3, 'b'), (2, 'ca'))
+    assert InstantRunoff(five, agents).winners() == {'a': 6}
+    assert SingleTransferableVote(five, agents, num_winners=2).winners() == {'a': 4, 'b': 3}
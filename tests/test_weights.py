@@ -0,0 +1,38 @@
+import pytest
+from sct import (Agent, Borda, Candidates, Copeland, InstantRunoff, Kemeny, Minimax, Plurality, Profile,
+                 RankedPairs, Schulze, SingleTransferableVote)
+
+METHODS = [Plurality, Borda, Copeland, Minimax, Schulze, RankedPairs, Kemeny, InstantRunoff, SingleTransferableVote]
+
+@pytest.fixture
+def candidates():
+    return Candidates(['a', 'b', 'c', 'd'])
+
+@pytest.fixture
+def blocs():
+    return [(5, ['a', 'b', 'c', 'd']), (4, ['b', 'c', 'd', 'a']), (3, ['c', 'a', 'd', 'b']), (2, ['d', 'c', 'b', 'a'])]
+
+@pytest.mark.parametrize('method', METHODS)
+def test_a_weighted_agent_counts_like_repeated_agents(candidates, blocs, method):
+    weighted = [Agent(f'bloc{i}', votes, choices) for i, (votes, choices) in enumerate(blocs)]
+    repeated = [Agent(f'bloc{i}', 1, choices) for i, (votes, choices) in enumerate(blocs) for _ in range(votes)]
+
+    assert method(candidates, weighted).calculate_results() == method(candidates, repeated).calculate_results()
+    assert method(candidates, weighted).winners() == method(candidates, repeated).winners()
+
+@pytest.mark.parametrize('method', [Plurality, Borda, Copeland, Minimax])
+def test_float_weights_scale_the_scores(candidates, blocs, method):
+    whole = [Agent(f'bloc{i}', votes, choices) for i, (votes, choices) in enumerate(blocs)]
+    halves = [Agent(f'bloc{i}', votes / 2, choices) for i, (votes, choices) in enumerate(blocs)]
+
+    expected = method(candidates, whole).calculate_results()
+    if method is not Copeland: # Copeland counts pairwise victories, not votes
+        expected = {name: score / 2 for name, score in expected.items()}
+    assert method(candidates, halves).calculate_results() == pytest.approx(expected)
+
+def test_a_bloc_is_a_single_row(candidates):
+    profile = Profile.from_agents(candidates, [Agent('bloc', 2500, ['a', 'b'])])
+
+    assert profile.num_ballots == 1
+    assert Plurality(candidates, profile).calculate_results()['a'] == 2500
+    assert Borda(candidates, profile).pairwise[0, 1] == 2500